@@ -0,0 +1,9 @@
+"""Pytest configuration shared by the root-level test modules and tests/."""
+
+import sys
+from pathlib import Path
+
+# Make the src-layout package importable once, before any test module loads
+SRC_DIR = str(Path(__file__).parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -2,7 +2,23 @@
 
 """Markdown to PDF conversion engine."""
 
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __author__, __description__, __license__, __title__, __version__
-from .core import MarkdownProcessor, MarkdownToPDFConverter, PDFGenerator
+
+if TYPE_CHECKING:
+    from .core import MarkdownProcessor, MarkdownToPDFConverter, PDFGenerator
 
 __all__ = ["MarkdownToPDFConverter", "MarkdownProcessor", "PDFGenerator", "__version__"]
+
+# Core classes pull in Markdown, Jinja2 and WeasyPrint, so they are imported
+# on first access to keep lightweight entry points (CLI help, validation) fast
+_LAZY_CORE_ATTRIBUTES = {"MarkdownToPDFConverter", "MarkdownProcessor", "PDFGenerator"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CORE_ATTRIBUTES:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
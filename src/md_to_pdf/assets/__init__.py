@@ -12,10 +12,10 @@ from .exceptions import (
     AssetResolutionError,
     AssetValidationError,
 )
-from .fonts import FontInfo, FontManager
+from .fonts import FontInfo, FontManager, clear_font_validation_cache
 from .images import ImageInfo, ImageResolver
 from .manager import AssetInfo, AssetManager
-from .resolvers import AssetResolver
+from .resolvers import AssetResolver, scan_assets
 
 __all__ = [
     "AssetManager",
@@ -30,4 +30,6 @@ __all__ = [
     "AssetResolutionError",
     "AssetCopyError",
     "AssetValidationError",
+    "scan_assets",
+    "clear_font_validation_cache",
 ]
@@ -5,11 +5,14 @@ This module provides specialized functionality for handling font assets
 including validation, CSS generation, and font loading.
 """
 
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 from .exceptions import AssetValidationError
-from .resolvers import AssetResolver
+from .resolvers import FONT_EXTENSIONS, AssetResolver, file_uri, scan_assets
 
 # Import theme config if available
 try:
@@ -19,6 +22,17 @@ try:
 except ImportError:
     CONFIG_AVAILABLE = False
 
+# CSS @font-face format for each known (lowercase) file extension
+FONT_FORMATS_BY_SUFFIX = {
+    ".ttf": "truetype",
+    ".otf": "opentype",
+    ".woff": "woff",
+    ".woff2": "woff2",
+    ".eot": "embedded-opentype",
+}
+WEB_FONT_FORMATS = frozenset(["woff", "woff2"])
+DESKTOP_FONT_FORMATS = frozenset(["truetype", "opentype"])
+
 
 class FontInfo:
     """Information about a font asset."""
@@ -36,17 +50,7 @@ class FontInfo:
 
     def _detect_format(self) -> str:
         """Detect font format from file extension."""
-        extension = self.path.suffix.lower()
-
-        format_map = {
-            ".ttf": "truetype",
-            ".otf": "opentype",
-            ".woff": "woff",
-            ".woff2": "woff2",
-            ".eot": "embedded-opentype",
-        }
-
-        return format_map.get(extension, "unknown")
+        return FONT_FORMATS_BY_SUFFIX.get(self.path.suffix.lower(), "unknown")
 
     def _extract_family_name(self) -> str:
         """Extract font family name from filename.
@@ -83,12 +87,126 @@ class FontInfo:
     @property
     def is_web_font(self) -> bool:
         """Check if font is a web font format."""
-        return self.format in ["woff", "woff2"]
+        return self.format in WEB_FONT_FORMATS
 
     @property
     def is_desktop_font(self) -> bool:
         """Check if font is a desktop font format."""
-        return self.format in ["truetype", "opentype"]
+        return self.format in DESKTOP_FONT_FORMATS
+
+
+@lru_cache(maxsize=512)
+def _check_font_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    is_file: bool,
+    supported_formats: FrozenSet[str],
+) -> Union[FontInfo, str]:
+    """Validate a font file given its stat details.
+
+    Keyed on the file's modification time and size, so an edited file is
+    checked again. Failures are cached too, as their error message.
+
+    Returns:
+        FontInfo for a valid font, or the validation error message
+    """
+    font_path = Path(path)
+
+    # Check if it's a file
+    if not is_file:
+        return "Font path is not a file"
+
+    # Check format
+    if font_path.suffix.lower() not in supported_formats:
+        return f"File is not a supported font format. Extension: {font_path.suffix}"
+
+    # Check file size (basic validation)
+    if size == 0:
+        return "Font file is empty"
+
+    return FontInfo(font_path)
+
+
+# Common system font fallbacks
+SANS_SERIF_FALLBACKS = ("Arial", "Helvetica", "sans-serif")
+SERIF_FALLBACKS = ("Times New Roman", "Times", "serif")
+MONOSPACE_FALLBACKS = ("Courier New", "Courier", "monospace")
+
+GENERIC_FONT_FAMILIES = frozenset(
+    {"serif", "sans-serif", "monospace", "cursive", "fantasy"}
+)
+WEB_SAFE_FONTS = frozenset(
+    {
+        "Arial",
+        "Helvetica",
+        "Times New Roman",
+        "Times",
+        "Courier New",
+        "Courier",
+        "Verdana",
+        "Georgia",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _font_fallbacks(primary_fonts: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Build the font stack with fallbacks, memoized per primary stack.
+
+    Styled elements repeat the same few stacks, so each is analysed once.
+    """
+    # Determine font category from primary fonts
+    has_serif = any("serif" in font.lower() for font in primary_fonts)
+    has_monospace = any(
+        any(mono in font.lower() for mono in ["mono", "courier", "consolas", "code"])
+        for font in primary_fonts
+    )
+
+    # Add appropriate fallbacks
+    if has_monospace:
+        fallbacks = MONOSPACE_FALLBACKS
+    elif has_serif:
+        fallbacks = SERIF_FALLBACKS
+    else:
+        fallbacks = SANS_SERIF_FALLBACKS
+
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(primary_fonts + fallbacks))
+
+
+@lru_cache(maxsize=256)
+def _font_stack_report(
+    font_stack: Tuple[str, ...]
+) -> Tuple[bool, bool, bool, Tuple[str, ...]]:
+    """Check a font stack, memoized per stack.
+
+    Returns:
+        Tuple of (has_fallback, has_web_safe, has_generic, warnings)
+    """
+    has_generic = any(font in GENERIC_FONT_FAMILIES for font in font_stack)
+    has_web_safe = any(font in WEB_SAFE_FONTS for font in font_stack)
+    has_fallback = len(font_stack) > 1
+
+    # Generate warnings
+    warnings = []
+    if not has_generic:
+        warnings.append("Font stack should end with a generic family")
+
+    if not has_fallback:
+        warnings.append("Font stack should include fallback fonts")
+
+    if len(font_stack) == 1 and font_stack[0] not in WEB_SAFE_FONTS:
+        warnings.append(
+            "Single custom font without fallbacks may not display correctly"
+        )
+
+    return has_fallback, has_web_safe, has_generic, tuple(warnings)
+
+
+def clear_font_validation_cache() -> None:
+    """Forget the results of FontManager.validate_font_file."""
+    _check_font_file.cache_clear()
 
 
 class FontManager:
@@ -101,7 +219,7 @@ class FontManager:
             asset_resolver: Base asset resolver to use
         """
         self.asset_resolver = asset_resolver or AssetResolver()
-        self.supported_formats = {".ttf", ".otf", ".woff", ".woff2", ".eot"}
+        self.supported_formats = set(FONT_EXTENSIONS)
         self.font_cache: Dict[str, FontInfo] = {}
 
     def validate_font_file(self, font_path: Union[str, Path]) -> FontInfo:
@@ -116,28 +234,24 @@ class FontManager:
         Raises:
             AssetValidationError: If font is not valid
         """
-        font_path = Path(font_path)
-
-        # Check if file exists
-        if not font_path.exists():
-            raise AssetValidationError(str(font_path), "Font file does not exist")
-
-        # Check if it's a file
-        if not font_path.is_file():
-            raise AssetValidationError(str(font_path), "Font path is not a file")
-
-        # Check format
-        if not self._is_font_file(font_path):
-            raise AssetValidationError(
-                str(font_path),
-                f"File is not a supported font format. Extension: {font_path.suffix}",
-            )
-
-        # Check file size (basic validation)
-        if font_path.stat().st_size == 0:
-            raise AssetValidationError(str(font_path), "Font file is empty")
-
-        return FontInfo(font_path)
+        path = os.fspath(font_path)
+
+        # Check if file exists; the stat also keys the validation cache
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            raise AssetValidationError(path, "Font file does not exist")
+
+        result = _check_font_file(
+            path,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            stat.S_ISREG(file_stat.st_mode),
+            frozenset(self.supported_formats),
+        )
+        if isinstance(result, str):
+            raise AssetValidationError(path, result)
+        return result
 
     def _is_font_file(self, file_path: Path) -> bool:
         """Check if file is a supported font format.
@@ -251,7 +365,7 @@ class FontManager:
             @font-face CSS rule string
         """
         # Convert path to URI
-        font_uri = font_path.as_uri()
+        font_uri = file_uri(font_path)
 
         # Detect format
         font_info = FontInfo(font_path)
@@ -272,42 +386,7 @@ class FontManager:
         Returns:
             Complete font stack with fallbacks
         """
-        # Common system font fallbacks
-        sans_serif_fallbacks = ["Arial", "Helvetica", "sans-serif"]
-
-        serif_fallbacks = ["Times New Roman", "Times", "serif"]
-
-        monospace_fallbacks = ["Courier New", "Courier", "monospace"]
-
-        # Analyze primary fonts to determine appropriate fallbacks
-        font_stack = list(primary_fonts)
-
-        # Determine font category from primary fonts
-        has_serif = any("serif" in font.lower() for font in primary_fonts)
-        has_monospace = any(
-            any(
-                mono in font.lower() for mono in ["mono", "courier", "consolas", "code"]
-            )
-            for font in primary_fonts
-        )
-
-        # Add appropriate fallbacks
-        if has_monospace:
-            font_stack.extend(monospace_fallbacks)
-        elif has_serif:
-            font_stack.extend(serif_fallbacks)
-        else:
-            font_stack.extend(sans_serif_fallbacks)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_fonts = []
-        for font in font_stack:
-            if font not in seen:
-                seen.add(font)
-                unique_fonts.append(font)
-
-        return unique_fonts
+        return list(_font_fallbacks(tuple(primary_fonts)))
 
     def scan_for_fonts(
         self, directory: Union[str, Path], recursive: bool = True
@@ -321,18 +400,8 @@ class FontManager:
         Returns:
             List of found font file paths
         """
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
-            return []
-
-        fonts = []
-        pattern = "**/*" if recursive else "*"
-
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and self._is_font_file(file_path):
-                fonts.append(file_path)
-
-        return fonts
+        buckets = dict.fromkeys(self.supported_formats, "fonts")
+        return scan_assets(directory, recursive, buckets)["fonts"]
 
     def validate_font_stack(
         self, font_stack: List[str]
@@ -345,43 +414,12 @@ class FontManager:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "has_fallback": False,
-            "has_web_safe": False,
-            "has_generic": False,
-            "warnings": [],
-        }
-
-        # Check for generic fallbacks
-        generic_families = {"serif", "sans-serif", "monospace", "cursive", "fantasy"}
-        results["has_generic"] = any(font in generic_families for font in font_stack)
-
-        # Check for web-safe fonts
-        web_safe_fonts = {
-            "Arial",
-            "Helvetica",
-            "Times New Roman",
-            "Times",
-            "Courier New",
-            "Courier",
-            "Verdana",
-            "Georgia",
+        has_fallback, has_web_safe, has_generic, warnings = _font_stack_report(
+            tuple(font_stack)
+        )
+        return {
+            "has_fallback": has_fallback,
+            "has_web_safe": has_web_safe,
+            "has_generic": has_generic,
+            "warnings": list(warnings),
         }
-        results["has_web_safe"] = any(font in web_safe_fonts for font in font_stack)
-
-        # Check for fallbacks
-        results["has_fallback"] = len(font_stack) > 1
-
-        # Generate warnings
-        if not results["has_generic"]:
-            results["warnings"].append("Font stack should end with a generic family")
-
-        if not results["has_fallback"]:
-            results["warnings"].append("Font stack should include fallback fonts")
-
-        if len(font_stack) == 1 and font_stack[0] not in web_safe_fonts:
-            results["warnings"].append(
-                "Single custom font without fallbacks may not display correctly"
-            )
-
-        return results
@@ -10,7 +10,48 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 from .exceptions import AssetValidationError
-from .resolvers import AssetResolver
+from .resolvers import IMAGE_EXTENSIONS, AssetResolver, file_uri, scan_assets
+
+# src attribute of an <img> tag, with a double-quoted, single-quoted or unquoted
+# value. The tag body is matched lazily up to the first whitespace-led "src" and
+# the value classes can't overlap, so malformed tags fail fast instead of
+# backtracking.
+IMG_SRC_PATTERN = re.compile(
+    r"""<img(?=\s)[^>]*?\ssrc\s*=\s*"""
+    r"""(?:"(?P<double>[^"]*)"|'(?P<single>[^']*)'|(?P<bare>[^\s>]+))""",
+    re.IGNORECASE,
+)
+
+# Markdown image syntax: ![alt](path), capturing the path and optional title
+MARKDOWN_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\(([^)]+)\)")
+
+# src values that already point somewhere and are never rewritten
+EXTERNAL_SRC_PREFIXES = ("http://", "https://", "data:", "file://", "#")
+
+# Image format for each known (lowercase) file extension
+IMAGE_FORMATS_BY_SUFFIX = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".gif": "GIF",
+    ".bmp": "BMP",
+    ".tiff": "TIFF",
+    ".tif": "TIFF",
+    ".webp": "WebP",
+    ".svg": "SVG",
+    ".ico": "ICO",
+}
+RASTER_IMAGE_FORMATS = frozenset(["PNG", "JPEG", "GIF", "BMP", "TIFF", "WebP", "ICO"])
+WEB_IMAGE_FORMATS = frozenset(["PNG", "JPEG", "GIF", "SVG", "WebP"])
+
+
+def _src_value_group(match: "re.Match[str]") -> str:
+    """Name of the IMG_SRC_PATTERN group holding the src value of a match."""
+    if match.group("double") is not None:
+        return "double"
+    if match.group("single") is not None:
+        return "single"
+    return "bare"
 
 
 class ImageInfo:
@@ -29,42 +70,30 @@ class ImageInfo:
 
     def _detect_format(self) -> str:
         """Detect image format from file extension."""
-        extension = self.path.suffix.lower()
-
-        format_map = {
-            ".png": "PNG",
-            ".jpg": "JPEG",
-            ".jpeg": "JPEG",
-            ".gif": "GIF",
-            ".bmp": "BMP",
-            ".tiff": "TIFF",
-            ".tif": "TIFF",
-            ".webp": "WebP",
-            ".svg": "SVG",
-            ".ico": "ICO",
-        }
-
-        return format_map.get(extension, "Unknown")
+        return IMAGE_FORMATS_BY_SUFFIX.get(self.path.suffix.lower(), "Unknown")
 
     @property
     def is_vector(self) -> bool:
         """Check if image is vector format."""
-        return self.format in ["SVG"]
+        return self.format == "SVG"
 
     @property
     def is_raster(self) -> bool:
         """Check if image is raster format."""
-        return self.format in ["PNG", "JPEG", "GIF", "BMP", "TIFF", "WebP", "ICO"]
+        return self.format in RASTER_IMAGE_FORMATS
 
     @property
     def is_web_compatible(self) -> bool:
         """Check if image format is web-compatible."""
-        return self.format in ["PNG", "JPEG", "GIF", "SVG", "WebP"]
+        return self.format in WEB_IMAGE_FORMATS
 
 
 class ImageResolver:
     """Specialized image asset resolution and processing."""
 
+    img_src_pattern = IMG_SRC_PATTERN
+    markdown_image_pattern = MARKDOWN_IMAGE_PATTERN
+
     def __init__(self, asset_resolver: Optional[AssetResolver] = None):
         """Initialize image resolver.
 
@@ -72,18 +101,7 @@ class ImageResolver:
             asset_resolver: Base asset resolver to use
         """
         self.asset_resolver = asset_resolver or AssetResolver()
-        self.supported_formats = {
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".bmp",
-            ".tiff",
-            ".tif",
-            ".webp",
-            ".svg",
-            ".ico",
-        }
+        self.supported_formats = set(IMAGE_EXTENSIONS)
 
     def resolve_image_path(
         self, image_path: str, context_path: Optional[Union[str, Path]] = None
@@ -136,17 +154,14 @@ class ImageResolver:
         """
         image_paths = []
 
-        # Pattern to match img tags and extract src attribute
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-
-        for match in re.finditer(img_pattern, html_content, re.IGNORECASE):
-            src = match.group(1).strip()
+        for match in self.img_src_pattern.finditer(html_content):
+            src = match.group(_src_value_group(match)).strip()
 
             # Skip data URLs and external URLs
-            if not src.startswith(("http://", "https://", "data:", "//")):
+            if src and not src.startswith(("http://", "https://", "data:", "//")):
                 image_paths.append(src)
 
-        return list(set(image_paths))  # Remove duplicates
+        return list(dict.fromkeys(image_paths))  # Remove duplicates
 
     def extract_images_from_markdown(self, markdown_content: str) -> List[str]:
         """Extract image paths from Markdown content.
@@ -159,10 +174,7 @@ class ImageResolver:
         """
         image_paths = []
 
-        # Pattern to match Markdown image syntax: ![alt](path)
-        md_img_pattern = r"!\[[^\]]*\]\(([^)]+)\)"
-
-        for match in re.finditer(md_img_pattern, markdown_content):
+        for match in self.markdown_image_pattern.finditer(markdown_content):
             src = match.group(1).strip()
 
             # Skip URLs and data URLs
@@ -174,7 +186,7 @@ class ImageResolver:
         # Also check for reference-style images: ![alt][ref]
         # This would require tracking reference definitions, simplified for now
 
-        return list(set(image_paths))  # Remove duplicates
+        return list(dict.fromkeys(image_paths))  # Remove duplicates
 
     def update_html_image_refs(
         self, html_content: str, image_map: Dict[str, str]
@@ -188,23 +200,32 @@ class ImageResolver:
         Returns:
             Updated HTML content with new image paths
         """
-        updated_html = html_content
+        if not image_map:
+            return html_content
 
-        for original_path, new_path in image_map.items():
-            # Convert path to file URI for HTML
-            file_uri = Path(new_path).as_uri()
+        def replace_src(match: "re.Match[str]") -> str:
+            group = _src_value_group(match)
+            src = match.group(group)
 
-            # Update img src attributes with various quote styles
-            patterns = [
-                (f'src="{original_path}"', f'src="{file_uri}"'),
-                (f"src='{original_path}'", f"src='{file_uri}'"),
-                (f"src={original_path}", f'src="{file_uri}"'),  # No quotes
-            ]
+            # External, data and already-resolved URLs are never in the map
+            if src.startswith(EXTERNAL_SRC_PREFIXES):
+                return match.group(0)
 
-            for old_pattern, new_pattern in patterns:
-                updated_html = updated_html.replace(old_pattern, new_pattern)
+            new_path = image_map.get(src)
+            if new_path is None:
+                return match.group(0)
 
-        return updated_html
+            # Convert path to file URI for HTML, quoting unquoted values
+            new_src = file_uri(new_path)
+            if group == "bare":
+                new_src = f'"{new_src}"'
+
+            start, end = match.span(group)
+            tag = match.group(0)
+            offset = match.start()
+            return tag[: start - offset] + new_src + tag[end - offset :]
+
+        return self.img_src_pattern.sub(replace_src, html_content)
 
     def validate_image_compatibility(self, image_info: ImageInfo) -> List[str]:
         """Validate image compatibility for PDF generation.
@@ -289,15 +310,5 @@ class ImageResolver:
         Returns:
             List of found image file paths
         """
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
-            return []
-
-        images = []
-        pattern = "**/*" if recursive else "*"
-
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and self._is_image_file(file_path):
-                images.append(file_path)
-
-        return images
+        buckets = dict.fromkeys(self.supported_formats, "images")
+        return scan_assets(directory, recursive, buckets)["images"]
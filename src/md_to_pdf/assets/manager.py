@@ -5,15 +5,46 @@ This module provides the main AssetManager class that coordinates all asset
 handling operations including resolution, copying, and caching.
 """
 
+import hashlib
+import os
 import shutil
 import tempfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from .exceptions import AssetCopyError
-from .resolvers import AssetResolver
+from .exceptions import AssetCopyError, AssetNotFoundError
+from .resolvers import AssetResolver, file_uri
+
+# Upper bound on threads used to copy assets to the temp directory
+MAX_COPY_WORKERS = 32
+
+# Chunk size for hashing files on Pythons without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's contents.
+
+    Uses hashlib.file_digest (Python 3.11+), which hashes through OpenSSL
+    without per-chunk Python overhead, and falls back to chunked reads.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
 
 @dataclass
@@ -26,6 +57,10 @@ class AssetInfo:
     size: int
     last_modified: datetime
     context_path: Optional[Path] = None
+    # (st_mtime_ns, st_size) the digest was computed for, and the digest
+    _content_hash: Optional[Tuple[Tuple[int, int], str]] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def exists(self) -> bool:
@@ -44,12 +79,26 @@ class AssetInfo:
         except (OSError, PermissionError):
             return False
 
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 digest of the asset contents.
+
+        The digest is reused only while the file's modification time and size
+        are unchanged, so a file rewritten in place is hashed again.
+        """
+        stat = self.resolved_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._content_hash is None or self._content_hash[0] != signature:
+            self._content_hash = (signature, file_sha256(self.resolved_path))
+        return self._content_hash[1]
+
     def refresh_info(self) -> None:
         """Refresh asset information from file system."""
         if self.resolved_path.exists():
             stat = self.resolved_path.stat()
             self.size = stat.st_size
             self.last_modified = datetime.fromtimestamp(stat.st_mtime)
+            self._content_hash = None
 
 
 class AssetManager:
@@ -63,6 +112,10 @@ class AssetManager:
         """
         self.resolver = AssetResolver(base_paths)
         self.asset_cache: Dict[str, AssetInfo] = {}
+        # Failed lookups, with the base paths they were searched under and the
+        # concrete paths tried, so missing assets don't re-walk the asset
+        # directories
+        self._missing_assets: Dict[str, Tuple[Tuple[Path, ...], List[str]]] = {}
         self._temp_dirs: List[Path] = []
 
     def resolve_asset(
@@ -97,8 +150,25 @@ class AssetManager:
                 # Remove invalid cached entry
                 del self.asset_cache[cache_key]
 
+        # Check for a cached failure under the same base paths. The concrete
+        # paths tried are re-checked, so a file created there since the miss
+        # is picked up without re-walking the asset directories
+        base_paths = tuple(self.resolver.base_paths)
+        if use_cache and cache_key in self._missing_assets:
+            missing_base_paths, searched_paths = self._missing_assets[cache_key]
+            if missing_base_paths == base_paths and not any(
+                os.path.isfile(path) for path in searched_paths
+            ):
+                raise AssetNotFoundError(asset_path, searched_paths)
+            del self._missing_assets[cache_key]
+
         # Resolve asset path
-        resolved_path = self.resolver.resolve_asset_path(asset_path, context_path)
+        try:
+            resolved_path = self.resolver.resolve_asset_path(asset_path, context_path)
+        except AssetNotFoundError as e:
+            if use_cache:
+                self._missing_assets[cache_key] = (base_paths, e.searched_paths)
+            raise
 
         # Get asset information
         asset_type = self.resolver.get_asset_type(resolved_path)
@@ -127,6 +197,10 @@ class AssetManager:
     ) -> Dict[str, str]:
         """Copy assets to a temporary directory for PDF generation.
 
+        Assets with identical contents are only copied once; later references
+        map to the first copy. Contents are only hashed when two assets have
+        the same size.
+
         Args:
             asset_paths: List of asset paths to copy
             context_path: Context path for asset resolution
@@ -142,7 +216,11 @@ class AssetManager:
             temp_dir = Path(tempfile.mkdtemp(prefix="md_to_pdf_assets_"))
             self._temp_dirs.append(temp_dir)
 
-        asset_map = {}
+        # Destination of each asset path, in order
+        planned: List[Tuple[str, Path]] = []
+        # Pending copies keyed by destination, so a later asset with the same
+        # destination name still wins as it did with serial copying
+        pending: Dict[Path, Tuple[str, AssetInfo]] = {}
 
         for asset_path in asset_paths:
             try:
@@ -165,18 +243,92 @@ class AssetManager:
                 # Ensure destination directory exists
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Copy the file
-                shutil.copy2(asset_info.resolved_path, dest_path)
-
-                # Map original path to temp path
-                asset_map[asset_path] = str(dest_path)
+                pending[dest_path] = (asset_path, asset_info)
+                planned.append((asset_path, dest_path))
 
             except Exception as e:
                 raise AssetCopyError(
                     asset_path, str(temp_dir / asset_path), str(e)
                 ) from e
 
-        return asset_map
+        # Only the asset that finally writes a destination is a candidate for
+        # deduplication, so a reused copy is never overwritten afterwards
+        copies: List[Tuple[str, Path, Path]] = []
+        # Destinations that are not written, mapped to an identical copy
+        redirects: Dict[Path, Path] = {}
+        # Assets being copied, grouped by current size for duplicate detection
+        copied_by_size: Dict[int, List[Tuple[AssetInfo, Path]]] = {}
+
+        for dest_path, (asset_path, asset_info) in pending.items():
+            try:
+                size = asset_info.resolved_path.stat().st_size
+                same_size = copied_by_size.setdefault(size, [])
+                duplicate_path = self._find_duplicate(asset_info, same_size)
+            except Exception as e:
+                raise AssetCopyError(asset_path, str(dest_path), str(e)) from e
+
+            if duplicate_path is not None:
+                redirects[dest_path] = duplicate_path
+                continue
+
+            same_size.append((asset_info, dest_path))
+            copies.append((asset_path, asset_info.resolved_path, dest_path))
+
+        # Copies are I/O bound and release the GIL, so run them in threads
+        if len(copies) > 1:
+            workers = min(MAX_COPY_WORKERS, len(copies))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda copy: self._copy_asset(*copy), copies))
+        else:
+            for copy in copies:
+                self._copy_asset(*copy)
+
+        # Map original paths to temp paths
+        return {
+            asset_path: str(redirects.get(dest_path, dest_path))
+            for asset_path, dest_path in planned
+        }
+
+    def _copy_asset(self, asset_path: str, source: Path, dest_path: Path) -> None:
+        """Copy a single resolved asset to its temporary location.
+
+        Args:
+            asset_path: Original asset path, used in error messages
+            source: Resolved path of the asset
+            dest_path: Destination path in the temporary directory
+
+        Raises:
+            AssetCopyError: If the copy fails
+        """
+        try:
+            # Copy the file contents only: copyfile uses the platform's
+            # zero-copy fast path (sendfile/fcopyfile/CopyFile2) and skips
+            # the metadata syscalls copy2 makes, which a temp copy doesn't need
+            shutil.copyfile(source, dest_path)
+        except Exception as e:
+            raise AssetCopyError(asset_path, str(dest_path), str(e)) from e
+
+    def _find_duplicate(
+        self, asset_info: AssetInfo, candidates: List[Tuple[AssetInfo, Path]]
+    ) -> Optional[Path]:
+        """Find an already copied asset with the same contents.
+
+        Args:
+            asset_info: Asset about to be copied
+            candidates: Assets being copied with the same size and their temp paths
+
+        Returns:
+            Temp path of the identical copy, or None if there is none
+        """
+        for copied_info, dest_path in candidates:
+            if copied_info.resolved_path == asset_info.resolved_path:
+                return dest_path
+
+        for copied_info, dest_path in candidates:
+            if copied_info.content_hash == asset_info.content_hash:
+                return dest_path
+
+        return None
 
     def cleanup_temp_assets(self, temp_dir: Optional[Path] = None) -> None:
         """Clean up temporary asset directories.
@@ -257,22 +409,22 @@ class AssetManager:
 
         for original_path, new_path in asset_map.items():
             # Convert to file URI for HTML
-            file_uri = Path(new_path).as_uri()
+            new_uri = file_uri(new_path)
 
             # Replace in img src attributes
             updated_html = updated_html.replace(
-                f'src="{original_path}"', f'src="{file_uri}"'
+                f'src="{original_path}"', f'src="{new_uri}"'
             )
             updated_html = updated_html.replace(
-                f"src='{original_path}'", f"src='{file_uri}'"
+                f"src='{original_path}'", f"src='{new_uri}'"
             )
 
             # Replace in link href attributes
             updated_html = updated_html.replace(
-                f'href="{original_path}"', f'href="{file_uri}"'
+                f'href="{original_path}"', f'href="{new_uri}"'
             )
             updated_html = updated_html.replace(
-                f"href='{original_path}'", f"href='{file_uri}'"
+                f"href='{original_path}'", f"href='{new_uri}'"
             )
 
         return updated_html
@@ -286,8 +438,9 @@ class AssetManager:
         self.resolver.add_base_path(base_path)
 
     def clear_cache(self) -> None:
-        """Clear the asset cache."""
+        """Clear the asset cache, including cached lookup failures."""
         self.asset_cache.clear()
+        self._missing_assets.clear()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get asset cache statistics.
@@ -302,6 +455,7 @@ class AssetManager:
             "total_cached": len(self.asset_cache),
             "valid_assets": valid_assets,
             "invalid_assets": invalid_assets,
+            "missing_assets": len(self._missing_assets),
             "temp_directories": len(self._temp_dirs),
         }
 
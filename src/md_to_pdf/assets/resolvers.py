@@ -6,11 +6,120 @@ and context scenarios (Markdown files, theme configs, templates, etc.).
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from .exceptions import AssetNotFoundError, AssetResolutionError
 
+# Asset type for each known (lowercase) file extension
+ASSET_TYPES_BY_SUFFIX = {
+    # Image types
+    **dict.fromkeys(
+        [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".webp", ".svg"], "image"
+    ),
+    # Font types
+    **dict.fromkeys([".ttf", ".otf", ".woff", ".woff2", ".eot"], "font"),
+    # Stylesheet types
+    **dict.fromkeys([".css", ".scss", ".sass", ".less"], "stylesheet"),
+    # Template types
+    **dict.fromkeys([".html", ".htm", ".jinja2", ".j2"], "template"),
+}
+
+# Extensions handled by ImageResolver and FontManager
+IMAGE_EXTENSIONS = frozenset(
+    [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif", ".webp", ".svg", ".ico"]
+)
+FONT_EXTENSIONS = frozenset([".ttf", ".otf", ".woff", ".woff2", ".eot"])
+
+# scan_assets() result bucket for each (lowercase) file extension
+ASSET_BUCKETS_BY_SUFFIX = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, "images"),
+    **dict.fromkeys(FONT_EXTENSIONS, "fonts"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _lookup_asset_type(asset_path: Union[str, Path]) -> str:
+    """Map an asset path to its type, memoized since documents repeat paths."""
+    return ASSET_TYPES_BY_SUFFIX.get(Path(asset_path).suffix.lower(), "unknown")
+
+
+@lru_cache(maxsize=1024)
+def file_uri(path: Union[str, Path]) -> str:
+    """Convert an absolute path to a file:// URI, memoized per path.
+
+    Path.as_uri() percent-quotes the whole path on every call, and documents
+    reference the same images and fonts repeatedly.
+
+    Args:
+        path: Absolute file path
+
+    Returns:
+        File URI for the path
+    """
+    return Path(path).as_uri()
+
+
+def iter_files(directory: Union[str, Path], recursive: bool = True) -> Iterator[str]:
+    """Yield the paths of regular files under a directory.
+
+    Walks the tree with os.scandir, which reports each entry's type from the
+    directory listing, instead of stat'ing every path like Path.glob. Symlinked
+    directories are not followed.
+
+    Args:
+        directory: Directory to scan
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Path string of each file found
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def scan_assets(
+    directory: Union[str, Path],
+    recursive: bool = True,
+    buckets: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[Path]]:
+    """Collect the image and font files under a directory in a single walk.
+
+    Args:
+        directory: Directory to scan
+        recursive: Whether to scan recursively
+        buckets: Mapping of lowercase extension to result bucket
+            (defaults to ASSET_BUCKETS_BY_SUFFIX)
+
+    Returns:
+        Dictionary mapping each bucket (e.g. "images", "fonts") to the paths
+        found for it
+    """
+    if buckets is None:
+        buckets = ASSET_BUCKETS_BY_SUFFIX
+
+    found: Dict[str, List[Path]] = {bucket: [] for bucket in buckets.values()}
+    if not os.path.isdir(directory):
+        return found
+
+    for file_path in iter_files(directory, recursive):
+        bucket = buckets.get(os.path.splitext(file_path)[1].lower())
+        if bucket is not None:
+            found[bucket].append(Path(file_path))
+
+    return found
+
 
 class AssetResolver:
     """Handles asset path resolution with multiple fallback strategies."""
@@ -143,36 +252,7 @@ class AssetResolver:
         Returns:
             Asset type string (image, font, css, etc.)
         """
-        path = Path(asset_path)
-        extension = path.suffix.lower()
-
-        # Image types
-        if extension in [
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".bmp",
-            ".tiff",
-            ".webp",
-            ".svg",
-        ]:
-            return "image"
-
-        # Font types
-        if extension in [".ttf", ".otf", ".woff", ".woff2", ".eot"]:
-            return "font"
-
-        # Stylesheet types
-        if extension in [".css", ".scss", ".sass", ".less"]:
-            return "stylesheet"
-
-        # Template types
-        if extension in [".html", ".htm", ".jinja2", ".j2"]:
-            return "template"
-
-        # Default
-        return "unknown"
+        return _lookup_asset_type(asset_path)
 
     def add_base_path(self, base_path: Union[str, Path]) -> None:
         """Add a base path for asset resolution.
@@ -214,21 +294,14 @@ class AssetResolver:
         Returns:
             List of found asset paths
         """
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
+        if not os.path.isdir(directory):
             return []
 
         assets = []
 
-        if recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
-
-        for item in directory.glob(pattern):
-            if item.is_file():
-                asset_type = self.get_asset_type(item)
-                if asset_types is None or asset_type in asset_types:
-                    assets.append(item)
+        for file_path in iter_files(directory, recursive):
+            asset_type = self.get_asset_type(file_path)
+            if asset_types is None or asset_type in asset_types:
+                assets.append(Path(file_path))
 
         return assets
@@ -11,6 +11,9 @@ from typing import Any, Dict
 class BaseCSSGenerator:
     """Generates comprehensive base CSS for professional PDF output."""
 
+    # The base CSS is static, so it is built once per generator class and shared
+    _base_css_cache: Dict[type, str] = {}
+
     def __init__(self):
         """Initialize base CSS generator."""
         pass
@@ -18,9 +21,19 @@ class BaseCSSGenerator:
     def generate_base_css(self) -> str:
         """Generate comprehensive base CSS for professional PDFs.
 
+        The CSS is assembled on the first call and cached for later calls.
+
         Returns:
             Complete CSS string with professional styling
         """
+        base_css = self._base_css_cache.get(type(self))
+        if base_css is None:
+            base_css = self._build_base_css()
+            self._base_css_cache[type(self)] = base_css
+        return base_css
+
+    def _build_base_css(self) -> str:
+        """Assemble the base CSS from its sections."""
         css_sections = [
             self._get_css_reset(),
             self._get_typography(),
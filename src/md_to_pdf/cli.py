@@ -7,16 +7,54 @@ professional PDFs with theme support and advanced features.
 """
 
 import argparse
+import codecs
+import fnmatch
 import logging
+import os
+import stat
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
-
-from markdown.extensions import Extension
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from .config import ValidationError, load_theme_config
-from .core import MarkdownToPDFConverter
+
+if TYPE_CHECKING:
+    from markdown.extensions import Extension
+
+    from .core import MarkdownToPDFConverter
+
+# Bytes read from each input file to check that it is UTF-8 text
+UTF8_CHECK_BYTES = 4096
+
+
+def _file_mode(path: str) -> Optional[int]:
+    """Return the st_mode of a path, or None if it cannot be stat'ed.
+
+    Validators work on the raw argument strings and take file type checks
+    from this single stat call; Path objects are only built for the values
+    they return.
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse a command line count that must be zero or greater.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer >= 0
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
 
 class CLIError(Exception):
@@ -54,7 +92,7 @@ class ValidationErrorCollector:
 
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return bool(self.errors)
 
     def format_errors(self) -> str:
         """Format all errors and suggestions into a user-friendly message."""
@@ -65,15 +103,12 @@ class ValidationErrorCollector:
 
         for i, error in enumerate(self.errors, 1):
             parts.append(f"  {i}. {error['message']}")
-            if error["suggestions"]:
-                for suggestion in error["suggestions"]:
-                    parts.append(f"     💡 {suggestion}")
+            parts.extend(f"     💡 {suggestion}" for suggestion in error["suggestions"])
             parts.append("")  # Empty line between errors
 
         if self.warnings:
             parts.append("⚠️  Warnings:")
-            for warning in self.warnings:
-                parts.append(f"  • {warning}")
+            parts.extend(f"  • {warning}" for warning in self.warnings)
             parts.append("")
 
         return "\n".join(parts)
@@ -85,6 +120,7 @@ class MarkdownToPDFCLI:
     def __init__(self):
         self.logger = self._setup_logging()
         self.converter = None
+        self._parser: Optional[argparse.ArgumentParser] = None
 
     def _setup_logging(self, level: int = logging.INFO) -> logging.Logger:
         """Set up logging configuration.
@@ -189,6 +225,13 @@ Examples:
             action="store_true",
             help="Disable custom component processing",
         )
+        proc_group.add_argument(
+            "-j",
+            "--jobs",
+            type=_non_negative_int,
+            default=1,
+            help="Number of files to convert in parallel (default: 1, 0 for all CPUs)",
+        )
 
         # Output control
         control_group = parser.add_argument_group("Output Control")
@@ -251,18 +294,19 @@ Examples:
             )
 
         validator = ValidationErrorCollector()
-        files = []
+        files: List[str] = []
         total_patterns_processed = 0
 
         for pattern in input_patterns:
             total_patterns_processed += 1
-            pattern_path = Path(pattern)
             pattern_files = []
 
-            # Handle direct file paths
-            if pattern_path.exists() and pattern_path.is_file():
-                pattern_files.append(pattern_path)
-            elif pattern_path.exists() and pattern_path.is_dir():
+            # Handle direct file paths, from a single stat call
+            file_mode = _file_mode(pattern)
+
+            if file_mode is not None and stat.S_ISREG(file_mode):
+                pattern_files.append(pattern)
+            elif file_mode is not None and stat.S_ISDIR(file_mode):
                 validator.add_error(
                     f"'{pattern}' is a directory, not a file",
                     suggestions=[
@@ -273,13 +317,24 @@ Examples:
                 continue
             else:
                 # Handle glob patterns
-                parent = (
-                    pattern_path.parent if pattern_path.parent.exists() else Path(".")
-                )
+                parent, name = os.path.split(pattern)
+                if not os.path.isdir(parent or "."):
+                    parent = ""
                 try:
-                    matching_files = list(parent.glob(pattern_path.name))
-                    if matching_files:
-                        pattern_files.extend([f for f in matching_files if f.is_file()])
+                    # One directory scan; entry types come from the listing
+                    # instead of a stat per match
+                    with os.scandir(parent or ".") as entries:
+                        matching_entries = [
+                            entry
+                            for entry in entries
+                            if fnmatch.fnmatch(entry.name, name)
+                        ]
+                    if matching_entries:
+                        pattern_files.extend(
+                            os.path.join(parent, entry.name)
+                            for entry in matching_entries
+                            if entry.is_file()
+                        )
                     else:
                         # Check if the pattern has wildcards
                         if "*" in pattern or "?" in pattern or "[" in pattern:
@@ -314,7 +369,7 @@ Examples:
 
         for file_path in files:
             # Check extension
-            if file_path.suffix.lower() not in md_extensions:
+            if os.path.splitext(file_path)[1].lower() not in md_extensions:
                 validator.add_error(
                     f"'{file_path}' does not appear to be a Markdown file",
                     suggestions=[
@@ -325,12 +380,13 @@ Examples:
                 )
                 continue
 
-            # Check readability
+            # Check readability: decode only the head of the file, leaving a
+            # multi-byte character cut off at the boundary to the decoder
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    # Try to read first few bytes to ensure it's readable
-                    f.read(100)
-                valid_files.append(file_path)
+                with open(file_path, "rb") as f:
+                    head = f.read(UTF8_CHECK_BYTES)
+                codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+                valid_files.append(Path(file_path))
             except PermissionError:
                 validator.add_error(
                     f"Permission denied reading '{file_path}'",
@@ -401,8 +457,10 @@ Examples:
         path = Path(theme_path)
         validator = ValidationErrorCollector()
 
-        # Basic file existence and type checks
-        if not path.exists():
+        # Basic file existence and type checks, from a single stat call
+        file_mode = _file_mode(theme_path)
+
+        if file_mode is None:
             validator.add_error(
                 f"Theme file not found: {theme_path}",
                 suggestions=[
@@ -412,7 +470,7 @@ Examples:
                     "Try using an absolute path",
                 ],
             )
-        elif not path.is_file():
+        elif not stat.S_ISREG(file_mode):
             validator.add_error(
                 f"Theme path is not a file: {theme_path}",
                 suggestions=[
@@ -420,7 +478,7 @@ Examples:
                     f"Use '{theme_path}/theme.yaml' if it's a directory containing theme files",
                 ],
             )
-        elif path.suffix.lower() not in {".yaml", ".yml"}:
+        elif os.path.splitext(theme_path)[1].lower() not in {".yaml", ".yml"}:
             validator.add_error(
                 f"Theme file must be YAML (.yaml or .yml): {theme_path}",
                 suggestions=[
@@ -514,20 +572,20 @@ Examples:
 
         # Validate output path
         if args.output:
-            output_path = Path(args.output)
+            output_mode = _file_mode(args.output)
+            output_is_file = output_mode is not None and stat.S_ISREG(output_mode)
 
             # For single file
             if is_single_file:
                 # Check if output directory exists
-                if output_path.parent != Path(".") and not output_path.parent.exists():
+                output_parent = os.path.dirname(args.output)
+                if output_parent and not os.path.exists(output_parent):
                     try:
-                        output_path.parent.mkdir(parents=True, exist_ok=True)
-                        self.logger.debug(
-                            f"Created output directory: {output_path.parent}"
-                        )
+                        os.makedirs(output_parent, exist_ok=True)
+                        self.logger.debug(f"Created output directory: {output_parent}")
                     except PermissionError:
                         validator.add_error(
-                            f"Cannot create output directory: {output_path.parent}",
+                            f"Cannot create output directory: {output_parent}",
                             suggestions=[
                                 "Check directory permissions",
                                 "Choose a different output location",
@@ -537,14 +595,14 @@ Examples:
                         validator.add_error(f"Error creating output directory: {e}")
 
                 # Check if output file already exists
-                if output_path.exists() and output_path.is_file():
+                if output_is_file:
                     validator.add_warning(
-                        f"Output file already exists and will be overwritten: {output_path}"
+                        f"Output file already exists and will be overwritten: {args.output}"
                     )
 
             # For multiple files
             else:
-                if output_path.exists() and output_path.is_file():
+                if output_is_file:
                     validator.add_error(
                         f"Cannot use existing file '{args.output}' as output directory for multiple files",
                         suggestions=[
@@ -556,10 +614,11 @@ Examples:
 
         # Validate output directory
         if args.output_dir:
-            output_dir = Path(args.output_dir)
+            output_dir = args.output_dir
+            output_dir_mode = _file_mode(output_dir)
 
             # Check if it's an existing file
-            if output_dir.exists() and output_dir.is_file():
+            if output_dir_mode is not None and stat.S_ISREG(output_dir_mode):
                 validator.add_error(
                     f"Output directory path '{args.output_dir}' is an existing file",
                     suggestions=[
@@ -569,9 +628,9 @@ Examples:
                 )
 
             # Try to create directory
-            if not output_dir.exists():
+            if output_dir_mode is None:
                 try:
-                    output_dir.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(output_dir, exist_ok=True)
                     self.logger.debug(f"Created output directory: {output_dir}")
                 except PermissionError:
                     validator.add_error(
@@ -589,13 +648,13 @@ Examples:
             # Default behavior: same directory as input
             existing_outputs = []
             for input_file in input_files:
-                potential_output = input_file.with_suffix(".pdf")
-                if potential_output.exists():
+                potential_output = os.path.splitext(input_file)[0] + ".pdf"
+                if os.path.exists(potential_output):
                     existing_outputs.append(potential_output)
 
             if existing_outputs:
                 validator.add_warning(
-                    f"The following PDF files will be overwritten: {', '.join(str(f) for f in existing_outputs)}"
+                    f"The following PDF files will be overwritten: {', '.join(existing_outputs)}"
                 )
 
         # Raise errors if any
@@ -618,9 +677,9 @@ Examples:
         Raises:
             CLIError: If CSS file is invalid
         """
-        path = Path(css_path)
+        file_mode = _file_mode(css_path)
 
-        if not path.exists():
+        if file_mode is None:
             raise CLIError(
                 f"CSS file not found: {css_path}",
                 suggestions=[
@@ -629,18 +688,18 @@ Examples:
                 ],
             )
 
-        if not path.is_file():
+        if not stat.S_ISREG(file_mode):
             raise CLIError(
                 f"CSS path is not a file: {css_path}",
                 suggestions=["Ensure the path points to a file, not a directory"],
             )
 
-        if path.suffix.lower() != ".css":
+        if os.path.splitext(css_path)[1].lower() != ".css":
             self.logger.warning(f"⚠️  File '{css_path}' does not have .css extension")
 
         # Try to read the file
         try:
-            with open(path, "r", encoding="utf-8") as f:
+            with open(css_path, "r", encoding="utf-8") as f:
                 content = f.read()
                 if not content.strip():
                     self.logger.warning(f"⚠️  CSS file '{css_path}' is empty")
@@ -653,7 +712,7 @@ Examples:
                 ],
             )
 
-        return path
+        return Path(css_path)
 
     def _determine_output_path(
         self,
@@ -706,7 +765,38 @@ Examples:
             # Default: same directory as input with .pdf extension
             return input_file.with_suffix(".pdf")
 
-    def _setup_converter(self, args: argparse.Namespace) -> MarkdownToPDFConverter:
+    def _get_converter_options(
+        self, args: argparse.Namespace
+    ) -> Tuple[Optional[Path], Optional[List[Union[str, "Extension"]]]]:
+        """Validate the theme and extension arguments used to build a converter.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            Tuple of (theme configuration path, Markdown extensions)
+
+        Raises:
+            CLIError: If the theme configuration is invalid
+        """
+        # Theme configuration
+        theme_config_path = None
+        if args.theme and not args.no_theme:
+            theme_config_path = self._validate_theme_file(
+                args.theme, getattr(args, "strict", False)
+            )
+
+        # Extensions
+        extensions: Optional[List[Union[str, "Extension"]]] = None
+        if args.extensions is not None:
+            extensions = args.extensions
+        elif args.no_components:
+            # Default extensions without custom components
+            extensions = ["tables", "fenced_code", "codehilite"]
+
+        return theme_config_path, extensions
+
+    def _setup_converter(self, args: argparse.Namespace) -> "MarkdownToPDFConverter":
         """Set up the converter with CLI arguments.
 
         Args:
@@ -719,20 +809,10 @@ Examples:
             CLIError: If converter setup fails
         """
         try:
-            # Theme configuration
-            theme_config_path = None
-            if args.theme and not args.no_theme:
-                theme_config_path = self._validate_theme_file(
-                    args.theme, getattr(args, "strict", False)
-                )
+            theme_config_path, extensions = self._get_converter_options(args)
 
-            # Extensions
-            extensions: Optional[List[Union[str, Extension]]] = None
-            if args.extensions is not None:
-                extensions = args.extensions
-            elif args.no_components:
-                # Default extensions without custom components
-                extensions = ["tables", "fenced_code", "codehilite"]
+            # Imported here so help, version and validation skip the PDF backend
+            from .core import MarkdownToPDFConverter
 
             # Create converter
             converter = MarkdownToPDFConverter(
@@ -752,6 +832,53 @@ Examples:
                 ],
             )
 
+    def _convert_files_parallel(
+        self,
+        conversions: List[Tuple[Path, Path]],
+        args: argparse.Namespace,
+        jobs: int,
+    ) -> int:
+        """Convert files in worker processes, one converter per worker.
+
+        Args:
+            conversions: List of (input file, output file) pairs
+            args: Parsed command line arguments
+            jobs: Maximum number of worker processes
+
+        Returns:
+            Number of files converted successfully
+
+        Raises:
+            CLIError: If the converter options are invalid
+        """
+        try:
+            theme_config_path, extensions = self._get_converter_options(args)
+        except Exception as e:
+            raise CLIError(f"Failed to initialize converter: {e}")
+
+        self.logger.debug(f"Converting {len(conversions)} file(s) with {jobs} workers")
+
+        success_count = 0
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_conversion_worker,
+            initargs=(theme_config_path, extensions, self.logger.level),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _convert_in_worker, input_file, output_file, args.title
+                )
+                for input_file, output_file in conversions
+            ]
+            for (input_file, _), future in zip(conversions, futures):
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to convert {input_file}: {e}")
+
+        return success_count
+
     def _convert_file(
         self,
         input_file: Path,
@@ -824,8 +951,10 @@ Examples:
         """
         parsed_args = None
         try:
-            parser = self.create_parser()
-            parsed_args = parser.parse_args(args)
+            # The parser holds no per-run state, so build it once per CLI
+            if self._parser is None:
+                self._parser = self.create_parser()
+            parsed_args = self._parser.parse_args(args)
 
             # Configure logging based on verbosity
             if parsed_args.debug:
@@ -878,27 +1007,49 @@ Examples:
 
             self.logger.debug(f"Found {len(input_files)} input file(s)")
 
-            # Set up converter
-            self.converter = self._setup_converter(parsed_args)
+            conversions = [
+                (
+                    input_file,
+                    self._determine_output_path(
+                        input_file,
+                        parsed_args.output,
+                        parsed_args.output_dir,
+                        is_single_file,
+                    ),
+                )
+                for input_file in input_files
+            ]
 
             # Convert files
             success_count = 0
             total_count = len(input_files)
 
-            for input_file in input_files:
-                output_file = self._determine_output_path(
-                    input_file,
-                    parsed_args.output,
-                    parsed_args.output_dir,
-                    is_single_file,
-                )
+            # --jobs is validated to be >= 0; 0 means one worker per CPU
+            jobs = parsed_args.jobs or os.cpu_count() or 1
+            jobs = min(jobs, total_count)
+
+            if parsed_args.dry_run:
+                # Validate theme options without building the conversion pipeline
+                self._get_converter_options(parsed_args)
 
-                success = self._convert_file(
-                    input_file, output_file, parsed_args.title, parsed_args.dry_run
+                for input_file, output_file in conversions:
+                    if self._convert_file(input_file, output_file, dry_run=True):
+                        success_count += 1
+            elif jobs > 1:
+                success_count = self._convert_files_parallel(
+                    conversions, parsed_args, jobs
                 )
+            else:
+                # Set up converter
+                self.converter = self._setup_converter(parsed_args)
+
+                for input_file, output_file in conversions:
+                    success = self._convert_file(
+                        input_file, output_file, parsed_args.title
+                    )
 
-                if success:
-                    success_count += 1
+                    if success:
+                        success_count += 1
 
             # Report results
             if success_count == total_count:
@@ -927,6 +1078,55 @@ Examples:
                 self.logger.error("💡 Use --debug for detailed error information")
             return 1
 
+    def run_batch(self, arg_sets: List[List[str]]) -> List[int]:
+        """Run the CLI once for each argument list.
+
+        Runs share the argument parser and, through load_theme_config's cache,
+        any theme they have in common, so the theme is parsed and validated
+        once. Each run starts with the logging level the batch started with.
+
+        Args:
+            arg_sets: Command line arguments for each run
+
+        Returns:
+            Exit code of each run, in order
+        """
+        level = self.logger.level
+        exit_codes = []
+        for args in arg_sets:
+            exit_codes.append(self.run(args))
+            self.logger.setLevel(level)
+        return exit_codes
+
+
+# Per-process CLI used by worker processes of parallel conversions
+_worker_cli: Optional[MarkdownToPDFCLI] = None
+
+
+def _init_conversion_worker(
+    theme_config_path: Optional[Path],
+    extensions: Optional[List[Union[str, "Extension"]]],
+    log_level: int,
+) -> None:
+    """Build the converter once per worker process."""
+    global _worker_cli
+    from .core import MarkdownToPDFConverter
+
+    _worker_cli = MarkdownToPDFCLI()
+    _worker_cli.logger.setLevel(log_level)
+    _worker_cli.converter = MarkdownToPDFConverter(
+        theme_config_path=theme_config_path, extensions=extensions
+    )
+
+
+def _convert_in_worker(
+    input_file: Path, output_file: Path, title: Optional[str] = None
+) -> bool:
+    """Convert a single file in a worker process."""
+    if _worker_cli is None:
+        raise CLIError("Conversion worker not initialized")
+    return _worker_cli._convert_file(input_file, output_file, title)
+
 
 def main():
     """Main entry point for the CLI."""
@@ -12,7 +12,7 @@ from .exceptions import (
     UnsupportedFeatureError,
     ValidationError,
 )
-from .parser import load_theme_config
+from .parser import clear_theme_cache, load_theme_config
 from .schema import (
     ComponentConfig,
     Font,
@@ -24,6 +24,7 @@ from .schema import (
 )
 from .validators import (
     check_jsonschema_available,
+    get_theme_validator,
     get_validation_summary,
     validate_theme_config,
 )
@@ -31,6 +32,7 @@ from .validators import (
 __all__ = [
     # Configuration loading
     "load_theme_config",
+    "clear_theme_cache",
     # Schema classes
     "ThemeConfig",
     "PageSetup",
@@ -41,6 +43,7 @@ __all__ = [
     "HeaderFooterConfig",
     # Validation
     "validate_theme_config",
+    "get_theme_validator",
     "check_jsonschema_available",
     "get_validation_summary",
     # Exceptions
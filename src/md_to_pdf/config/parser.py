@@ -5,12 +5,20 @@ This module handles loading, parsing, and converting YAML configuration
 files into typed dataclass instances with validation.
 """
 
+import copy
+import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .exceptions import (
     ConfigurationError,
     FileNotFoundError,
@@ -26,7 +34,31 @@ from .schema import (
     PageSetup,
     ThemeConfig,
 )
-from .validators import check_jsonschema_available, validate_theme_config
+from .validators import (
+    check_jsonschema_available,
+    get_schema_digest,
+    validate_theme_config,
+)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML is cached as JSON next to the theme file, together with the
+# digest of the schema and validation rules it last passed (see
+# get_schema_digest). Bump the version whenever the cached representation
+# changes so stale caches are ignored.
+_CACHE_VERSION = 2
+_CACHE_SUFFIX = ".cache.json"
+
+# Parsed theme configs for this process, keyed by (resolved path, schema
+# validation flag) and stored with the (mtime, size) signature they were
+# loaded from. Kept in least- to most-recently-used order.
+_THEME_CACHE: Dict[Tuple[str, bool], Tuple[List[int], ThemeConfig]] = {}
+# Guards _THEME_CACHE so themes can be loaded from several threads
+_THEME_CACHE_LOCK = threading.Lock()
+
+# Number of theme configurations kept in _THEME_CACHE
+THEME_CACHE_SIZE = 32
 
 
 def load_theme_config(
@@ -36,6 +68,10 @@ def load_theme_config(
 ) -> ThemeConfig:
     """Load and parse a theme configuration file.
 
+    Parsed configurations are cached per process and reused while the file's
+    modification time and size are unchanged. Each call returns its own copy,
+    so callers may modify the result freely. Safe to call from several threads.
+
     Args:
         config_path: Path to the theme.yaml file
         validate_files: Whether to validate that referenced files exist
@@ -53,36 +89,64 @@ def load_theme_config(
     config_path = Path(config_path)
 
     # Check if config file exists
-    if not config_path.exists():
+    try:
+        signature = _get_source_signature(config_path)
+    except OSError:
         raise FileNotFoundError(str(config_path), "theme configuration file")
 
-    # Load YAML content
-    try:
-        with open(config_path, "r", encoding="utf-8") as file:
-            yaml_data = yaml.safe_load(file) or {}
-    except yaml.YAMLError as e:
-        raise InvalidYAMLError(
-            "Failed to parse YAML content", yaml_error=e, file_path=str(config_path)
-        )
-    except Exception as e:
-        raise ConfigurationError(
-            f"Failed to read configuration file: {e}", file_path=str(config_path)
-        )
+    cache_key = (str(config_path.resolve()), validate_schema)
+    with _THEME_CACHE_LOCK:
+        cached = _THEME_CACHE.pop(cache_key, None)
+        if cached is not None and cached[0] == signature:
+            _THEME_CACHE[cache_key] = cached
+    if cached is not None and cached[0] == signature:
+        theme_config = copy.deepcopy(cached[1])
+        # Referenced files may have changed since the theme was parsed
+        if validate_files:
+            _validate_file_references(theme_config)
+        return theme_config
+
+    # Load YAML content (from the JSON sidecar cache when it is current)
+    yaml_data, validated_schema = _read_yaml_cache(config_path)
+    write_cache = yaml_data is None
+    if yaml_data is None:
+        try:
+            with open(config_path, "r", encoding="utf-8") as file:
+                yaml_data = yaml.load(file, Loader=_YAML_LOADER) or {}
+        except yaml.YAMLError as e:
+            raise InvalidYAMLError(
+                "Failed to parse YAML content", yaml_error=e, file_path=str(config_path)
+            )
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to read configuration file: {e}", file_path=str(config_path)
+            )
 
-    # Validate configuration using JSON Schema (if requested and available)
+    # Validate configuration using JSON Schema (if requested and available),
+    # unless this content already passed against the current schema
     if validate_schema:
         if check_jsonschema_available():
-            try:
-                validate_theme_config(yaml_data, str(config_path))
-            except ValidationError as e:
-                # Re-raise with additional context
-                raise ValidationError(
-                    e.message, field_path=e.field_path, file_path=str(config_path)
-                ) from e
+            schema_digest = get_schema_digest()
+            if schema_digest is None or schema_digest != validated_schema:
+                try:
+                    validate_theme_config(yaml_data, str(config_path))
+                except ValidationError as e:
+                    if write_cache:
+                        _write_yaml_cache(config_path, yaml_data, validated_schema)
+                    # Re-raise with additional context
+                    raise ValidationError(
+                        e.message, field_path=e.field_path, file_path=str(config_path)
+                    ) from e
+                if schema_digest is not None:
+                    validated_schema = schema_digest
+                    write_cache = True
         else:
             # Log warning if validation was requested but jsonschema isn't available
             print("Warning: JSON Schema validation skipped (jsonschema not installed)")
 
+    if write_cache:
+        _write_yaml_cache(config_path, yaml_data, validated_schema)
+
     # Convert to ThemeConfig
     try:
         theme_config = _parse_theme_config(yaml_data, config_path)
@@ -108,9 +172,123 @@ def load_theme_config(
     if validate_files:
         _validate_file_references(theme_config)
 
+    cached = (signature, copy.deepcopy(theme_config))
+    with _THEME_CACHE_LOCK:
+        _THEME_CACHE[cache_key] = cached
+        if len(_THEME_CACHE) > THEME_CACHE_SIZE:
+            # Evict the least recently used theme
+            del _THEME_CACHE[next(iter(_THEME_CACHE))]
     return theme_config
 
 
+def clear_theme_cache() -> None:
+    """Forget all theme configurations cached by load_theme_config."""
+    with _THEME_CACHE_LOCK:
+        _THEME_CACHE.clear()
+
+
+def _get_cache_path(config_path: Path) -> Path:
+    """Get the JSON sidecar cache path for a theme file."""
+    return config_path.with_name(config_path.name + _CACHE_SUFFIX)
+
+
+def _get_source_signature(config_path: Path) -> List[int]:
+    """Get the (mtime, size) signature used to detect theme file changes."""
+    stat = config_path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data for the sidecar cache, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(payload: bytes) -> Any:
+    """Deserialize sidecar cache data, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _read_yaml_cache(
+    config_path: Path,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Load previously parsed YAML data from the JSON sidecar cache.
+
+    Args:
+        config_path: Path to the theme.yaml file
+
+    Returns:
+        Tuple of the cached YAML data and the digest of the schema it passed
+        validation against; (None, None) if there is no up-to-date cache
+    """
+    try:
+        with open(_get_cache_path(config_path), "rb") as file:
+            cached = _json_loads(file.read())
+        signature = _get_source_signature(config_path)
+    except (OSError, ValueError):
+        return None, None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != _CACHE_VERSION
+        or cached.get("source") != signature
+        or not isinstance(cached.get("data"), dict)
+    ):
+        return None, None
+
+    validated_schema = cached.get("validated_schema")
+    if not isinstance(validated_schema, str):
+        validated_schema = None
+    return cached["data"], validated_schema
+
+
+def _write_yaml_cache(
+    config_path: Path, yaml_data: Any, validated_schema: Optional[str] = None
+) -> None:
+    """Store parsed YAML data in the JSON sidecar cache.
+
+    The cache is best-effort: data that does not survive a JSON round trip
+    (dates, non-string keys) is not cached, and write failures are ignored.
+
+    Args:
+        config_path: Path to the theme.yaml file
+        yaml_data: Parsed YAML data
+        validated_schema: Digest of the schema the data passed validation
+            against, if any
+    """
+    try:
+        payload = _json_dumps(
+            {
+                "version": _CACHE_VERSION,
+                "source": _get_source_signature(config_path),
+                "data": yaml_data,
+                "validated_schema": validated_schema,
+            }
+        )
+        if _json_loads(payload)["data"] != yaml_data:
+            return
+    except (OSError, TypeError, ValueError):
+        return
+
+    cache_path = _get_cache_path(config_path)
+    # Unique per process and thread, so concurrent writers never share a file
+    temp_path = cache_path.with_name(
+        f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(payload)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 def _parse_theme_config(data: Dict[str, Any], config_path: Path) -> ThemeConfig:
     """Parse YAML data into ThemeConfig dataclass.
 
@@ -5,12 +5,18 @@ This module defines type-safe dataclasses that represent the complete
 theme configuration structure with sensible defaults.
 """
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, making
+# attribute access faster and config objects smaller. They are not frozen:
+# the parser resolves asset paths in place after construction.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Margin:
     """Page margin configuration.
 
@@ -28,7 +34,7 @@ class Margin:
         return cls(top=margin, bottom=margin, left=margin, right=margin)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Font:
     """Default font configuration."""
 
@@ -39,7 +45,7 @@ class Font:
     color: str = "#333333"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageSetup:
     """Page layout and default font settings."""
 
@@ -49,7 +55,7 @@ class PageSetup:
     default_font: Font = field(default_factory=Font)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FontDeclaration:
     """Custom font declaration for embedding."""
 
@@ -67,7 +73,7 @@ class FontDeclaration:
             )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComponentConfig:
     """Configuration for custom Markdown components."""
 
@@ -76,7 +82,7 @@ class ComponentConfig:
     default_attributes: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HeaderFooterConfig:
     """Configuration for page headers and footers."""
 
@@ -90,7 +96,7 @@ class HeaderFooterConfig:
     line_color: str = "#cccccc"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ThemeConfig:
     """Complete theme configuration.
 
@@ -5,19 +5,21 @@ This module provides comprehensive validation for theme.yaml files using
 the JSON Schema specification and custom validation functions.
 """
 
+import hashlib
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 try:
     import jsonschema
-    from jsonschema import ValidationError as JsonSchemaValidationError
+    from jsonschema.exceptions import best_match
 
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     jsonschema = None
-    JsonSchemaValidationError = Exception
+    best_match = None
     JSONSCHEMA_AVAILABLE = False
 
 from .exceptions import UnsupportedFeatureError, ValidationError
@@ -27,18 +29,163 @@ SCHEMA_FILE = (
     Path(__file__).parent.parent.parent.parent / "schemas" / "theme_schema.json"
 )
 
+# Source of the custom validation rules; it is hashed together with the
+# schema so cached "validated" records expire when the rules change
+RULES_FILE = Path(__file__)
+
+# Values accepted by the custom validation rules
+VALID_PAGE_SIZES = ("A4", "A3", "A5", "Letter", "Legal", "Tabloid")
+VALID_ORIENTATIONS = frozenset(["portrait", "landscape"])
+
+# Allowed values as listed in the JSON Schema's error messages
+PAGE_SIZE_CHOICES = ", ".join(f"'{size}'" for size in VALID_PAGE_SIZES)
+ORIENTATION_CHOICES = "'portrait', 'landscape'"
+
+# Markdown elements that may be styled
+VALID_STYLE_ELEMENTS = frozenset(
+    [
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "p",
+        "ul",
+        "ol",
+        "li",
+        "blockquote",
+        "a",
+        "strong",
+        "em",
+        "code",
+        "pre",
+        "table",
+        "th",
+        "td",
+        "img",
+        "hr",
+        "code_block",
+    ]
+)
+
+# Style properties holding colors and CSS lengths
+COLOR_PROPERTIES = ("color", "background_color", "line_color")
+UNIT_PROPERTIES = (
+    "font_size",
+    "margin",
+    "margin_top",
+    "margin_bottom",
+    "margin_left",
+    "margin_right",
+    "padding",
+    "padding_top",
+    "padding_bottom",
+    "padding_left",
+    "padding_right",
+    "border_radius",
+)
+
+RESERVED_COMPONENT_NAMES = frozenset(
+    ["if", "for", "while", "class", "def", "import", "from", "as"]
+)
+
+# Sections reported by get_validation_summary, and the sections it counts
+SUMMARY_SECTIONS = (
+    "page_setup",
+    "fonts",
+    "stylesheets",
+    "styles",
+    "custom_components",
+    "page_headers",
+    "page_footers",
+)
+SUMMARY_COUNTS = (
+    ("fonts", "font_count"),
+    ("stylesheets", "stylesheet_count"),
+    ("custom_components", "component_count"),
+    ("styles", "styled_elements"),
+)
+
+HEX_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
+UNIT_VALUE_PATTERN = re.compile(r"^\d+(\.\d+)?(cm|mm|in|pt|px|em|rem|%)$")
 
-def validate_theme_config(
-    config_data: Dict[str, Any], config_path: Optional[str] = None
-) -> None:
-    """Validate theme configuration data against JSON Schema.
+
+@lru_cache(maxsize=4)
+def _schema_validator(schema_path: Path) -> Any:
+    """Load a JSON Schema file and build its validator.
+
+    The schema is checked and compiled once per schema file; later
+    validations reuse the validator.
+
+    Args:
+        schema_path: Path to the JSON Schema file
+
+    Returns:
+        jsonschema validator instance for the schema's draft
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist
+        json.JSONDecodeError: If the schema file is not valid JSON
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@lru_cache(maxsize=4)
+def _schema_digest(schema_path: Path, rules_path: Path) -> str:
+    """Hash a JSON Schema file and the custom validation rules.
+
+    Args:
+        schema_path: Path to the JSON Schema file
+        rules_path: Path to the module implementing the custom rules
+
+    Returns:
+        Hex digest identifying this version of the schema and rules
+
+    Raises:
+        OSError: If either file cannot be read
+    """
+    digest = hashlib.blake2b(schema_path.read_bytes(), digest_size=16)
+    digest.update(rules_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_schema_digest() -> Optional[str]:
+    """Get a digest identifying the current theme schema and validation rules.
+
+    Configurations that passed validation can record this digest and skip
+    revalidation while neither the schema nor the custom rules change.
+
+    Returns:
+        Hex digest of the schema and rules, or None if they cannot be read
+    """
+    try:
+        return _schema_digest(SCHEMA_FILE, RULES_FILE)
+    except OSError:
+        return None
+
+
+def get_theme_validator(config_path: Optional[str] = None) -> Any:
+    """Get the compiled JSON Schema validator for theme configurations.
+
+    The validator is built once and shared, so callers checking many
+    configurations can use its iter_errors()/is_valid() directly. Unlike
+    validate_theme_config, it only applies the JSON Schema, not the custom
+    rules.
 
     Args:
-        config_data: Parsed YAML configuration data
         config_path: Path to the config file for error context
 
+    Returns:
+        jsonschema validator instance for the theme schema
+
     Raises:
-        ValidationError: If validation fails
+        ValidationError: If the schema file is missing or invalid
         UnsupportedFeatureError: If jsonschema is not available
     """
     if not JSONSCHEMA_AVAILABLE or jsonschema is None:
@@ -46,10 +193,8 @@ def validate_theme_config(
             "jsonschema library not available", "Install with: pip install jsonschema"
         )
 
-    # Load JSON Schema
     try:
-        with open(SCHEMA_FILE, "r", encoding="utf-8") as f:
-            schema = json.load(f)
+        return _schema_validator(SCHEMA_FILE)
     except FileNotFoundError:
         raise ValidationError(
             f"Schema file not found: {SCHEMA_FILE}", file_path=config_path
@@ -59,13 +204,31 @@ def validate_theme_config(
             f"Invalid JSON schema file: {e}", file_path=str(SCHEMA_FILE)
         )
 
-    # Validate against schema
-    try:
-        jsonschema.validate(instance=config_data, schema=schema)
-    except JsonSchemaValidationError as e:
+
+def validate_theme_config(
+    config_data: Dict[str, Any], config_path: Optional[str] = None
+) -> None:
+    """Validate theme configuration data against JSON Schema.
+
+    Args:
+        config_data: Parsed YAML configuration data
+        config_path: Path to the config file for error context
+
+    Raises:
+        ValidationError: If validation fails
+        UnsupportedFeatureError: If jsonschema is not available
+    """
+    validator = get_theme_validator(config_path)
+
+    # Reject common mistakes before walking the full schema
+    _validate_fast_rules(config_data, config_path)
+
+    # Validate against schema, reporting the same error jsonschema.validate would
+    error = best_match(validator.iter_errors(config_data))
+    if error is not None:
         # Convert JSON Schema error to our ValidationError with better messaging
-        field_path = _format_validation_path(e)
-        error_msg = _format_validation_message(e)
+        field_path = _format_validation_path(error)
+        error_msg = _format_validation_message(error)
 
         raise ValidationError(error_msg, field_path=field_path, file_path=config_path)
 
@@ -73,6 +236,59 @@ def validate_theme_config(
     _validate_custom_rules(config_data, config_path)
 
 
+def _validate_fast_rules(
+    config_data: Dict[str, Any], config_path: Optional[str] = None
+) -> None:
+    """Check frequently invalid values with plain lookups.
+
+    Errors are reported as the JSON Schema or custom rules would report
+    them; anything these checks do not cover is left to the full validation.
+
+    Args:
+        config_data: Configuration data to validate
+        config_path: Path to the config file for error context
+
+    Raises:
+        ValidationError: If page size, orientation or font names are invalid
+    """
+    if not isinstance(config_data, dict):
+        return  # Schema validation will catch this
+
+    page_setup = config_data.get("page_setup")
+    if isinstance(page_setup, dict):
+        size = page_setup.get("size")
+        if isinstance(size, str) and size not in VALID_PAGE_SIZES:
+            raise ValidationError(
+                f"must be one of: {PAGE_SIZE_CHOICES}",
+                field_path="page_setup.size",
+                file_path=config_path,
+            )
+
+        orientation = page_setup.get("orientation")
+        if isinstance(orientation, str) and orientation not in VALID_ORIENTATIONS:
+            raise ValidationError(
+                f"must be one of: {ORIENTATION_CHOICES}",
+                field_path="page_setup.orientation",
+                file_path=config_path,
+            )
+
+    fonts = config_data.get("fonts")
+    if isinstance(fonts, list):
+        font_names = set()
+        for i, font in enumerate(fonts):
+            font_name = font.get("name") if isinstance(font, dict) else None
+            if not font_name:
+                continue  # Schema validation will catch this
+
+            if font_name in font_names:
+                raise ValidationError(
+                    f"Duplicate font name '{font_name}'. Font names must be unique",
+                    field_path=f"fonts[{i}].name",
+                    file_path=config_path,
+                )
+            font_names.add(font_name)
+
+
 def _format_validation_path(error: Any) -> str:
     """Format JSON Schema validation path for human readability.
 
@@ -212,17 +428,17 @@ def _validate_page_setup(
     """
     # Validate page size
     size = page_setup.get("size", "A4")
-    valid_sizes = ["A4", "A3", "A5", "Letter", "Legal", "Tabloid"]
-    if size not in valid_sizes:
+    if size not in VALID_PAGE_SIZES:
         raise ValidationError(
-            f"Invalid page size '{size}'. Must be one of: {', '.join(valid_sizes)}",
+            f"Invalid page size '{size}'. "
+            f"Must be one of: {', '.join(VALID_PAGE_SIZES)}",
             field_path="page_setup.size",
             file_path=config_path,
         )
 
     # Validate orientation
     orientation = page_setup.get("orientation", "portrait")
-    if orientation not in ["portrait", "landscape"]:
+    if orientation not in VALID_ORIENTATIONS:
         raise ValidationError(
             f"Invalid orientation '{orientation}'. Must be 'portrait' or 'landscape'",
             field_path="page_setup.orientation",
@@ -242,8 +458,7 @@ def _validate_fonts(
     if not isinstance(fonts, list):
         return  # Schema validation will catch this
 
-    font_names = set()
-
+    # Duplicate names are rejected by _validate_fast_rules
     for i, font in enumerate(fonts):
         if not isinstance(font, dict):
             continue  # Schema validation will catch this
@@ -252,15 +467,6 @@ def _validate_fonts(
         if not font_name:
             continue  # Schema validation will catch this
 
-        # Check for duplicate font names
-        if font_name in font_names:
-            raise ValidationError(
-                f"Duplicate font name '{font_name}'. Font names must be unique",
-                field_path=f"fonts[{i}].name",
-                file_path=config_path,
-            )
-        font_names.add(font_name)
-
         # Validate that at least one font file is specified
         font_files = [
             font.get("normal"),
@@ -286,38 +492,12 @@ def _validate_styles(styles: Dict[str, Any], config_path: Optional[str] = None)
     if not isinstance(styles, dict):
         return  # Schema validation will catch this
 
-    # Valid Markdown elements
-    valid_elements = {
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "p",
-        "ul",
-        "ol",
-        "li",
-        "blockquote",
-        "a",
-        "strong",
-        "em",
-        "code",
-        "pre",
-        "table",
-        "th",
-        "td",
-        "img",
-        "hr",
-        "code_block",
-    }
-
     for element_name, element_styles in styles.items():
         # Check if element is valid
-        if element_name not in valid_elements:
+        if element_name not in VALID_STYLE_ELEMENTS:
             raise ValidationError(
                 f"Unknown Markdown element '{element_name}'. "
-                f"Valid elements: {', '.join(sorted(valid_elements))}",
+                f"Valid elements: {', '.join(sorted(VALID_STYLE_ELEMENTS))}",
                 field_path=f"styles.{element_name}",
                 file_path=config_path,
             )
@@ -340,27 +520,12 @@ def _validate_style_properties(
         config_path: Config file path for error context
     """
     # Validate color properties
-    color_properties = ["color", "background_color", "line_color"]
-    for prop in color_properties:
+    for prop in COLOR_PROPERTIES:
         if prop in properties:
             _validate_color_value(properties[prop], f"{field_path}.{prop}", config_path)
 
     # Validate unit properties
-    unit_properties = [
-        "font_size",
-        "margin",
-        "margin_top",
-        "margin_bottom",
-        "margin_left",
-        "margin_right",
-        "padding",
-        "padding_top",
-        "padding_bottom",
-        "padding_left",
-        "padding_right",
-        "border_radius",
-    ]
-    for prop in unit_properties:
+    for prop in UNIT_PROPERTIES:
         if prop in properties:
             _validate_unit_value(properties[prop], f"{field_path}.{prop}", config_path)
 
@@ -381,7 +546,7 @@ def _validate_color_value(
         )
 
     # Check hex color pattern
-    if not re.match(r"^#[0-9a-fA-F]{6}$", value):
+    if not HEX_COLOR_PATTERN.match(value):
         raise ValidationError(
             f"Invalid color format '{value}'. Must be a 6-digit hex color (e.g., '#ffffff')",
             field_path=field_path,
@@ -419,9 +584,7 @@ def _validate_unit_value(
 
         # Validate each part
         for part in parts:
-            if not (
-                part == "0" or re.match(r"^\d+(\.\d+)?(cm|mm|in|pt|px|em|rem|%)$", part)
-            ):
+            if not (part == "0" or UNIT_VALUE_PATTERN.match(part)):
                 raise ValidationError(
                     f"Invalid unit format '{part}' in '{value}'. Each value must be a number "
                     "followed by a valid unit (e.g., '2cm', '12pt', '1.5em') or '0'",
@@ -430,9 +593,7 @@ def _validate_unit_value(
                 )
     else:
         # For single unit properties, use the original validation
-        if not (
-            value == "0" or re.match(r"^\d+(\.\d+)?(cm|mm|in|pt|px|em|rem|%)$", value)
-        ):
+        if not (value == "0" or UNIT_VALUE_PATTERN.match(value)):
             raise ValidationError(
                 f"Invalid unit format '{value}'. Must be a number followed by a valid unit "
                 "(e.g., '2cm', '12pt', '1.5em') or '0'",
@@ -464,8 +625,7 @@ def _validate_component_names(
             )
 
         # Check for reserved names
-        reserved_names = {"if", "for", "while", "class", "def", "import", "from", "as"}
-        if component_name in reserved_names:
+        if component_name in RESERVED_COMPONENT_NAMES:
             raise ValidationError(
                 f"Component name '{component_name}' is reserved. Please choose a different name",
                 field_path=f"custom_components.{component_name}",
@@ -491,40 +651,16 @@ def get_validation_summary(config_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with validation summary information
     """
-    summary = {
-        "jsonschema_available": check_jsonschema_available(),
-        "sections_present": [],
-        "font_count": 0,
-        "stylesheet_count": 0,
-        "component_count": 0,
-        "styled_elements": 0,
+    summary: Dict[str, Any] = {
+        "jsonschema_available": JSONSCHEMA_AVAILABLE,
+        # Check which sections are present
+        "sections_present": [
+            section for section in SUMMARY_SECTIONS if config_data.get(section)
+        ],
     }
 
-    # Check which sections are present
-    sections = [
-        "page_setup",
-        "fonts",
-        "stylesheets",
-        "styles",
-        "custom_components",
-        "page_headers",
-        "page_footers",
-    ]
-    for section in sections:
-        if section in config_data and config_data[section]:
-            summary["sections_present"].append(section)
-
     # Count various configuration items
-    if "fonts" in config_data:
-        summary["font_count"] = len(config_data["fonts"])
-
-    if "stylesheets" in config_data:
-        summary["stylesheet_count"] = len(config_data["stylesheets"])
-
-    if "custom_components" in config_data:
-        summary["component_count"] = len(config_data["custom_components"])
-
-    if "styles" in config_data:
-        summary["styled_elements"] = len(config_data["styles"])
+    for section, count_key in SUMMARY_COUNTS:
+        summary[count_key] = len(config_data.get(section, ()))
 
     return summary
@@ -1,14 +1,29 @@
 """Core functionality for Markdown to PDF conversion."""
 
+import os
+import stat
+import threading
 import warnings
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
-
-import markdown
-from markdown.extensions import Extension
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .base_css import BaseCSSGenerator
-from .templating import TemplateManager
+
+if TYPE_CHECKING:
+    from markdown.extensions import Extension
+
+    from .templating import TemplateManager
 
 # Import theme configuration and CSS generation
 try:
@@ -19,19 +34,86 @@ try:
 except ImportError:
     THEME_CONFIG_AVAILABLE = False
 
-# WeasyPrint import with fallback for systems without GTK dependencies
-try:
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        import weasyprint
-    WEASYPRINT_AVAILABLE = True
-except ImportError as e:
-    WEASYPRINT_AVAILABLE = False
-    WEASYPRINT_ERROR = str(e)
-except Exception as e:
-    # Catch other errors like missing system libraries
-    WEASYPRINT_AVAILABLE = False
-    WEASYPRINT_ERROR = str(e)
+# WeasyPrint loads cairo, pango and fontconfig, so it is only imported when a
+# PDF is first rendered; CSS and HTML generation never pay for it
+_weasyprint: Optional[Any] = None
+_weasyprint_error: Optional[str] = None
+
+
+def _load_weasyprint() -> Optional[Any]:
+    """Import WeasyPrint on first use.
+
+    Returns:
+        The weasyprint module, or None if it (or one of its system
+        libraries) is not available
+    """
+    global _weasyprint, _weasyprint_error
+    if _weasyprint is None and _weasyprint_error is None:
+        # WeasyPrint import with fallback for systems without GTK dependencies
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                import weasyprint
+            _weasyprint = weasyprint
+        except ImportError as e:
+            _weasyprint_error = str(e)
+        except Exception as e:
+            # Catch other errors like missing system libraries
+            _weasyprint_error = str(e)
+    return _weasyprint
+
+
+def __getattr__(name: str) -> Any:
+    # WEASYPRINT_AVAILABLE and WEASYPRINT_ERROR used to be set at import time
+    if name == "WEASYPRINT_AVAILABLE":
+        return _load_weasyprint() is not None
+    if name == "WEASYPRINT_ERROR":
+        _load_weasyprint()
+        return _weasyprint_error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# File extensions MarkdownProcessor.convert_file accepts
+MARKDOWN_SUFFIXES = frozenset([".md", ".markdown"])
+
+
+# Stylesheet for the custom components, shared by every PDFGenerator
+COMPONENT_CSS_FILE = (
+    Path(__file__).parent.parent.parent / "assets" / "css" / "components.css"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_component_css(css_file: Path) -> str:
+    """Read the component stylesheet once per process.
+
+    Args:
+        css_file: Path to the component CSS file
+
+    Returns:
+        The stylesheet, or an empty string if it is missing or unreadable
+    """
+    try:
+        return css_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+# Setting this environment variable to "1" makes PDFGenerator write a minimal
+# placeholder PDF instead of rendering with WeasyPrint. Intended for tests that
+# exercise the Markdown/HTML/CSS pipeline but don't inspect the PDF itself.
+STUB_PDF_ENV_VAR = "MD_TO_PDF_TEST_STUB"
+_STUB_PDF = b"%PDF-1.4\n%%EOF\n"
+
+
+def _pdf_rendering_stubbed() -> bool:
+    """Check whether PDF rendering is replaced by a placeholder PDF."""
+    return os.environ.get(STUB_PDF_ENV_VAR) == "1"
+
+
+def _is_stream(output: Union[Path, BinaryIO]) -> bool:
+    """Check whether a PDF output target is a writable stream rather than a path."""
+    return hasattr(output, "write")
 
 
 class MarkdownProcessingError(Exception):
@@ -55,12 +137,14 @@ class ConverterNotAvailableError(Exception):
 class MarkdownProcessor:
     """Handles Markdown parsing and conversion to HTML."""
 
-    def __init__(self, extensions: Optional[List[Union[str, Extension]]] = None):
+    def __init__(self, extensions: Optional[List[Union[str, "Extension"]]] = None):
         """Initialize the Markdown processor.
 
         Args:
             extensions: List of Markdown extensions to use (strings or extension objects)
         """
+        import markdown
+
         self.extensions = extensions or []
         self.md_parser = markdown.Markdown(extensions=self.extensions)
 
@@ -97,20 +181,24 @@ class MarkdownProcessor:
             FileNotFoundError: If the input file doesn't exist
             MarkdownProcessingError: If Markdown processing fails
         """
-        if not input_path.exists():
+        # One stat answers both "missing" and "not a regular file"
+        try:
+            mode = input_path.stat().st_mode
+        except OSError:
             raise FileNotFoundError(f"Markdown file not found: {input_path}")
 
-        if not input_path.is_file():
+        if not stat.S_ISREG(mode):
             raise FileNotFoundError(f"Path is not a file: {input_path}")
 
-        if input_path.suffix.lower() not in [".md", ".markdown"]:
+        if input_path.suffix.lower() not in MARKDOWN_SUFFIXES:
             raise MarkdownProcessingError(
                 f"File does not appear to be a Markdown file: {input_path}"
             )
 
         try:
-            with open(input_path, "r", encoding="utf-8") as f:
-                markdown_content = f.read()
+            # Decode the raw bytes directly instead of going through a text-mode
+            # file wrapper; Markdown normalizes line endings itself
+            markdown_content = input_path.read_bytes().decode("utf-8")
         except Exception as e:
             raise MarkdownProcessingError(f"Failed to read Markdown file: {e}")
 
@@ -125,6 +213,7 @@ class PDFGenerator:
         base_css: Optional[str] = None,
         include_component_css: bool = True,
         theme_config: Optional["ThemeConfig"] = None,
+        font_config: Optional[Any] = None,
     ):
         """Initialize PDF generator.
 
@@ -132,6 +221,8 @@ class PDFGenerator:
             base_css: Custom base CSS (if None, uses comprehensive default)
             include_component_css: Whether to include component CSS
             theme_config: Theme configuration for enhanced styling
+            font_config: WeasyPrint FontConfiguration to render with, so
+                generators sharing one only discover system fonts once
         """
         if base_css is None:
             # Use comprehensive base CSS system
@@ -147,7 +238,9 @@ class PDFGenerator:
 
         self.include_component_css = include_component_css
         self.theme_config = theme_config
+        self.font_config = font_config
         self._weasyprint_checked = False
+        self._theme_css: Optional[str] = None
 
     def _get_default_css(self) -> str:
         """Get default CSS for PDF generation (deprecated - using BaseCSSGenerator now)."""
@@ -231,21 +324,31 @@ class PDFGenerator:
 
     def _get_component_css(self) -> str:
         """Get CSS for custom components."""
-        # Try to read the component CSS file
-        try:
-            css_file = (
-                Path(__file__).parent.parent.parent
-                / "assets"
-                / "css"
-                / "components.css"
-            )
-            if css_file.exists():
-                return css_file.read_text(encoding="utf-8")
-        except Exception:
-            pass
+        return _load_component_css(COMPONENT_CSS_FILE)
 
-        # Return empty string if file not found or error reading
-        return ""
+    def _get_theme_css(self) -> str:
+        """Get theme and external stylesheet CSS, generated once per generator.
+
+        Returns:
+            CSS to append after the base CSS (empty if no theme is configured)
+        """
+        if self._theme_css is None:
+            self._theme_css = ""
+
+            if self.theme_config and THEME_CONFIG_AVAILABLE:
+                css_generator = CSSGenerator(self.theme_config)
+                theme_css = css_generator.generate_css()
+
+                # Load external stylesheets from theme
+                external_css = css_generator.load_external_stylesheets()
+
+                # Combine CSS in proper order: base -> theme -> external -> components
+                self._theme_css = f"\n\n/* Theme CSS */\n{theme_css}"
+
+                if external_css:
+                    self._theme_css += f"\n\n/* External Stylesheets */\n{external_css}"
+
+        return self._theme_css
 
     def _create_html_document(
         self, html_content: str, title: str = "Generated PDF"
@@ -259,62 +362,51 @@ class PDFGenerator:
         Returns:
             Complete HTML document string
         """
-        # Start with base CSS
-        all_css = self.base_css
-
-        # Add theme-generated CSS if theme configuration is available
-        if self.theme_config and THEME_CONFIG_AVAILABLE:
-            css_generator = CSSGenerator(self.theme_config)
-            theme_css = css_generator.generate_css()
-
-            # Load external stylesheets from theme
-            external_css = css_generator.load_external_stylesheets()
-
-            # Combine CSS in proper order: base -> theme -> external -> components
-            all_css = f"{self.base_css}\n\n/* Theme CSS */\n{theme_css}"
-
-            if external_css:
-                all_css += f"\n\n/* External Stylesheets */\n{external_css}"
+        # Start with base CSS, then theme-generated CSS if a theme is configured.
+        # The pieces are joined straight into the document so the (large)
+        # stylesheet is copied once, not once per concatenation.
+        parts = [
+            '<!DOCTYPE html>\n<html>\n<head>\n    <meta charset="utf-8">\n',
+            f"    <title>{title}</title>\n    <style>\n        ",
+            self.base_css,
+            self._get_theme_css(),
+        ]
 
         # Add component CSS last to ensure it can override theme styles
         if self.include_component_css:
             component_css = self._get_component_css()
             if component_css:
-                all_css += "\n\n/* Custom Components CSS */\n" + component_css
-
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>{title}</title>
-    <style>
-        {all_css}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
+                parts.append("\n\n/* Custom Components CSS */\n")
+                parts.append(component_css)
+
+        parts.append("\n    </style>\n</head>\n<body>\n    ")
+        parts.append(html_content)
+        parts.append("\n</body>\n</html>")
+        return "".join(parts)
 
     def _check_weasyprint(self):
         """Check if WeasyPrint is available and raise error if not."""
         if not self._weasyprint_checked:
-            if not WEASYPRINT_AVAILABLE:
+            if _load_weasyprint() is None:
                 raise ConverterNotAvailableError(
-                    f"WeasyPrint is required but not available: {WEASYPRINT_ERROR}\n"
+                    f"WeasyPrint is required but not available: {_weasyprint_error}\n"
                     f"Please install WeasyPrint and its dependencies. "
                     f"On Windows, you may need to install MSYS2 first."
                 )
             self._weasyprint_checked = True
 
     def generate_pdf(
-        self, html_content: str, output_path: Path, title: str = "Generated PDF"
+        self,
+        html_content: str,
+        output_path: Union[Path, BinaryIO],
+        title: str = "Generated PDF",
     ) -> None:
         """Generate PDF from HTML content.
 
         Args:
             html_content: HTML content to convert
-            output_path: Path where PDF should be saved
+            output_path: Path where PDF should be saved, or a writable binary
+                stream to write it to
             title: Document title
 
         Raises:
@@ -324,20 +416,48 @@ class PDFGenerator:
         if not html_content.strip():
             raise PDFGenerationError("HTML content is empty")
 
+        full_html = self._create_html_document(html_content, title)
+
+        stubbed = _pdf_rendering_stubbed()
+        if not stubbed:
+            self._check_weasyprint()
+
+        if _is_stream(output_path):
+            try:
+                self._write_pdf(full_html, output_path, stubbed)
+            except Exception as e:
+                raise PDFGenerationError(f"Failed to generate PDF: {e}")
+            return
+
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        full_html = self._create_html_document(html_content, title)
-
+        # Render next to the target and move it into place once complete, so a
+        # failed render never leaves a truncated PDF at output_path. The name is
+        # unique per thread, so concurrent renders of one path don't collide
+        temp_path = output_path.with_name(
+            f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
-            self._check_weasyprint()
-            weasyprint.HTML(string=full_html).write_pdf(str(output_path))
-        except ConverterNotAvailableError:
-            # Re-raise converter availability errors
-            raise
+            with open(temp_path, "wb") as temp_file:
+                self._write_pdf(full_html, temp_file, stubbed)
+            os.replace(temp_path, output_path)
         except Exception as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             raise PDFGenerationError(f"Failed to generate PDF: {e}")
 
+    def _write_pdf(self, full_html: str, target: BinaryIO, stubbed: bool) -> None:
+        """Render a complete HTML document as PDF into a binary stream."""
+        if stubbed:
+            target.write(_STUB_PDF)
+        else:
+            _weasyprint.HTML(string=full_html).write_pdf(
+                target, font_config=self.font_config
+            )
+
     def generate_pdf_bytes(
         self, html_content: str, title: str = "Generated PDF"
     ) -> bytes:
@@ -359,9 +479,14 @@ class PDFGenerator:
 
         full_html = self._create_html_document(html_content, title)
 
+        if _pdf_rendering_stubbed():
+            return _STUB_PDF
+
         try:
             self._check_weasyprint()
-            pdf_bytes = weasyprint.HTML(string=full_html).write_pdf()
+            pdf_bytes = _weasyprint.HTML(string=full_html).write_pdf(
+                font_config=self.font_config
+            )
             if pdf_bytes is None:
                 raise PDFGenerationError(
                     "WeasyPrint returned None instead of PDF bytes"
@@ -377,13 +502,66 @@ class PDFGenerator:
 class MarkdownToPDFConverter:
     """Main converter class that combines Markdown processing and PDF generation."""
 
+    # Converters handed out by shared(), kept only while callers hold them
+    _shared_instances: "weakref.WeakValueDictionary[Hashable, Any]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    @classmethod
+    def shared(
+        cls,
+        theme_config_path: Optional[Path] = None,
+        extensions: Optional[List[Union[str, "Extension"]]] = None,
+    ) -> "MarkdownToPDFConverter":
+        """Get a converter shared with other callers using the same settings.
+
+        Building a converter loads the theme and sets up the Markdown and CSS
+        pipeline. Callers converting many documents with the same settings can
+        share one instance instead. A converter is reused while any caller
+        still references it and the theme file is unchanged.
+
+        Args:
+            theme_config_path: Path to theme configuration file
+            extensions: Markdown extensions to use (strings or extension objects)
+
+        Returns:
+            MarkdownToPDFConverter for these settings
+        """
+        key = cls._shared_key(theme_config_path, extensions)
+        converter = cls._shared_instances.get(key)
+        if converter is None:
+            converter = cls(theme_config_path=theme_config_path, extensions=extensions)
+            cls._shared_instances[key] = converter
+        return converter
+
+    @staticmethod
+    def _shared_key(
+        theme_config_path: Optional[Path],
+        extensions: Optional[List[Union[str, "Extension"]]],
+    ) -> Tuple[Hashable, ...]:
+        """Build the shared() cache key, including the theme file's signature."""
+        theme_signature: Tuple[Hashable, ...] = ()
+        if theme_config_path is not None:
+            path = Path(theme_config_path)
+            try:
+                path_stat = path.stat()
+                theme_signature = (
+                    str(path.resolve()),
+                    path_stat.st_mtime_ns,
+                    path_stat.st_size,
+                )
+            except OSError:
+                theme_signature = (str(path),)
+        return (theme_signature, tuple(extensions or ()))
+
     def __init__(
         self,
         theme_config_path: Optional[Path] = None,
-        extensions: Optional[List[Union[str, Extension]]] = None,
+        extensions: Optional[List[Union[str, "Extension"]]] = None,
         base_css: Optional[str] = None,
-        template_manager: Optional[TemplateManager] = None,
+        template_manager: Optional["TemplateManager"] = None,
         template_dirs: Optional[List[str]] = None,
+        font_config: Optional[Any] = None,
     ):
         """Initialize the converter.
 
@@ -393,6 +571,7 @@ class MarkdownToPDFConverter:
             base_css: Base CSS for PDF styling
             template_manager: Template manager for custom components
             template_dirs: Directories to search for templates (if template_manager not provided)
+            font_config: WeasyPrint FontConfiguration shared with other converters
         """
         self.theme_config_path = theme_config_path
         self.theme_config = None
@@ -411,6 +590,9 @@ class MarkdownToPDFConverter:
                 print("   Continuing with default styling...")
 
         # Initialize template manager if not provided
+        if template_manager is None:
+            from .templating import TemplateManager
+
         if template_manager is None and template_dirs is not None:
             template_manager = TemplateManager(template_dirs)
         elif template_manager is None:
@@ -424,14 +606,14 @@ class MarkdownToPDFConverter:
 
         self.markdown_processor = MarkdownProcessor(extensions=processed_extensions)
         self.pdf_generator = PDFGenerator(
-            base_css=base_css, theme_config=self.theme_config
+            base_css=base_css, theme_config=self.theme_config, font_config=font_config
         )
 
     def _setup_extensions(
         self,
-        extensions: Optional[List[Union[str, Extension]]],
-        template_manager: TemplateManager,
-    ) -> List[Union[str, Extension]]:
+        extensions: Optional[List[Union[str, "Extension"]]],
+        template_manager: "TemplateManager",
+    ) -> List[Union[str, "Extension"]]:
         """Setup extensions with template manager integration."""
         if extensions is None:
             extensions = []
@@ -455,12 +637,15 @@ class MarkdownToPDFConverter:
 
         return processed_extensions
 
-    def convert_file(self, input_path: Path, output_path: Path) -> None:
+    def convert_file(
+        self, input_path: Path, output_path: Union[Path, BinaryIO]
+    ) -> None:
         """Convert a Markdown file to PDF.
 
         Args:
             input_path: Path to input Markdown file
-            output_path: Path where PDF should be saved
+            output_path: Path where PDF should be saved, or a writable binary
+                stream to write it to
 
         Raises:
             FileNotFoundError: If input file doesn't exist
@@ -478,7 +663,8 @@ class MarkdownToPDFConverter:
             # Generate PDF
             self.pdf_generator.generate_pdf(html_content, output_path, title)
 
-            print(f"✅ PDF generated: {output_path}")
+            if not _is_stream(output_path):
+                print(f"✅ PDF generated: {output_path}")
 
         except (
             FileNotFoundError,
@@ -493,13 +679,17 @@ class MarkdownToPDFConverter:
             raise PDFGenerationError(f"Unexpected error during conversion: {e}")
 
     def convert_string(
-        self, markdown_content: str, output_path: Path, title: str = "Generated PDF"
+        self,
+        markdown_content: str,
+        output_path: Union[Path, BinaryIO],
+        title: str = "Generated PDF",
     ) -> None:
         """Convert Markdown string to PDF.
 
         Args:
             markdown_content: Markdown content as string
-            output_path: Path where PDF should be saved
+            output_path: Path where PDF should be saved, or a writable binary
+                stream to write it to
             title: Document title
 
         Raises:
@@ -514,7 +704,8 @@ class MarkdownToPDFConverter:
             # Generate PDF
             self.pdf_generator.generate_pdf(html_content, output_path, title)
 
-            print(f"✅ PDF generated: {output_path}")
+            if not _is_stream(output_path):
+                print(f"✅ PDF generated: {output_path}")
 
         except (
             MarkdownProcessingError,
@@ -533,4 +724,4 @@ class MarkdownToPDFConverter:
         Returns:
             True if converter can be used, False otherwise
         """
-        return WEASYPRINT_AVAILABLE
+        return _load_weasyprint() is not None
@@ -5,11 +5,34 @@ This module converts theme.yaml configurations into CSS that can be used
 by WeasyPrint for PDF generation.
 """
 
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .config import ThemeConfig
 
+# @font-face format for each (lowercase) font file extension, defaulting to
+# truetype
+FONT_FORMATS_BY_SUFFIX = {
+    ".ttf": "truetype",
+    ".otf": "opentype",
+    ".woff": "woff",
+    ".woff2": "woff2",
+}
+
+
+@lru_cache(maxsize=None)
+def _css_property_name(property_name: str) -> str:
+    """Convert a theme property name to an interned CSS property name."""
+    # Convert underscore to hyphen for CSS
+    return sys.intern(property_name.replace("_", "-"))
+
+
+def _quoted_families(families: Iterable[str]) -> str:
+    """Format font families as a quoted, comma-separated CSS list."""
+    return ", ".join(f'"{family}"' for family in families)
+
 
 class CSSGenerator:
     """Generates CSS from theme configuration."""
@@ -65,20 +88,21 @@ class CSSGenerator:
         )
         css_rules.append(margin_rule)
 
-        page_css = "@page {\n"
+        buf = ["@page {\n"]
+        append = buf.append
         for rule in css_rules:
-            page_css += f"    {rule};\n"
-        page_css += "}"
+            append(f"    {rule};\n")
+        append("}\n\n")
 
         # Body default font
-        body_css = "body {\n"
         font = page_setup.default_font
-        body_css += f"    font-family: {', '.join(f'"{f}"' for f in font.family)};\n"
-        body_css += f"    font-size: {font.size};\n"
-        body_css += f"    color: {font.color};\n"
-        body_css += "}"
+        append("body {\n")
+        append(f"    font-family: {_quoted_families(font.family)};\n")
+        append(f"    font-size: {font.size};\n")
+        append(f"    color: {font.color};\n")
+        append("}")
 
-        return f"{page_css}\n\n{body_css}"
+        return "".join(buf)
 
     def _generate_font_css(self) -> str:
         """Generate @font-face declarations for custom fonts."""
@@ -130,18 +154,13 @@ class CSSGenerator:
         Returns:
             @font-face CSS rule
         """
+        path = Path(font_path)
+
         # Convert file path to URL format for CSS
-        font_url = Path(font_path).as_uri()
+        font_url = path.as_uri()
 
         # Determine font format from file extension
-        ext = Path(font_path).suffix.lower()
-        format_map = {
-            ".ttf": "truetype",
-            ".otf": "opentype",
-            ".woff": "woff",
-            ".woff2": "woff2",
-        }
-        font_format = format_map.get(ext, "truetype")
+        font_format = FONT_FORMATS_BY_SUFFIX.get(path.suffix.lower(), "truetype")
 
         return f"""@font-face {{
     font-family: "{family_name}";
@@ -152,20 +171,23 @@ class CSSGenerator:
 
     def _generate_element_styles(self) -> str:
         """Generate CSS for Markdown element styles."""
-        element_css = []
+        buf = []
+        append = buf.append
 
         for element, styles in self.theme_config.styles.items():
-            css_rule = f"{element} {{\n"
+            if buf:
+                append("\n\n")
+            append(element)
+            append(" {\n")
 
             for property_name, value in styles.items():
-                css_property = self._convert_property_name(property_name)
+                css_property = _css_property_name(property_name)
                 css_value = self._convert_property_value(property_name, value)
-                css_rule += f"    {css_property}: {css_value};\n"
+                append(f"    {css_property}: {css_value};\n")
 
-            css_rule += "}"
-            element_css.append(css_rule)
+            append("}")
 
-        return "\n\n".join(element_css)
+        return "".join(buf)
 
     def _convert_property_name(self, property_name: str) -> str:
         """Convert theme property name to CSS property name.
@@ -176,8 +198,7 @@ class CSSGenerator:
         Returns:
             CSS property name
         """
-        # Convert underscore to hyphen for CSS
-        return property_name.replace("_", "-")
+        return _css_property_name(property_name)
 
     def _convert_property_value(self, property_name: str, value: Any) -> str:
         """Convert theme property value to CSS value.
@@ -192,7 +213,7 @@ class CSSGenerator:
         if isinstance(value, list):
             # Handle font family lists
             if property_name == "font_family":
-                return ", ".join(f'"{font}"' for font in value)
+                return _quoted_families(value)
             else:
                 return ", ".join(str(v) for v in value)
         elif isinstance(value, (int, float)):
@@ -221,13 +242,14 @@ class CSSGenerator:
     def _generate_header_css(self, name: str, header_config) -> str:
         """Generate CSS for a specific header configuration."""
         css_rules = []
+        font_family = _quoted_families(header_config.font_family)
 
         # Header positioning and content
         if header_config.left:
             css_rules.append(f"""@page {{
     @top-left {{
         content: "{header_config.left}";
-        font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
+        font-family: {font_family};
         font-size: {header_config.font_size};
         color: {header_config.color};
     }}
@@ -237,7 +259,7 @@ class CSSGenerator:
             css_rules.append(f"""@page {{
     @top-center {{
         content: "{header_config.center}";
-        font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
+        font-family: {font_family};
         font-size: {header_config.font_size};
         color: {header_config.color};
     }}
@@ -247,7 +269,7 @@ class CSSGenerator:
             css_rules.append(f"""@page {{
     @top-right {{
         content: "{header_config.right}";
-        font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
+        font-family: {font_family};
         font-size: {header_config.font_size};
         color: {header_config.color};
     }}
@@ -267,13 +289,14 @@ class CSSGenerator:
     def _generate_footer_css(self, name: str, footer_config) -> str:
         """Generate CSS for a specific footer configuration."""
         css_rules = []
+        font_family = _quoted_families(footer_config.font_family)
 
         # Footer positioning and content
         if footer_config.left:
             css_rules.append(f"""@page {{
     @bottom-left {{
         content: "{footer_config.left}";
-        font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
+        font-family: {font_family};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
     }}
@@ -283,7 +306,7 @@ class CSSGenerator:
             css_rules.append(f"""@page {{
     @bottom-center {{
         content: "{footer_config.center}";
-        font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
+        font-family: {font_family};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
     }}
@@ -293,7 +316,7 @@ class CSSGenerator:
             css_rules.append(f"""@page {{
     @bottom-right {{
         content: "{footer_config.right}";
-        font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
+        font-family: {font_family};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
     }}
@@ -37,6 +37,23 @@ class CustomBlockProcessor(BlockProcessor):
     RE_FENCE_START = re.compile(r"^[ \t]*:::(\w+)(?:\s+(.*))?$", re.MULTILINE)
     RE_FENCE_END = re.compile(r"^[ \t]*:::[ \t]*$", re.MULTILINE)
 
+    # Tokens in the header line: key="value", key='value', key=value or a flag
+    RE_ATTRIBUTE = re.compile(
+        r"""
+        (?:
+            (\w+)=              # key=
+            (?:
+                "([^"]*)"       # "quoted value"
+                |'([^']*)'      # 'quoted value'
+                |(\S+)          # unquoted value
+            )
+        )
+        |
+        (\w+)                   # standalone flag/value
+    """,
+        re.VERBOSE,
+    )
+
     def __init__(self, parser, template_manager: Optional[TemplateManager] = None):
         """Initialize the processor with optional template manager."""
         super().__init__(parser)
@@ -44,11 +61,16 @@ class CustomBlockProcessor(BlockProcessor):
 
     def test(self, parent, block):
         """Test if this block should be processed by this processor."""
+        # Most blocks are ordinary Markdown; reject them without splitting the
+        # block or running the regex
+        if not block.lstrip().startswith(":::"):
+            return False
+
         # Check if the block starts with our custom block syntax
         lines = block.split("\n")
         for line in lines:
             if line.strip():  # First non-empty line
-                return bool(re.match(r"^[ \t]*:::(\w+)(?:\s+.*)?$", line))
+                return bool(self.RE_FENCE_START.match(line))
         return False
 
     def run(self, parent, blocks):
@@ -57,26 +79,22 @@ class CustomBlockProcessor(BlockProcessor):
 
         # Find the opening fence line
         lines = original_block.split("\n")
-        opening_line = None
+        match = None
         opening_line_idx = -1
 
         for i, line in enumerate(lines):
             if line.strip():  # First non-empty line
-                match = re.match(r"^[ \t]*:::(\w+)(?:\s+(.*))?$", line)
+                match = self.RE_FENCE_START.match(line)
                 if match:
-                    opening_line = line
                     opening_line_idx = i
                     break
                 else:
                     return False  # Not a custom block
 
-        if opening_line is None:
+        if match is None:
             return False
 
         # Extract component name and attributes
-        match = re.match(r"^[ \t]*:::(\w+)(?:\s+(.*))?$", opening_line)
-        if not match:
-            return False
         component_name = match.group(1)
         attributes_str = match.group(2) or ""
 
@@ -87,7 +105,7 @@ class CustomBlockProcessor(BlockProcessor):
         # First, check if there's a closing fence in the current block
         remaining_lines = lines[opening_line_idx + 1 :]
         for i, line in enumerate(remaining_lines):
-            if re.match(r"^[ \t]*:::[ \t]*$", line):
+            if self.RE_FENCE_END.match(line):
                 closing_fence_found = True
                 # Put any content after the fence back into blocks
                 if i + 1 < len(remaining_lines):
@@ -113,7 +131,7 @@ class CustomBlockProcessor(BlockProcessor):
                 # Check for closing fence in this block
                 fence_line_idx = -1
                 for line_idx, line in enumerate(block_lines):
-                    if re.match(r"^[ \t]*:::[ \t]*$", line):
+                    if self.RE_FENCE_END.match(line):
                         fence_line_idx = line_idx
                         break
 
@@ -188,27 +206,9 @@ class CustomBlockProcessor(BlockProcessor):
         if not attributes_str:
             return attributes
 
-        # Simple regex to parse key="value" and standalone values
-        # This is a simplified parser - could be made more robust
-        token_pattern = re.compile(
-            r"""
-            (?:
-                (\w+)=              # key=
-                (?:
-                    "([^"]*)"       # "quoted value"
-                    |'([^']*)'      # 'quoted value'  
-                    |(\S+)          # unquoted value
-                )
-            )
-            |
-            (\w+)                   # standalone flag/value
-        """,
-            re.VERBOSE,
-        )
-
         positional_args = []
 
-        for match in token_pattern.finditer(attributes_str):
+        for match in self.RE_ATTRIBUTE.finditer(attributes_str):
             key, quoted_val, single_quoted_val, unquoted_val, standalone = (
                 match.groups()
             )
@@ -234,27 +234,15 @@ class CustomBlockProcessor(BlockProcessor):
 
         lines = content.split("\n")
 
-        # Find minimum indentation (ignoring empty lines)
-        min_indent = float("inf")
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                indent = len(line) - len(line.lstrip())
-                min_indent = min(min_indent, indent)
-
-        if min_indent == float("inf"):
-            min_indent = 0
-
-        # Remove the minimum indentation from all lines
-        dedented_lines = []
-        for line in lines:
-            if line.strip():  # Non-empty line
-                dedented_lines.append(
-                    line[min_indent:] if len(line) > min_indent else line
-                )
-            else:  # Empty line
-                dedented_lines.append("")
-
-        return "\n".join(dedented_lines).strip()
+        # Remove the minimum indentation of the non-empty lines; whitespace-only
+        # lines become empty
+        min_indent = min(
+            (len(line) - len(line.lstrip()) for line in lines if line.strip()),
+            default=0,
+        )
+        return "\n".join(
+            line[min_indent:] if line.strip() else "" for line in lines
+        ).strip()
 
     def _create_element(
         self, parent, component_name: str, attributes: Dict[str, Any], content: str
@@ -5,9 +5,12 @@ This module handles dynamic content in headers/footers, variable substitution,
 and document metadata extraction for professional PDF output.
 """
 
+import hashlib
 import re
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:
     from bs4 import BeautifulSoup
@@ -16,8 +19,111 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# BeautifulSoup tree builder: lxml is much faster than the stdlib html.parser
+BS4_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Selects all headings in document order in a single lxml call
+HEADING_XPATH = "//h1|//h2|//h3|//h4|//h5|//h6"
+
+if LXML_AVAILABLE:
+    # XPath expressions compiled once instead of on every document
+    _select_headings = etree.XPath(HEADING_XPATH)
+    _select_first_h1 = etree.XPath("(//h1)[1]")
+    _select_first_title = etree.XPath("(//title)[1]")
+    _select_first_meta = etree.XPath("(//meta[@name=$name])[1]")
+
 from .config import ThemeConfig
 
+# Matches {variable_name} placeholders in header/footer templates
+VARIABLE_PATTERN = re.compile(r"\{([^}]+)\}")
+
+# Sentinel for lookups where None is a valid value
+_MISSING = object()
+
+# Number of documents whose extracted metadata/sections are kept in memory
+HTML_CACHE_SIZE = 32
+
+
+def _parse_lxml(html_content: str) -> Optional["etree._Element"]:
+    """Parse HTML into an lxml tree shared by metadata and section extraction.
+
+    Returns:
+        Root element, or None if lxml is missing, the content is blank or
+        lxml could not parse it
+    """
+    if not LXML_AVAILABLE or not html_content.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html_content)
+    except (ValueError, etree.ParserError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> Tuple[str, Tuple[str, ...]]:
+    """Split a header/footer template into literal text and placeholders.
+
+    The template is scanned once; resolving it later only looks up the
+    placeholder values and fills them into a positional format string.
+
+    Args:
+        template: Template string with {variable} placeholders
+
+    Returns:
+        Tuple of (format string with positional fields, raw placeholder names)
+    """
+    pieces = []
+    names = []
+    position = 0
+    for match in VARIABLE_PATTERN.finditer(template):
+        literal = template[position : match.start()]
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        pieces.append(f"{{{len(names)}}}")
+        names.append(match.group(1))
+        position = match.end()
+    pieces.append(template[position:].replace("{", "{{").replace("}", "}}"))
+    return "".join(pieces), tuple(names)
+
+
+def _content_key(html_content: str) -> bytes:
+    """Hash HTML content into a compact cache key."""
+    return hashlib.blake2b(
+        html_content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+class _ContentCache:
+    """Small LRU cache of per-document results keyed by content hash."""
+
+    def __init__(self, maxsize: int = HTML_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    def get(self, key: bytes) -> Any:
+        """Get a cached result, marking it as recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store a result, evicting the least recently used one if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 
 class Section:
     """Represents a document section for header/footer context."""
@@ -88,6 +194,16 @@ class VariableResolver:
         """
         self._resolvers[name] = resolver_func
 
+    def precompile_templates(self, templates: Iterable[str]) -> None:
+        """Prepare templates ahead of time so later resolution skips analysis.
+
+        Args:
+            templates: Template strings that will be resolved repeatedly
+        """
+        for template in templates:
+            if template and "{" in template:
+                _compile_template(template)
+
     def resolve_variables(self, template: str, context: Dict[str, Any]) -> str:
         """Replace variables in template with actual values.
 
@@ -98,44 +214,89 @@ class VariableResolver:
         Returns:
             Template with variables replaced by actual values
         """
-        if not template:
+        lookup = _VariableLookup(lambda name: self._resolve_variable(name, context))
+        return self._substitute(template, lookup)
+
+    def resolve_all(
+        self, templates: Sequence[str], context: Dict[str, Any]
+    ) -> List[str]:
+        """Replace variables in several templates sharing the same context.
+
+        Used to resolve all header/footer slots of a page in one sweep: each
+        variable is resolved at most once for the whole batch.
+
+        Args:
+            templates: Template strings with {variable} placeholders
+            context: Context dictionary with variable values
+
+        Returns:
+            Templates with variables replaced, in the same order
+        """
+        lookup = _VariableLookup(lambda name: self._resolve_variable(name, context))
+        return [self._substitute(template, lookup) for template in templates]
+
+    def _substitute(self, template: str, lookup: "_VariableLookup") -> str:
+        """Replace the placeholders of a single template using lookup."""
+        if not template or "{" not in template:
+            return template
+
+        format_string, names = _compile_template(template)
+        if not names:
             return template
+        return format_string.format(*[lookup[name] for name in names])
 
-        # Find all variable patterns like {variable_name}
-        variable_pattern = r"\{([^}]+)\}"
+    def _resolve_variable(self, raw_name: str, context: Dict[str, Any]) -> str:
+        """Resolve a single placeholder, returning it unchanged if unknown.
 
-        def replace_variable(match):
-            var_name = match.group(1).strip()
+        Args:
+            raw_name: Text between the braces of the placeholder
+            context: Context dictionary with variable values
+
+        Returns:
+            Resolved value, or the original placeholder text
+        """
+        var_name = raw_name.strip()
+
+        # Check if we have a resolver for this variable
+        if var_name in self._resolvers:
+            try:
+                return self._resolvers[var_name](context)
+            except Exception as e:
+                # Log warning but don't break the processing
+                print(f"Warning: Failed to resolve variable '{var_name}': {e}")
+                return "{" + raw_name + "}"  # Return original text
+
+        # Check if variable is directly in context
+        if var_name in context:
+            return str(context[var_name])
+
+        # Check for nested context (e.g., custom_variables.company)
+        if "." in var_name:
+            value: Any = context
+            for part in var_name.split("."):
+                if not isinstance(value, dict):
+                    break
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
+                    break
+            else:
+                return str(value)
 
-            # Check if we have a resolver for this variable
-            if var_name in self._resolvers:
-                try:
-                    return self._resolvers[var_name](context)
-                except Exception as e:
-                    # Log warning but don't break the processing
-                    print(f"Warning: Failed to resolve variable '{var_name}': {e}")
-                    return match.group(0)  # Return original text
+        # Variable not found - return original text with warning
+        print(f"Warning: Unknown variable '{var_name}' in template")
+        return "{" + raw_name + "}"
 
-            # Check if variable is directly in context
-            if var_name in context:
-                return str(context[var_name])
 
-            # Check for nested context (e.g., custom_variables.company)
-            if "." in var_name:
-                parts = var_name.split(".")
-                value = context
-                try:
-                    for part in parts:
-                        value = value[part]
-                    return str(value)
-                except (KeyError, TypeError):
-                    pass
+class _VariableLookup(dict):
+    """Mapping for str.format_map that resolves placeholders on first use."""
 
-            # Variable not found - return original text with warning
-            print(f"Warning: Unknown variable '{var_name}' in template")
-            return match.group(0)
+    def __init__(self, resolve: Callable[[str], str]):
+        super().__init__()
+        self._resolve = resolve
 
-        return re.sub(variable_pattern, replace_variable, template)
+    def __missing__(self, key: str) -> str:
+        value = self[key] = self._resolve(key)
+        return value
 
 
 class SectionTracker:
@@ -145,22 +306,103 @@ class SectionTracker:
         """Initialize section tracker."""
         self.sections: List[Section] = []
         self._current_page = 1
-
-    def extract_sections(self, html_content: str) -> List[Section]:
+        self._sections_cache = _ContentCache()
+
+    def extract_sections(
+        self,
+        html_content: str,
+        soup: Optional["BeautifulSoup"] = None,
+        tree: Optional["etree._Element"] = None,
+    ) -> List[Section]:
         """Extract section information from HTML content.
 
+        Headings are collected with a single lxml XPath query when lxml is
+        installed, falling back to BeautifulSoup and then to regex. Results
+        are cached by content hash, so extracting sections from the same HTML
+        again does not re-parse it.
+
         Args:
             html_content: HTML content to analyze
+            soup: Already parsed tree of html_content, used by the
+                BeautifulSoup fallback to avoid parsing it again
+            tree: Already parsed lxml tree of html_content, to avoid
+                parsing it again
 
         Returns:
             List of Section objects representing document structure
         """
-        if not BS4_AVAILABLE:
-            # Fallback: simple regex-based extraction
-            return self._extract_sections_regex(html_content)
+        key = _content_key(html_content)
+        sections = self._sections_cache.get(key)
+
+        if sections is None and LXML_AVAILABLE:
+            sections = self._extract_sections_lxml(html_content, tree)
+        if sections is None:
+            if BS4_AVAILABLE:
+                sections = self._extract_sections_soup(html_content, soup)
+            else:
+                # Fallback: simple regex-based extraction
+                sections = self._extract_sections_regex(html_content)
+        self._sections_cache.put(key, sections)
+
+        self.sections = list(sections)
+        return self.sections
+
+    def is_cached(self, html_content: str) -> bool:
+        """Check whether sections for this HTML content are already cached."""
+        return _content_key(html_content) in self._sections_cache
+
+    def _extract_sections_lxml(
+        self, html_content: str, tree: Optional["etree._Element"] = None
+    ) -> Optional[List[Section]]:
+        """Extract sections with a single lxml XPath query.
+
+        Args:
+            html_content: HTML content to analyze
+            tree: Already parsed lxml tree of html_content
+
+        Returns:
+            List of Section objects, or None if lxml could not parse the content
+        """
+        if not html_content.strip():
+            return []
+
+        if tree is None:
+            tree = _parse_lxml(html_content)
+            if tree is None:
+                return None
+
+        # Index over all headings (including empty ones) to match the page
+        # estimate used by the other extraction paths
+        sections = [
+            Section(int(heading.tag[1]), title, max(1, i // 3 + 1))
+            for i, heading in enumerate(_select_headings(tree))
+            if (title := heading.text_content().strip())
+        ]
+
+        # Set end pages for sections
+        for i, section in enumerate(sections):
+            if i + 1 < len(sections):
+                section.end_page = sections[i + 1].start_page - 1
+            else:
+                section.end_page = None  # Last section goes to end of document
+
+        return sections
+
+    def _extract_sections_soup(
+        self, html_content: str, soup: Optional["BeautifulSoup"] = None
+    ) -> List[Section]:
+        """Extract sections by walking the BeautifulSoup tree.
+
+        Args:
+            html_content: HTML content to analyze
+            soup: Already parsed tree of html_content, to avoid parsing it again
 
+        Returns:
+            List of Section objects
+        """
         # Use BeautifulSoup for robust HTML parsing
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = BeautifulSoup(html_content, BS4_PARSER)
         sections = []
 
         # Find all heading elements H1-H6
@@ -187,7 +429,6 @@ class SectionTracker:
             else:
                 section.end_page = None  # Last section goes to end of document
 
-        self.sections = sections
         return sections
 
     def _extract_sections_regex(self, html_content: str) -> List[Section]:
@@ -225,7 +466,6 @@ class SectionTracker:
             else:
                 section.end_page = None
 
-        self.sections = sections
         return sections
 
     def get_section_context(self, page_number: int) -> Dict[str, str]:
@@ -281,12 +521,63 @@ class PageProcessor:
         self.variable_resolver = VariableResolver()
         self.section_tracker = SectionTracker()
         self._document_metadata: Dict[str, Any] = {}
+        self._metadata_cache = _ContentCache()
+        self._paged_css_cache = _ContentCache()
+
+        # Compile header/footer templates once for the lifetime of the theme
+        self.variable_resolver.precompile_templates(
+            template
+            for configs in (theme_config.page_headers, theme_config.page_footers)
+            for config in configs.values()
+            for template in (config.left, config.center, config.right)
+        )
 
-    def extract_document_metadata(self, html_content: str) -> Dict[str, Any]:
+    def extract_document_metadata(
+        self,
+        html_content: str,
+        soup: Optional["BeautifulSoup"] = None,
+        tree: Optional["etree._Element"] = None,
+    ) -> Dict[str, Any]:
         """Extract metadata from HTML content.
 
+        Results are cached by content hash, so extracting metadata from the
+        same HTML again does not re-parse it.
+
         Args:
             html_content: HTML content to analyze
+            soup: Already parsed tree of html_content, to avoid parsing it again
+            tree: Already parsed lxml tree of html_content, to avoid parsing
+                it again
+
+        Returns:
+            Dictionary with document metadata
+        """
+        key = _content_key(html_content)
+        metadata = self._metadata_cache.get(key)
+
+        if metadata is None:
+            metadata = self._extract_metadata(html_content, soup, tree)
+            self._metadata_cache.put(key, metadata)
+
+        self._document_metadata = dict(metadata)
+        return dict(metadata)
+
+    def _extract_metadata(
+        self,
+        html_content: str,
+        soup: Optional["BeautifulSoup"] = None,
+        tree: Optional["etree._Element"] = None,
+    ) -> Dict[str, Any]:
+        """Extract metadata from HTML content without caching.
+
+        Uses lxml when it is installed, falling back to BeautifulSoup and
+        then to regex.
+
+        Args:
+            html_content: HTML content to analyze
+            soup: Already parsed tree of html_content, to avoid parsing it again
+            tree: Already parsed lxml tree of html_content, to avoid parsing
+                it again
 
         Returns:
             Dictionary with document metadata
@@ -297,12 +588,18 @@ class PageProcessor:
             "total_pages": 1,  # Will be updated during PDF generation
         }
 
+        if tree is None and soup is None:
+            tree = _parse_lxml(html_content)
+        if tree is not None:
+            return self._extract_metadata_lxml(tree, metadata)
+
         if not BS4_AVAILABLE:
             # Fallback: simple regex-based extraction
             return self._extract_metadata_regex(html_content, metadata)
 
         # Use BeautifulSoup for robust parsing
-        soup = BeautifulSoup(html_content, "html.parser")
+        if soup is None:
+            soup = BeautifulSoup(html_content, BS4_PARSER)
 
         # Extract title from first H1 or title tag
         title_element = soup.find("h1") or soup.find("title")
@@ -328,7 +625,33 @@ class PageProcessor:
             ):
                 metadata[meta_name] = meta_tag.attrs["content"].strip()
 
-        self._document_metadata = metadata
+        return metadata
+
+    def _extract_metadata_lxml(
+        self, tree: "etree._Element", metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Extract metadata from a parsed lxml tree.
+
+        Args:
+            tree: Parsed lxml tree of the HTML content
+            metadata: Existing metadata dictionary to update
+
+        Returns:
+            Updated metadata dictionary
+        """
+        # Extract title from first H1 or title tag
+        title_elements = _select_first_h1(tree) or _select_first_title(tree)
+        if title_elements:
+            metadata["title"] = title_elements[0].text_content().strip()
+
+        # Extract author and other meta information from the first meta tag
+        # with each name
+        for meta_name in ["author", "description", "keywords", "subject"]:
+            meta_tags = _select_first_meta(tree, name=meta_name)
+            content = meta_tags[0].get("content") if meta_tags else None
+            if content:
+                metadata[meta_name] = content.strip()
+
         return metadata
 
     def _extract_metadata_regex(
@@ -372,17 +695,19 @@ class PageProcessor:
         Returns:
             Enhanced HTML with processed headers/footers
         """
-        # Extract document metadata and sections
-        self.extract_document_metadata(html_content)
-        self.section_tracker.extract_sections(html_content)
-
-        # Build variable context
-        context = self._build_variable_context()
-
-        # Process headers and footers in theme configuration
-        # This will be used by the CSS generator for @page rules
-        # The actual processing happens in the CSS generation phase
-
+        # Extract document metadata and sections from a single parse shared by
+        # both, skipping the parse when both results are already cached
+        soup = tree = None
+        metadata_cached = _content_key(html_content) in self._metadata_cache
+        if not (metadata_cached and self.section_tracker.is_cached(html_content)):
+            tree = _parse_lxml(html_content)
+            if tree is None and BS4_AVAILABLE:
+                soup = BeautifulSoup(html_content, BS4_PARSER)
+        self.extract_document_metadata(html_content, soup, tree)
+        self.section_tracker.extract_sections(html_content, soup, tree)
+
+        # The variable context is built when generate_paged_media_css() renders
+        # the @page rules, so the HTML is returned as-is without serializing
         return html_content  # HTML content unchanged, CSS handles headers/footers
 
     def _build_variable_context(self, page_number: int = 1) -> Dict[str, Any]:
@@ -416,46 +741,79 @@ class PageProcessor:
     def generate_paged_media_css(self) -> str:
         """Generate CSS Paged Media rules with variables.
 
+        The generated CSS is cached, keyed by the header/footer configurations,
+        the variable context, registered resolvers and the current date, so
+        repeated calls for the same document are served without re-rendering.
+
         Returns:
             CSS string with enhanced @page rules for headers/footers
         """
+        # Build sample context for variable processing
+        context = self._build_variable_context()
+
+        key = _content_key(
+            repr(
+                (
+                    self.theme_config.page_headers,
+                    self.theme_config.page_footers,
+                    context,
+                    self.variable_resolver._resolvers,
+                    date.today(),
+                )
+            )
+        )
+        css = self._paged_css_cache.get(key)
+        if css is not None:
+            return css
+
         css_parts = []
 
         # Process each header/footer configuration
         for name, header_config in self.theme_config.page_headers.items():
             if any([header_config.left, header_config.center, header_config.right]):
-                css_parts.append(self._generate_header_css(name, header_config))
+                css_parts.append(
+                    self._generate_header_css(name, header_config, context)
+                )
 
         for name, footer_config in self.theme_config.page_footers.items():
             if any([footer_config.left, footer_config.center, footer_config.right]):
-                css_parts.append(self._generate_footer_css(name, footer_config))
+                css_parts.append(
+                    self._generate_footer_css(name, footer_config, context)
+                )
 
-        return "\n\n".join(filter(None, css_parts))
+        css = "\n\n".join(filter(None, css_parts))
+        self._paged_css_cache.put(key, css)
+        return css
 
-    def _generate_header_css(self, name: str, header_config) -> str:
+    def _generate_header_css(
+        self, name: str, header_config, context: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Generate CSS for a specific header configuration with variables.
 
         Args:
             name: Header configuration name
             header_config: Header configuration object
+            context: Variable context, built from the document if None
 
         Returns:
             CSS string for header
         """
-        # Build sample context for variable processing
-        context = self._build_variable_context()
+        if context is None:
+            context = self._build_variable_context()
 
         css_rules = []
         page_selector = f"@page {name}" if name != "default" else "@page"
 
-        # Process header content with variables
+        # Process header content with variables, all slots in one sweep
+        slots = [header_config.left, header_config.center, header_config.right]
+        left_content, center_content, right_content = (
+            self.variable_resolver.resolve_all(slots, context)
+        )
+
         if header_config.left:
-            content = self.variable_resolver.resolve_variables(
-                header_config.left, context
-            )
             css_rules.append(f"""{page_selector} {{
     @top-left {{
-        content: "{content}";
+        content: "{left_content}";
         font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
         font-size: {header_config.font_size};
         color: {header_config.color};
@@ -463,12 +821,9 @@ class PageProcessor:
 }}""")
 
         if header_config.center:
-            content = self.variable_resolver.resolve_variables(
-                header_config.center, context
-            )
             css_rules.append(f"""{page_selector} {{
     @top-center {{
-        content: "{content}";
+        content: "{center_content}";
         font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
         font-size: {header_config.font_size};
         color: {header_config.color};
@@ -476,12 +831,9 @@ class PageProcessor:
 }}""")
 
         if header_config.right:
-            content = self.variable_resolver.resolve_variables(
-                header_config.right, context
-            )
             css_rules.append(f"""{page_selector} {{
     @top-right {{
-        content: "{content}";
+        content: "{right_content}";
         font-family: {", ".join(f'"{f}"' for f in header_config.font_family)};
         font-size: {header_config.font_size};
         color: {header_config.color};
@@ -499,30 +851,35 @@ class PageProcessor:
 
         return "\n\n".join(css_rules)
 
-    def _generate_footer_css(self, name: str, footer_config) -> str:
+    def _generate_footer_css(
+        self, name: str, footer_config, context: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Generate CSS for a specific footer configuration with variables.
 
         Args:
             name: Footer configuration name
             footer_config: Footer configuration object
+            context: Variable context, built from the document if None
 
         Returns:
             CSS string for footer
         """
-        # Build sample context for variable processing
-        context = self._build_variable_context()
+        if context is None:
+            context = self._build_variable_context()
 
         css_rules = []
         page_selector = f"@page {name}" if name != "default" else "@page"
 
-        # Process footer content with variables
+        # Process footer content with variables, all slots in one sweep
+        slots = [footer_config.left, footer_config.center, footer_config.right]
+        left_content, center_content, right_content = (
+            self.variable_resolver.resolve_all(slots, context)
+        )
+
         if footer_config.left:
-            content = self.variable_resolver.resolve_variables(
-                footer_config.left, context
-            )
             css_rules.append(f"""{page_selector} {{
     @bottom-left {{
-        content: "{content}";
+        content: "{left_content}";
         font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
@@ -530,12 +887,9 @@ class PageProcessor:
 }}""")
 
         if footer_config.center:
-            content = self.variable_resolver.resolve_variables(
-                footer_config.center, context
-            )
             css_rules.append(f"""{page_selector} {{
     @bottom-center {{
-        content: "{content}";
+        content: "{center_content}";
         font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
@@ -543,12 +897,9 @@ class PageProcessor:
 }}""")
 
         if footer_config.right:
-            content = self.variable_resolver.resolve_variables(
-                footer_config.right, context
-            )
             css_rules.append(f"""{page_selector} {{
     @bottom-right {{
-        content: "{content}";
+        content: "{right_content}";
         font-family: {", ".join(f'"{f}"' for f in footer_config.font_family)};
         font-size: {footer_config.font_size};
         color: {footer_config.color};
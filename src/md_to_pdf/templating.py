@@ -8,23 +8,80 @@ This module provides the TemplateManager class that handles:
 - HTML generation for custom components
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+)
 from markupsafe import Markup
 
 
+# Component attributes passed through as-is instead of as data-* attributes
+_HTML_ATTRIBUTES = frozenset(["class", "id", "style"])
+
+
+def _escape_quotes(value: Any) -> str:
+    """Escape double quotes so a value fits in a double-quoted HTML attribute."""
+    return str(value).replace('"', "&quot;")
+
+
+def _css_class_filter(value: str) -> str:
+    """Convert a string to a valid CSS class name."""
+    return value.lower().replace("_", "-").replace(" ", "-")
+
+
+def _attr_string_filter(attrs: Dict[str, Any]) -> Markup:
+    """Convert a dictionary of attributes to an HTML attribute string."""
+    if not attrs:
+        return Markup("")
+
+    # Boolean attributes (e.g., disabled, checked) render as the bare key;
+    # False and None drop the attribute
+    attr_parts = [
+        key if value is True else f'{key}="{_escape_quotes(value)}"'
+        for key, value in attrs.items()
+        if value is not False and value is not None
+    ]
+
+    return Markup(" " + " ".join(attr_parts) if attr_parts else "")
+
+
+@lru_cache(maxsize=1)
+def _default_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Get the on-disk cache for compiled templates, shared by all managers.
+
+    Jinja2 stores it in a per-user directory under the system temp directory
+    and keys entries on the template source, so edited templates recompile.
+
+    Returns:
+        The bytecode cache, or None if no safe cache directory is available
+    """
+    try:
+        return FileSystemBytecodeCache(pattern="md_to_pdf_%s.cache")
+    except (OSError, RuntimeError):
+        return None
+
+
 class TemplateManager:
     """Manages Jinja2 templates for custom components."""
 
-    def __init__(self, template_dirs: Optional[List[str]] = None):
+    def __init__(
+        self, template_dirs: Optional[List[str]] = None, auto_reload: bool = False
+    ):
         """
         Initialize the template manager.
 
         Args:
             template_dirs: List of directories to search for templates.
                           If None, uses default 'templates' directory.
+            auto_reload: Whether to check template files for changes on every
+                          render. Leave off unless templates are edited while
+                          the manager is in use.
         """
         if template_dirs is None:
             # Default to templates directory in project root
@@ -41,8 +98,14 @@ class TemplateManager:
             autoescape=True,  # Auto-escape HTML for security
             trim_blocks=True,  # Remove newlines after block tags
             lstrip_blocks=True,  # Remove leading whitespace before blocks
+            auto_reload=auto_reload,  # Compiled templates are reused without a stat
+            cache_size=-1,  # Never evict compiled templates
+            bytecode_cache=_default_bytecode_cache(),  # Reuse across processes
         )
 
+        # Compile each distinct template string once instead of on every render
+        self._from_string = lru_cache(maxsize=256)(self.env.from_string)
+
         # Add custom filters
         self._setup_custom_filters()
 
@@ -54,31 +117,8 @@ class TemplateManager:
 
     def _setup_custom_filters(self):
         """Set up custom Jinja2 filters for template processing."""
-
-        def css_class_filter(value: str) -> str:
-            """Convert a string to a valid CSS class name."""
-            return value.lower().replace("_", "-").replace(" ", "-")
-
-        def attr_string_filter(attrs: Dict[str, Any]) -> Markup:
-            """Convert a dictionary of attributes to an HTML attribute string."""
-            if not attrs:
-                return Markup("")
-
-            attr_parts = []
-            for key, value in attrs.items():
-                if value is True:
-                    # Boolean attribute (e.g., disabled, checked)
-                    attr_parts.append(key)
-                elif value is not False and value is not None:
-                    # Regular attribute with value
-                    escaped_value = str(value).replace('"', "&quot;")
-                    attr_parts.append(f'{key}="{escaped_value}"')
-
-            return Markup(" " + " ".join(attr_parts) if attr_parts else "")
-
-        # Register filters
-        self.env.filters["css_class"] = css_class_filter
-        self.env.filters["attr_string"] = attr_string_filter
+        self.env.filters["css_class"] = _css_class_filter
+        self.env.filters["attr_string"] = _attr_string_filter
 
     def _discover_templates(self):
         """Discover available component templates and register them."""
@@ -162,14 +202,12 @@ class TemplateManager:
 
     def _build_data_attributes(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Build data attributes for the component."""
-        data_attrs = {}
-
-        # Convert certain attributes to data attributes
-        for key, value in attributes.items():
-            if key not in ["class", "id", "style"]:  # Skip standard HTML attributes
-                data_attrs[f"data-{key.replace('_', '-')}"] = value
-
-        return data_attrs
+        # Convert all but the standard HTML attributes to data attributes
+        return {
+            f"data-{key.replace('_', '-')}": value
+            for key, value in attributes.items()
+            if key not in _HTML_ATTRIBUTES
+        }
 
     def render_component(
         self, component_name: str, attributes: Dict[str, Any], content: str = ""
@@ -215,7 +253,7 @@ class TemplateManager:
         Returns:
             Rendered HTML string
         """
-        template = self.env.from_string(template_string)
+        template = self._from_string(template_string)
         return template.render(**context)
 
     def add_template_directory(self, template_dir: str):
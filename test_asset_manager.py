@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Test script for asset management system."""
 
+import os
 import sys
 import tempfile
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from md_to_pdf.assets import AssetManager, AssetNotFoundError, AssetResolver
 
@@ -54,32 +54,39 @@ def test_asset_manager():
         manager = AssetManager()
 
         # Test asset resolution with existing file
-        try:
-            asset_info = manager.resolve_asset(str(temp_path))
-            print(f"✅ Asset resolved: {asset_info.original_path}")
-            print(f"   Type: {asset_info.asset_type}")
-            print(f"   Size: {asset_info.size} bytes")
-            print(f"   Valid: {asset_info.is_valid}")
-        except Exception as e:
-            print(f"❌ Failed to resolve existing asset: {e}")
-            return False
-
-        # Test asset resolution with non-existing file
-        try:
-            manager.resolve_asset("non_existent_file.png")
-            print("❌ Should have failed for non-existent file")
-            return False
-        except AssetNotFoundError:
-            print("✅ Correctly failed for non-existent file")
-        except Exception as e:
-            print(f"❌ Unexpected error for non-existent file: {e}")
-            return False
+        asset_info = manager.resolve_asset(str(temp_path))
+        print(f"✅ Asset resolved: {asset_info.original_path}")
+        print(f"   Type: {asset_info.asset_type}")
+        print(f"   Size: {asset_info.size} bytes")
+        print(f"   Valid: {asset_info.is_valid}")
+
+        # Test asset resolution with non-existing file, then the cached failure
+        for _ in range(2):
+            with pytest.raises(AssetNotFoundError):
+                manager.resolve_asset("non_existent_file.png")
+        print("✅ Correctly failed (twice) for non-existent file")
 
         # Test cache functionality
         cache_stats = manager.get_cache_stats()
         print(f"✅ Cache stats: {cache_stats}")
-
-        return True
+        assert cache_stats["missing_assets"] == 1, "Failed lookup was not cached"
+
+        manager.clear_cache()
+        assert (
+            manager.get_cache_stats()["missing_assets"] == 0
+        ), "clear_cache() kept the cached failure"
+
+        # A file created after a cached miss is found by the same manager
+        late_path = temp_path.with_name(temp_path.stem + "_late.png")
+        with pytest.raises(AssetNotFoundError):
+            manager.resolve_asset(str(late_path))
+        late_path.write_bytes(b"late")
+        try:
+            asset_info = manager.resolve_asset(str(late_path))
+            assert asset_info.resolved_path == late_path.resolve()
+            print(f"✅ File created after a cached miss resolved: {late_path.name}")
+        finally:
+            late_path.unlink()
 
     finally:
         # Clean up temp file
@@ -101,32 +108,35 @@ def test_asset_copying():
                 temp_file.write(f"Test content {i}")
                 test_files.append(Path(temp_file.name))
 
+        # Same contents as the first file, should reuse its copy
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix="_test_dup.txt", delete=False
+        ) as temp_file:
+            temp_file.write("Test content 0")
+            test_files.append(Path(temp_file.name))
+
         manager = AssetManager()
         asset_paths = [str(f) for f in test_files]
 
         # Test copying assets
-        try:
-            asset_map = manager.copy_assets_to_temp(asset_paths)
-            print(f"✅ Copied {len(asset_map)} assets to temp directory")
-
-            # Verify copied files exist
-            for original, copied in asset_map.items():
-                if Path(copied).exists():
-                    print(f"✅ Copied file exists: {Path(copied).name}")
-                else:
-                    print(f"❌ Copied file missing: {copied}")
-                    return False
-
-            # Test cleanup
-            manager.cleanup_temp_assets()
-            cache_stats = manager.get_cache_stats()
-            print(f"✅ Cleanup completed. Temp dirs: {cache_stats['temp_directories']}")
-
-            return True
-
-        except Exception as e:
-            print(f"❌ Asset copying failed: {e}")
-            return False
+        asset_map = manager.copy_assets_to_temp(asset_paths)
+        print(f"✅ Copied {len(asset_map)} assets to temp directory")
+
+        # Verify copied files exist
+        for copied in asset_map.values():
+            assert Path(copied).exists(), f"Copied file missing: {copied}"
+            print(f"✅ Copied file exists: {Path(copied).name}")
+
+        # Verify identical contents are only copied once
+        copies = [asset_map[path] for path in asset_paths]
+        assert copies[0] == copies[2], f"Duplicate not reused: {copies}"
+        assert copies[0] != copies[1], f"Distinct assets share a copy: {copies}"
+        print("✅ Identical assets share a single copy")
+
+        # Test cleanup
+        manager.cleanup_temp_assets()
+        cache_stats = manager.get_cache_stats()
+        print(f"✅ Cleanup completed. Temp dirs: {cache_stats['temp_directories']}")
 
     finally:
         # Clean up test files
@@ -135,6 +145,48 @@ def test_asset_copying():
                 test_file.unlink()
 
 
+def test_asset_copy_deduplication_safety():
+    """Test deduplicated copies always hold the referencing asset's contents."""
+    print("\n🔍 Testing asset copy deduplication safety...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        manager = AssetManager()
+
+        # A file rewritten in place with the same size must be hashed again
+        first = root / "a.png"
+        second = root / "b.png"
+        first.write_bytes(b"XXXX")
+        second.write_bytes(b"XXXX")
+        manager.copy_assets_to_temp([str(first), str(second)])
+
+        second.write_bytes(b"YYYY")
+        stat = second.stat()
+        os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        asset_map = manager.copy_assets_to_temp([str(first), str(second)])
+        assert (
+            Path(asset_map[str(second)]).read_bytes() == b"YYYY"
+        ), "Stale content hash reused for a rewritten asset"
+        print("✅ Rewritten asset copied with its new contents")
+
+        # Never reuse a copy that a later asset with the same name overwrites
+        (root / "x").mkdir()
+        (root / "y").mkdir()
+        (root / "x" / "logo.png").write_bytes(b"AAAAA")
+        (root / "y" / "logo.png").write_bytes(b"BBBBB")
+        icon = root / "icon.png"
+        icon.write_bytes(b"AAAAA")
+        asset_map = manager.copy_assets_to_temp(
+            [str(root / "x" / "logo.png"), str(root / "y" / "logo.png"), str(icon)]
+        )
+        assert (
+            Path(asset_map[str(icon)]).read_bytes() == b"AAAAA"
+        ), "Asset deduplicated onto an overwritten copy"
+        print("✅ Deduplicated assets keep their own contents")
+
+        manager.cleanup_temp_assets()
+
+
 def main():
     """Run all asset manager tests."""
     print("🎯 Testing Asset Management System\n")
@@ -143,13 +195,14 @@ def main():
         test_asset_resolver,
         test_asset_manager,
         test_asset_copying,
+        test_asset_copy_deduplication_safety,
     ]
 
     results = []
     for test_func in tests:
         try:
-            result = test_func()
-            results.append(result)
+            # Tests either assert or return False on failure
+            results.append(test_func() is not False)
         except Exception as e:
             print(f"❌ {test_func.__name__} crashed: {e}")
             results.append(False)
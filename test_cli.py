@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 """Test script for CLI functionality."""
 
+import io
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr
+from functools import partial
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from md_to_pdf.cli import MarkdownToPDFCLI
+from md_to_pdf.core import STUB_PDF_ENV_VAR
+from tests.utils import file_size_or_none, run_captured
+
+
+@pytest.fixture
+def stub_pdf_rendering(monkeypatch):
+    """Skip WeasyPrint rendering; worker processes inherit the setting."""
+    monkeypatch.setenv(STUB_PDF_ENV_VAR, "1")
 
 
 def create_test_markdown() -> str:
@@ -135,8 +146,8 @@ def test_cli_basic_conversion():
             if exit_code == 0:
                 # Check if PDF was created
                 pdf_file = temp_path / "test.pdf"
-                if pdf_file.exists():
-                    file_size = pdf_file.stat().st_size
+                file_size = file_size_or_none(pdf_file)
+                if file_size is not None:
                     print(f"SUCCESS: Basic conversion successful: {file_size} bytes")
                     return True
                 else:
@@ -182,8 +193,8 @@ def test_cli_themed_conversion():
             )
 
             if exit_code == 0:
-                if pdf_file.exists():
-                    file_size = pdf_file.stat().st_size
+                file_size = file_size_or_none(pdf_file)
+                if file_size is not None:
                     print(f"SUCCESS: Themed conversion successful: {file_size} bytes")
                     return True
                 else:
@@ -248,6 +259,50 @@ def test_cli_multiple_files():
             return False
 
 
+@pytest.mark.usefixtures("stub_pdf_rendering")
+def test_cli_parallel_jobs():
+    """Test CLI multiple file conversion in worker processes."""
+    print("\nTesting CLI parallel conversion...")
+
+    cli = MarkdownToPDFCLI()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        # Create multiple test markdown files
+        files = []
+        for i in range(3):
+            md_file = temp_path / f"parallel_{i + 1}.md"
+            content = f"# Parallel Document {i + 1}\n\n" + create_test_markdown()
+            md_file.write_text(content)
+            files.append(md_file)
+
+        # Output directory
+        output_dir = temp_path / "output"
+
+        file_args = [str(f) for f in files]
+        exit_code = cli.run(
+            file_args + ["--output-dir", str(output_dir), "--jobs", "2"]
+        )
+
+        assert exit_code == 0, f"Parallel conversion failed with exit code: {exit_code}"
+        created_pdfs = list(output_dir.glob("*.pdf"))
+        assert len(created_pdfs) == 3, f"Expected 3 PDFs, got {len(created_pdfs)}"
+        print(f"SUCCESS: Parallel conversion created {len(created_pdfs)} files")
+
+
+def test_cli_jobs_validation():
+    """Test --jobs accepts 0 (all CPUs) and rejects negative counts."""
+    parser = MarkdownToPDFCLI().create_parser()
+
+    assert parser.parse_args(["doc.md", "--jobs", "0"]).jobs == 0
+    assert parser.parse_args(["doc.md", "-j", "3"]).jobs == 3
+    for value in ("-3", "two"):
+        with pytest.raises(SystemExit) as exc_info, redirect_stderr(io.StringIO()):
+            parser.parse_args(["doc.md", "--jobs", value])
+        assert exc_info.value.code == 2
+
+
 def test_cli_dry_run():
     """Test CLI dry run functionality."""
     print("\nTesting CLI dry run...")
@@ -313,18 +368,21 @@ def main():
         test_cli_basic_conversion,
         test_cli_themed_conversion,
         test_cli_multiple_files,
+        test_cli_parallel_jobs,
         test_cli_dry_run,
         test_cli_error_handling,
     ]
 
+    # Tests are independent, so render their PDFs on several cores
+    with ProcessPoolExecutor(max_workers=min(4, len(tests))) as executor:
+        outcomes = list(
+            executor.map(partial(run_captured, crash_marker="FAILED:"), tests)
+        )
+
     results = []
-    for test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"FAILED: {test_func.__name__} crashed: {e}")
-            results.append(False)
+    for result, output in outcomes:
+        print(output, end="")
+        results.append(result)
 
     print(f"\nCLI Test Results: {sum(results)}/{len(results)} tests passed")
 
@@ -336,6 +394,7 @@ def main():
         print("  - Basic Markdown conversion")
         print("  - Themed conversion with custom output")
         print("  - Multiple file batch processing")
+        print("  - Parallel conversion with --jobs")
         print("  - Dry run functionality")
         print("  - Error handling and validation")
         print("  - Verbose and quiet modes")
@@ -7,18 +7,13 @@ implemented in Phase 6.2: Error Handling & Validation.
 """
 
 import sys
-import tempfile
-from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from md_to_pdf.cli import CLIError, MarkdownToPDFCLI, ValidationErrorCollector
 
-
-def create_test_markdown() -> str:
-    """Create sample markdown content for testing."""
-    return """# Test Document
+# Sample markdown content for testing
+TEST_MARKDOWN = """# Test Document
 
 This is a test document for CLI validation.
 
@@ -38,10 +33,8 @@ This is a test tip box.
 End of test document.
 """
 
-
-def create_invalid_yaml() -> str:
-    """Create invalid YAML content for testing."""
-    return """
+# Invalid YAML content for testing
+INVALID_YAML = """
 # Invalid YAML - missing quotes and invalid syntax
 page_setup:
   size: A4
@@ -54,10 +47,8 @@ styles:
     font-size: [missing closing bracket
 """
 
-
-def create_valid_yaml() -> str:
-    """Create valid minimal YAML for testing."""
-    return """
+# Valid minimal YAML for testing
+VALID_YAML = """
 page_setup:
   size: "A4"
   orientation: "portrait"
@@ -74,11 +65,59 @@ styles:
     margin_bottom: "16px"
 """
 
+# Theme additions that should only produce warnings
+STRICT_THEME_EXTRAS = """
+fonts:
+  - name: CustomFont
+    files:
+      regular: /nonexistent/font.ttf
+custom_components:
+  comp1: {}
+  comp2: {}
+  comp3: {}
+  comp4: {}
+  comp5: {}
+  comp6: {}
+  comp7: {}
+  comp8: {}
+  comp9: {}
+  comp10: {}
+  comp11: {}  # This should trigger warning about too many components
+"""
+
+# File contents, encoded once at import and written as raw bytes
+TEST_MARKDOWN_BYTES = TEST_MARKDOWN.encode("utf-8")
+INVALID_THEME_BYTES = INVALID_YAML.encode("utf-8")
+VALID_THEME_BYTES = VALID_YAML.encode("utf-8")
+STRICT_THEME_BYTES = (VALID_YAML + STRICT_THEME_EXTRAS).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory):
+    """Directory with every input file these tests need, written once."""
+    temp_path = tmp_path_factory.mktemp("cli_validation")
+
+    (temp_path / "test.md").write_bytes(TEST_MARKDOWN_BYTES)
+    (temp_path / "test2.md").write_bytes(TEST_MARKDOWN_BYTES)
+    (temp_path / "test.txt").write_text("This is not markdown")
+    (temp_path / "bad.md").write_bytes(b"\xff\xfe\x00\x00")  # Invalid UTF-8 bytes
+    (temp_path / "existing.txt").write_text("existing file")
+    (temp_path / "invalid.yaml").write_bytes(INVALID_THEME_BYTES)
+    (temp_path / "valid_theme.yaml").write_bytes(VALID_THEME_BYTES)
+    (temp_path / "strict_theme.yaml").write_bytes(STRICT_THEME_BYTES)
+    (temp_path / "test_directory").mkdir()
+
+    return temp_path
+
+
+@pytest.fixture(scope="module")
+def cli():
+    """CLI instance shared by the module; run() keeps no state between calls."""
+    return MarkdownToPDFCLI()
+
 
 def test_validation_error_collector():
     """Test the ValidationErrorCollector class."""
-    print("\nTesting ValidationErrorCollector...")
-
     collector = ValidationErrorCollector()
 
     # Test empty collector
@@ -97,437 +136,138 @@ def test_validation_error_collector():
     assert "Test warning" in formatted
     assert "Suggestion 1" in formatted
 
-    print("SUCCESS: ValidationErrorCollector works correctly")
-    return True
-
 
 def test_cli_error_with_suggestions():
     """Test CLIError with suggestions."""
-    print("\nTesting CLIError with suggestions...")
-
-    try:
+    with pytest.raises(CLIError) as exc_info:
         raise CLIError("Test error", exit_code=42, suggestions=["Fix this", "Try that"])
-    except CLIError as e:
-        assert str(e) == "Test error"
-        assert e.exit_code == 42
-        assert e.suggestions == ["Fix this", "Try that"]
 
-    print("SUCCESS: CLIError with suggestions works correctly")
-    return True
+    error = exc_info.value
+    assert str(error) == "Test error"
+    assert error.exit_code == 42
+    assert error.suggestions == ["Fix this", "Try that"]
 
 
-def test_input_validation_no_files():
+def test_input_validation_no_files(cli):
     """Test input validation when no files are provided."""
-    print("\nTesting input validation with no files...")
+    assert cli.run([]) != 0, "Should fail when no files provided"
 
-    cli = MarkdownToPDFCLI()
 
-    try:
-        exit_code = cli.run([])
-        assert exit_code != 0, "Should fail when no files provided"
-        print("SUCCESS: No files error handled correctly")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
-
-
-def test_input_validation_nonexistent_files():
+def test_input_validation_nonexistent_files(cli):
     """Test input validation with non-existent files."""
-    print("\nTesting input validation with non-existent files...")
+    exit_code = cli.run(["nonexistent.md", "also_missing.md"])
+    assert exit_code != 0, "Should fail when files don't exist"
 
-    cli = MarkdownToPDFCLI()
 
-    try:
-        exit_code = cli.run(["nonexistent.md", "also_missing.md"])
-        assert exit_code != 0, "Should fail when files don't exist"
-        print("SUCCESS: Non-existent files error handled correctly")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
+# The input file checks below call the validator directly, skipping argument
+# parsing; the end-to-end exit code path is covered by the test above
 
 
-def test_input_validation_directory_as_file():
+def test_input_validation_directory_as_file(cli, workspace):
     """Test input validation when directory is provided as file."""
-    print("\nTesting input validation with directory as file...")
-
-    cli = MarkdownToPDFCLI()
+    with pytest.raises(CLIError, match="directory"):
+        cli._validate_input_files([str(workspace / "test_directory")])
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        test_dir = temp_path / "test_directory"
-        test_dir.mkdir()
 
-        try:
-            exit_code = cli.run([str(test_dir)])
-            assert exit_code != 0, "Should fail when directory provided as file"
-            print("SUCCESS: Directory as file error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
-
-
-def test_input_validation_invalid_extension():
+def test_input_validation_invalid_extension(cli, workspace):
     """Test input validation with invalid file extensions."""
-    print("\nTesting input validation with invalid extensions...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create file with invalid extension
-        txt_file = temp_path / "test.txt"
-        txt_file.write_text("This is not markdown")
-
-        try:
-            exit_code = cli.run([str(txt_file)])
-            assert exit_code != 0, "Should fail with invalid extension"
-            print("SUCCESS: Invalid extension error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
+    with pytest.raises(CLIError, match="does not appear to be a Markdown file"):
+        cli._validate_input_files([str(workspace / "test.txt")])
 
 
-def test_input_validation_unreadable_file():
+def test_input_validation_unreadable_file(cli, workspace):
     """Test input validation with unreadable file."""
-    print("\nTesting input validation with unreadable file...")
+    with pytest.raises(CLIError, match="not a valid UTF-8 text file"):
+        cli._validate_input_files([str(workspace / "bad.md")])
 
-    cli = MarkdownToPDFCLI()
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create markdown file with invalid UTF-8
-        bad_file = temp_path / "bad.md"
-        with open(bad_file, "wb") as f:
-            f.write(b"\xff\xfe\x00\x00")  # Invalid UTF-8 bytes
-
-        try:
-            exit_code = cli.run([str(bad_file)])
-            assert exit_code != 0, "Should fail with unreadable file"
-            print("SUCCESS: Unreadable file error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
-
-
-def test_theme_validation_nonexistent():
+def test_theme_validation_nonexistent(cli):
     """Test theme validation with non-existent file."""
-    print("\nTesting theme validation with non-existent file...")
+    exit_code = cli.run(["--validate", "--theme", "nonexistent.yaml"])
+    assert exit_code != 0, "Should fail with non-existent theme"
 
-    cli = MarkdownToPDFCLI()
 
-    try:
-        exit_code = cli.run(["--validate", "--theme", "nonexistent.yaml"])
-        assert exit_code != 0, "Should fail with non-existent theme"
-        print("SUCCESS: Non-existent theme error handled correctly")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
-
-
-def test_theme_validation_invalid_yaml():
+def test_theme_validation_invalid_yaml(cli, workspace):
     """Test theme validation with invalid YAML."""
-    print("\nTesting theme validation with invalid YAML...")
-
-    cli = MarkdownToPDFCLI()
+    exit_code = cli.run(["--validate", "--theme", str(workspace / "invalid.yaml")])
+    assert exit_code != 0, "Should fail with invalid YAML"
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
 
-        # Create invalid YAML file
-        invalid_yaml = temp_path / "invalid.yaml"
-        invalid_yaml.write_text(create_invalid_yaml())
-
-        try:
-            exit_code = cli.run(["--validate", "--theme", str(invalid_yaml)])
-            assert exit_code != 0, "Should fail with invalid YAML"
-            print("SUCCESS: Invalid YAML error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
-
-
-def test_output_validation_conflicting_options():
+def test_output_validation_conflicting_options(cli, workspace):
     """Test output validation with conflicting options."""
-    print("\nTesting output validation with conflicting options...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create test markdown file
-        md_file = temp_path / "test.md"
-        md_file.write_text(create_test_markdown())
-
-        try:
-            exit_code = cli.run(
-                [str(md_file), "--output", "output.pdf", "--output-dir", "output_dir"]
-            )
-            assert exit_code != 0, "Should fail with conflicting output options"
-            print("SUCCESS: Conflicting output options error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
+    exit_code = cli.run(
+        [
+            str(workspace / "test.md"),
+            "--output",
+            "output.pdf",
+            "--output-dir",
+            "output_dir",
+        ]
+    )
+    assert exit_code != 0, "Should fail with conflicting output options"
 
 
-def test_output_validation_file_as_directory():
+def test_output_validation_file_as_directory(cli, workspace):
     """Test output validation when using file as directory."""
-    print("\nTesting output validation with file as directory...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create test markdown files
-        md_file1 = temp_path / "test1.md"
-        md_file1.write_text(create_test_markdown())
-        md_file2 = temp_path / "test2.md"
-        md_file2.write_text(create_test_markdown())
-
-        # Create a file that we'll try to use as output directory
-        existing_file = temp_path / "existing.txt"
-        existing_file.write_text("existing file")
-
-        try:
-            exit_code = cli.run(
-                [str(md_file1), str(md_file2), "--output", str(existing_file)]
-            )
-            assert exit_code != 0, "Should fail when using file as directory"
-            print("SUCCESS: File as directory error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
+    exit_code = cli.run(
+        [
+            str(workspace / "test.md"),
+            str(workspace / "test2.md"),
+            "--output",
+            str(workspace / "existing.txt"),
+        ]
+    )
+    assert exit_code != 0, "Should fail when using file as directory"
 
 
-def test_css_validation_nonexistent():
+def test_css_validation_nonexistent(cli, workspace):
     """Test CSS file validation with non-existent file."""
-    print("\nTesting CSS validation with non-existent file...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create test markdown file
-        md_file = temp_path / "test.md"
-        md_file.write_text(create_test_markdown())
+    exit_code = cli.run([str(workspace / "test.md"), "--css", "nonexistent.css"])
+    assert exit_code != 0, "Should fail with non-existent CSS"
 
-        try:
-            exit_code = cli.run([str(md_file), "--css", "nonexistent.css"])
-            assert exit_code != 0, "Should fail with non-existent CSS"
-            print("SUCCESS: Non-existent CSS error handled correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
 
-
-def test_strict_mode_warnings_as_errors():
+def test_strict_mode_warnings_as_errors(cli, workspace):
     """Test strict mode treating warnings as errors."""
-    print("\nTesting strict mode with warnings as errors...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create test markdown file
-        md_file = temp_path / "test.md"
-        md_file.write_text(create_test_markdown())
-
-        # Create valid theme with potential warnings
-        theme_file = temp_path / "theme.yaml"
-        theme_content = (
-            create_valid_yaml()
-            + """
-fonts:
-  - name: CustomFont
-    files:
-      regular: /nonexistent/font.ttf
-custom_components:
-  comp1: {}
-  comp2: {}
-  comp3: {}
-  comp4: {}
-  comp5: {}
-  comp6: {}
-  comp7: {}
-  comp8: {}
-  comp9: {}
-  comp10: {}
-  comp11: {}  # This should trigger warning about too many components
-"""
-        )
-        theme_file.write_text(theme_content)
-
-        try:
-            # First try without strict mode (should work with warnings)
-            exit_code_normal = cli.run(
-                [str(md_file), "--theme", str(theme_file), "--dry-run"]
-            )
-
-            # Then try with strict mode (should fail due to warnings treated as errors)
-            exit_code_strict = cli.run(
-                [str(md_file), "--theme", str(theme_file), "--strict", "--dry-run"]
-            )
-
-            # Note: We expect both to succeed in this implementation
-            # as the warnings are logged but don't prevent conversion
-            print("SUCCESS: Strict mode handling tested")
-            return True
-
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
+    md_file = str(workspace / "test.md")
+    theme_file = str(workspace / "strict_theme.yaml")
+
+    # Both runs must complete without raising: warnings are logged but
+    # don't prevent a dry run in this implementation. The batch parses the
+    # shared theme once.
+    exit_codes = cli.run_batch(
+        [
+            [md_file, "--theme", theme_file, "--dry-run"],
+            [md_file, "--theme", theme_file, "--strict", "--dry-run"],
+        ]
+    )
+    assert len(exit_codes) == 2
 
 
-def test_validate_only_mode():
+def test_validate_only_mode(cli, workspace):
     """Test validation-only mode."""
-    print("\nTesting validation-only mode...")
-
-    cli = MarkdownToPDFCLI()
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    exit_code = cli.run(["--validate", "--theme", str(workspace / "valid_theme.yaml")])
+    assert exit_code == 0, "Should succeed with valid theme"
 
-        # Create valid theme file
-        theme_file = temp_path / "valid_theme.yaml"
-        theme_file.write_text(create_valid_yaml())
 
-        try:
-            exit_code = cli.run(["--validate", "--theme", str(theme_file)])
-            assert exit_code == 0, "Should succeed with valid theme"
-            print("SUCCESS: Validation-only mode works correctly")
-            return True
-        except Exception as e:
-            print(f"FAILED: Unexpected exception: {e}")
-            return False
-
-
-def test_validate_mode_missing_theme():
+def test_validate_mode_missing_theme(cli):
     """Test validation mode without theme specified."""
-    print("\nTesting validation mode without theme...")
-
-    cli = MarkdownToPDFCLI()
+    exit_code = cli.run(["--validate"])
+    assert exit_code != 0, "Should fail when no theme specified for validation"
 
-    try:
-        exit_code = cli.run(["--validate"])
-        assert exit_code != 0, "Should fail when no theme specified for validation"
-        print("SUCCESS: Validation mode missing theme error handled correctly")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
 
-
-def test_debug_mode_error_details():
+def test_debug_mode_error_details(cli):
     """Test debug mode provides detailed error information."""
-    print("\nTesting debug mode error details...")
-
-    cli = MarkdownToPDFCLI()
-
-    try:
-        exit_code = cli.run(["nonexistent.md", "--debug"])
-        assert exit_code != 0, "Should fail with non-existent file"
-        print("SUCCESS: Debug mode error details tested")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
+    exit_code = cli.run(["nonexistent.md", "--debug"])
+    assert exit_code != 0, "Should fail with non-existent file"
 
 
-def test_permission_error_handling():
+def test_permission_error_handling(cli):
     """Test permission error handling (simulated)."""
-    print("\nTesting permission error handling...")
-
-    # This is difficult to test portably without actually creating permission issues
-    # For now, we'll just verify the structure is in place
-    cli = MarkdownToPDFCLI()
-
-    # Test that the method exists and has proper error handling structure
-    try:
-        # The _convert_file method should handle PermissionError
-        assert hasattr(cli, "_convert_file")
-        print("SUCCESS: Permission error handling structure in place")
-        return True
-    except Exception as e:
-        print(f"FAILED: Unexpected exception: {e}")
-        return False
-
-
-def main():
-    """Run all enhanced validation tests."""
-    print("Testing Enhanced CLI Validation Features (Phase 6.2)\n")
-
-    tests = [
-        test_validation_error_collector,
-        test_cli_error_with_suggestions,
-        test_input_validation_no_files,
-        test_input_validation_nonexistent_files,
-        test_input_validation_directory_as_file,
-        test_input_validation_invalid_extension,
-        test_input_validation_unreadable_file,
-        test_theme_validation_nonexistent,
-        test_theme_validation_invalid_yaml,
-        test_output_validation_conflicting_options,
-        test_output_validation_file_as_directory,
-        test_css_validation_nonexistent,
-        test_strict_mode_warnings_as_errors,
-        test_validate_only_mode,
-        test_validate_mode_missing_theme,
-        test_debug_mode_error_details,
-        test_permission_error_handling,
-    ]
-
-    results = []
-    for test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"FAILED: {test_func.__name__} crashed: {e}")
-            results.append(False)
-
-    print(
-        f"\nEnhanced Validation Test Results: {sum(results)}/{len(results)} tests passed"
-    )
-
-    if all(results):
-        print("All enhanced validation tests passed!")
-        print("Enhanced validation features verified:")
-        print("  ✅ ValidationErrorCollector for multiple errors")
-        print("  ✅ CLIError with suggestions and exit codes")
-        print("  ✅ Comprehensive input file validation")
-        print("  ✅ Enhanced theme file validation")
-        print("  ✅ Output options validation")
-        print("  ✅ CSS file validation")
-        print("  ✅ Strict mode support")
-        print("  ✅ Validation-only mode")
-        print("  ✅ Debug mode with detailed errors")
-        print("  ✅ Permission error handling")
-        print("  ✅ User-friendly error messages with suggestions")
-        return True
-    else:
-        print("Some enhanced validation tests failed")
-        failed_tests = [
-            tests[i].__name__ for i, result in enumerate(results) if not result
-        ]
-        print(f"Failed tests: {', '.join(failed_tests)}")
-        return False
+    # This is difficult to test portably without actually creating permission
+    # issues, so just verify the structure is in place: the _convert_file
+    # method should handle PermissionError
+    assert hasattr(cli, "_convert_file")
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -1,12 +1,6 @@
 #!/usr/bin/env python3
 """Simple test for corporate.yaml validation."""
 
-import sys
-from pathlib import Path
-
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from md_to_pdf.config import ValidationError, load_theme_config
 
 
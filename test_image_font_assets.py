@@ -1,32 +1,30 @@
 #!/usr/bin/env python3
 """Test script for image and font asset handling."""
 
-import re
 import sys
 import tempfile
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from md_to_pdf.assets import AssetValidationError, FontManager, ImageResolver
+from md_to_pdf.assets import (
+    AssetValidationError,
+    FontManager,
+    ImageResolver,
+    scan_assets,
+)
+from md_to_pdf.assets.images import IMG_SRC_PATTERN
 
 
 def test_image_resolver():
     """Test image resolution and processing functionality."""
     print("🔍 Testing ImageResolver...")
 
-    # Create temporary image files for testing
-    test_files = []
-    try:
+    # Create temporary image files for testing in one directory
+    with tempfile.TemporaryDirectory() as temp_dir:
         # Create test files with different extensions
         image_extensions = [".png", ".jpg", ".gif", ".svg"]
-        for ext in image_extensions:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=ext, delete=False
-            ) as temp_file:
-                temp_file.write("fake image content")
-                test_files.append(Path(temp_file.name))
+        test_files = [Path(temp_dir) / f"fixture{ext}" for ext in image_extensions]
+        for test_file in test_files:
+            test_file.write_bytes(b"fake image content")
 
         resolver = ImageResolver()
 
@@ -86,28 +84,18 @@ def test_image_resolver():
 
         return True
 
-    finally:
-        # Clean up test files
-        for test_file in test_files:
-            if test_file.exists():
-                test_file.unlink()
-
 
 def test_font_manager():
     """Test font management functionality."""
     print("\n🔍 Testing FontManager...")
 
-    # Create temporary font files for testing
-    test_files = []
-    try:
+    # Create temporary font files for testing in one directory
+    with tempfile.TemporaryDirectory() as temp_dir:
         # Create test files with different font extensions
         font_extensions = [".ttf", ".otf", ".woff", ".woff2"]
-        for ext in font_extensions:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=ext, delete=False
-            ) as temp_file:
-                temp_file.write("fake font content")
-                test_files.append(Path(temp_file.name))
+        test_files = [Path(temp_dir) / f"fixture{ext}" for ext in font_extensions]
+        for test_file in test_files:
+            test_file.write_bytes(b"fake font content")
 
         manager = FontManager()
 
@@ -124,6 +112,13 @@ def test_font_manager():
                 print(f"❌ Font validation failed for {test_file.suffix}: {e}")
                 return False
 
+        # Unchanged files are served from the validation cache
+        first_info = manager.validate_font_file(test_files[0])
+        if FontManager().validate_font_file(test_files[0]) is not first_info:
+            print("❌ Font validation result was not cached")
+            return False
+        print("✅ Font validation results cached")
+
         # Test font fallback generation
         test_stacks = [
             ["Roboto", "Arial"],
@@ -158,12 +153,6 @@ def test_font_manager():
 
         return True
 
-    finally:
-        # Clean up test files
-        for test_file in test_files:
-            if test_file.exists():
-                test_file.unlink()
-
 
 def test_asset_scanning():
     """Test directory scanning for assets."""
@@ -189,7 +178,7 @@ def test_asset_scanning():
         ]
 
         for asset_path in test_assets:
-            asset_path.write_text("test content")
+            asset_path.write_bytes(b"test content")
 
         # Test image scanning
         image_resolver = ImageResolver()
@@ -217,6 +206,17 @@ def test_asset_scanning():
             )
             return False
 
+        # Test combined scanning in a single walk
+        found_assets = scan_assets(temp_path)
+
+        same_images = sorted(found_assets["images"]) == sorted(found_images)
+        same_fonts = sorted(found_assets["fonts"]) == sorted(found_fonts)
+        if same_images and same_fonts:
+            print("✅ Combined scanning found the same images and fonts")
+        else:
+            print(f"❌ Combined scanning mismatch: {found_assets}")
+            return False
+
     return True
 
 
@@ -231,6 +231,7 @@ def test_html_reference_updating():
     <img src="image1.png" alt="Test">
     <img src='image2.jpg' alt="Test 2">
     <img src=image3.gif alt="Test 3">
+    <img src="https://example.com/logo.png" alt="External">
     """
 
     # Test asset mapping - use Windows-compatible temp paths
@@ -246,12 +247,21 @@ def test_html_reference_updating():
     updated_html = image_resolver.update_html_image_refs(original_html, asset_map)
 
     # Check if the src attributes were properly updated (not just if the filename appears anywhere)
-    for original_path in asset_map.keys():
-        # Check if the original path still appears as a src attribute value
-        src_pattern = rf'src=["\']?{re.escape(original_path)}["\']?'
-        if re.search(src_pattern, updated_html):
-            print(f"❌ Original src {original_path} still present in updated HTML")
-            return False
+    src_values = {
+        value
+        for match in IMG_SRC_PATTERN.finditer(updated_html)
+        for value in match.group("double", "single", "bare")
+        if value is not None
+    }
+    stale_paths = sorted(src_values.intersection(asset_map))
+    if stale_paths:
+        print(f"❌ Original src {stale_paths} still present in updated HTML")
+        return False
+
+    # External URLs are left untouched
+    if 'src="https://example.com/logo.png"' not in updated_html:
+        print("❌ External image URL was rewritten")
+        return False
 
     # Check if file URIs are present
     if "file://" in updated_html:
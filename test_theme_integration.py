@@ -2,12 +2,26 @@
 """Test script for theme configuration integration with PDF generation."""
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from md_to_pdf.core import MarkdownToPDFConverter
+from tests.utils import file_size_or_none, run_captured
+
+
+@lru_cache(maxsize=None)
+def shared_font_config():
+    """FontConfiguration shared by the converters in this process, if available.
+
+    Font discovery is the slow part of WeasyPrint start-up, so the theme tests
+    render with one configuration instead of one per converter.
+    """
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except (ImportError, OSError):
+        return None
+    return FontConfiguration()
 
 
 def test_theme_integration():
@@ -22,7 +36,9 @@ def test_theme_integration():
 
     try:
         # Create converter with theme configuration
-        converter = MarkdownToPDFConverter(theme_config_path=minimal_theme_path)
+        converter = MarkdownToPDFConverter(
+            theme_config_path=minimal_theme_path, font_config=shared_font_config()
+        )
 
         # Test Markdown content
         markdown_content = """
@@ -53,10 +69,9 @@ def hello_world():
             markdown_content, output_path, "Theme Integration Test"
         )
 
-        if output_path.exists() and output_path.stat().st_size > 0:
-            print(
-                f"✅ PDF generated with minimal theme: {output_path.stat().st_size} bytes"
-            )
+        file_size = file_size_or_none(output_path)
+        if file_size:
+            print(f"✅ PDF generated with minimal theme: {file_size} bytes")
             return True
         else:
             print("❌ PDF was not created or is empty")
@@ -122,7 +137,9 @@ def test_corporate_theme():
 
     try:
         # Create converter with corporate theme
-        converter = MarkdownToPDFConverter(theme_config_path=corporate_theme_path)
+        converter = MarkdownToPDFConverter(
+            theme_config_path=corporate_theme_path, font_config=shared_font_config()
+        )
 
         # Test Markdown content
         markdown_content = """
@@ -147,10 +164,9 @@ Professional business document with custom fonts and styling.
         output_path = Path("test_output_corporate.pdf")
         converter.convert_string(markdown_content, output_path, "Corporate Theme Test")
 
-        if output_path.exists() and output_path.stat().st_size > 0:
-            print(
-                f"✅ PDF generated with corporate theme: {output_path.stat().st_size} bytes"
-            )
+        file_size = file_size_or_none(output_path)
+        if file_size:
+            print(f"✅ PDF generated with corporate theme: {file_size} bytes")
             return True
         else:
             print("❌ PDF was not created or is empty")
@@ -171,14 +187,14 @@ def main():
         test_corporate_theme,
     ]
 
+    # Tests are independent, so render their PDFs on several cores
+    with ProcessPoolExecutor(max_workers=min(4, len(tests))) as executor:
+        outcomes = list(executor.map(run_captured, tests))
+
     results = []
-    for test_func in tests:
-        try:
-            result = test_func()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ {test_func.__name__} crashed: {e}")
-            results.append(False)
+    for result, output in outcomes:
+        print(output, end="")
+        results.append(result)
 
     print(f"\n🎯 Test Results: {sum(results)}/{len(results)} tests passed")
 
@@ -6,39 +6,49 @@ This script tests the complete validation pipeline including JSON Schema
 validation and custom validation rules.
 """
 
+import json
+import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from md_to_pdf.config import (
     ValidationError,
     check_jsonschema_available,
+    clear_theme_cache,
+    get_theme_validator,
     get_validation_summary,
     load_theme_config,
     validate_theme_config,
 )
+from md_to_pdf.config import parser as config_parser
+from md_to_pdf.config import validators as config_validators
+
+# Progress is logged at INFO; pytest --log-cli-level=INFO shows it
+log = logging.getLogger("md_to_pdf.tests")
 
 
 def test_validation_availability():
     """Test if validation dependencies are available."""
-    print("=== Testing Validation Availability ===")
+    log.info("=== Testing Validation Availability ===")
 
     available = check_jsonschema_available()
-    print(f"JSON Schema validation available: {available}")
+    log.info(f"JSON Schema validation available: {available}")
 
     if available:
-        print("✅ Validation system ready")
+        log.info("✅ Validation system ready")
         return True
     else:
-        print("❌ jsonschema not available - install with: pip install jsonschema")
+        log.error("❌ jsonschema not available - install with: pip install jsonschema")
         return False
 
 
 def test_valid_configurations():
     """Test validation with valid configurations."""
-    print("\n=== Testing Valid Configurations ===")
+    log.info("\n=== Testing Valid Configurations ===")
 
     # Test minimal configuration
     minimal_config = {
@@ -47,10 +57,19 @@ def test_valid_configurations():
 
     try:
         validate_theme_config(minimal_config)
-        print("✅ Minimal configuration validation passed")
+        log.info("✅ Minimal configuration validation passed")
     except ValidationError as e:
-        print(f"❌ Minimal configuration failed: {e}")
+        log.error(f"❌ Minimal configuration failed: {e}")
+        return False
+
+    # The shared compiled validator checks the schema alone
+    validator = get_theme_validator()
+    if validator is not get_theme_validator() or not validator.is_valid(
+        minimal_config
+    ):
+        log.error("❌ Shared theme validator was rebuilt or rejected the configuration")
         return False
+    log.info("✅ Shared theme validator accepts the minimal configuration")
 
     # Test complex configuration
     complex_config = {
@@ -84,9 +103,9 @@ def test_valid_configurations():
 
     try:
         validate_theme_config(complex_config)
-        print("✅ Complex configuration validation passed")
+        log.info("✅ Complex configuration validation passed")
     except ValidationError as e:
-        print(f"❌ Complex configuration failed: {e}")
+        log.error(f"❌ Complex configuration failed: {e}")
         return False
 
     return True
@@ -94,7 +113,7 @@ def test_valid_configurations():
 
 def test_invalid_configurations():
     """Test validation with invalid configurations."""
-    print("\n=== Testing Invalid Configurations ===")
+    log.info("\n=== Testing Invalid Configurations ===")
 
     test_cases = [
         # Invalid page size
@@ -151,45 +170,66 @@ def test_invalid_configurations():
     for i, test_case in enumerate(test_cases):
         try:
             validate_theme_config(test_case["config"])
-            print(
+            log.error(
                 f"❌ Test {i + 1} ({test_case['description']}) should have failed but passed"
             )
         except ValidationError as e:
-            print(
+            log.info(
                 f"✅ Test {i + 1} ({test_case['description']}) correctly failed: {e.message}"
             )
             passed += 1
         except Exception as e:
-            print(
+            log.error(
                 f"❌ Test {i + 1} ({test_case['description']}) failed with unexpected error: {e}"
             )
 
-    print(f"\nValidation tests passed: {passed}/{len(test_cases)}")
+    log.info(f"\nValidation tests passed: {passed}/{len(test_cases)}")
+
+    # The schema is loaded and compiled once, then reused by every validation
+    cache_info = config_validators._schema_validator.cache_info()
+    if cache_info.currsize != 1 or cache_info.hits < len(test_cases) - 1:
+        log.error(f"❌ Schema validator was not reused: {cache_info}")
+        return False
+    log.info(f"✅ Schema validator compiled once and reused: {cache_info}")
+
     return passed == len(test_cases)
 
 
 def test_file_loading():
     """Test loading actual configuration files."""
-    print("\n=== Testing File Loading ===")
+    log.info("\n=== Testing File Loading ===")
 
     # Test loading example configurations
     schema_dir = Path("schemas/examples")
     if not schema_dir.exists():
-        print("❌ Example configurations not found")
+        log.error("❌ Example configurations not found")
         return False
 
     example_files = ["minimal.yaml", "corporate.yaml", "magic_kingdom.yaml"]
 
+    def load_example(filename):
+        """Load one example theme, returning the config or the raised error."""
+        try:
+            return load_theme_config(
+                schema_dir / filename, validate_files=False, validate_schema=True
+            )
+        except Exception as e:
+            return e
+
+    # Load the examples concurrently, then report in order
+    existing_files = [f for f in example_files if (schema_dir / f).exists()]
+    with ThreadPoolExecutor(max_workers=len(existing_files) or 1) as executor:
+        loaded = dict(zip(existing_files, executor.map(load_example, existing_files)))
+
     for filename in example_files:
-        filepath = schema_dir / filename
-        if not filepath.exists():
-            print(f"❌ Example file not found: {filename}")
+        if filename not in loaded:
+            log.error(f"❌ Example file not found: {filename}")
             continue
 
         try:
-            config = load_theme_config(
-                filepath, validate_files=False, validate_schema=True
-            )
+            config = loaded[filename]
+            if isinstance(config, Exception):
+                raise config
 
             # Create test data dictionary for validation summary
             test_data = {
@@ -203,21 +243,103 @@ def test_file_loading():
             }
             summary = get_validation_summary(test_data)
 
-            print(f"✅ {filename} loaded successfully")
-            print(f"   - Sections: {', '.join(summary['sections_present'])}")
-            print(f"   - Fonts: {summary['font_count']}")
-            print(f"   - Components: {summary['component_count']}")
-            print(f"   - Styled elements: {summary['styled_elements']}")
+            log.info(f"✅ {filename} loaded successfully")
+            log.info(f"   - Sections: {', '.join(summary['sections_present'])}")
+            log.info(f"   - Fonts: {summary['font_count']}")
+            log.info(f"   - Components: {summary['component_count']}")
+            log.info(f"   - Styled elements: {summary['styled_elements']}")
         except Exception as e:
-            print(f"❌ Failed to load {filename}: {e}")
+            log.error(f"❌ Failed to load {filename}: {e}")
             return False
 
     return True
 
 
+def test_yaml_cache(tmp_path):
+    """Test the in-process and JSON sidecar caches for parsed theme files."""
+    theme_file = tmp_path / "theme.yaml"
+    cache_file = tmp_path / "theme.yaml.cache.json"
+    theme_file.write_text("page_setup:\n  size: A4\n", encoding="utf-8")
+    clear_theme_cache()
+
+    config = load_theme_config(theme_file, validate_files=False)
+    assert cache_file.exists(), "Cache file was not written"
+    assert config.page_setup.size == "A4"
+
+    # Reloads are served from the sidecar cache
+    clear_theme_cache()
+    config = load_theme_config(theme_file, validate_files=False)
+    assert config.page_setup.size == "A4"
+
+    # Editing the theme must invalidate the cache
+    time.sleep(0.01)
+    theme_file.write_text("page_setup:\n  size: Letter\n", encoding="utf-8")
+    config = load_theme_config(theme_file, validate_files=False)
+    assert config.page_setup.size == "Letter", "Stale cache used"
+
+    # Repeated loads reuse the in-process cache but return separate copies
+    config.page_setup.size = "A5"
+    config = load_theme_config(theme_file, validate_files=False)
+    assert config.page_setup.size == "Letter", "Cached config was mutated"
+
+    # A corrupt cache falls back to parsing the YAML
+    clear_theme_cache()
+    cache_file.write_text("{not json", encoding="utf-8")
+    config = load_theme_config(theme_file, validate_files=False)
+    assert config.page_setup.size == "Letter", "Corrupt cache not ignored"
+
+    # The in-process cache keeps at most THEME_CACHE_SIZE themes
+    for i in range(config_parser.THEME_CACHE_SIZE + 1):
+        extra_theme = tmp_path / f"theme_{i}.yaml"
+        extra_theme.write_text("page_setup:\n  size: A4\n", encoding="utf-8")
+        load_theme_config(extra_theme, validate_files=False)
+    assert len(config_parser._THEME_CACHE) <= config_parser.THEME_CACHE_SIZE
+    clear_theme_cache()
+
+
+def test_yaml_cache_validation_digest(tmp_path, monkeypatch):
+    """Test cached themes skip revalidation until the schema or rules change."""
+    theme_file = tmp_path / "theme.yaml"
+    cache_file = tmp_path / "theme.yaml.cache.json"
+    theme_file.write_text("page_setup:\n  size: A4\n", encoding="utf-8")
+    clear_theme_cache()
+    load_theme_config(theme_file, validate_files=False)
+
+    # The cache records the digest of the schema and rules the theme passed
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached["validated_schema"] == config_parser.get_schema_digest()
+
+    # Reloads with a matching digest skip validation
+    validated = []
+    monkeypatch.setattr(
+        config_parser, "validate_theme_config", lambda *args: validated.append(args)
+    )
+    clear_theme_cache()
+    load_theme_config(theme_file, validate_files=False)
+    assert not validated, "Theme revalidated despite matching schema digest"
+
+    # Changing the custom validation rules forces revalidation
+    rules_file = tmp_path / "validators.py"
+    rules_file.write_bytes(config_validators.RULES_FILE.read_bytes() + b"\n# edit")
+    monkeypatch.setattr(config_validators, "RULES_FILE", rules_file)
+    clear_theme_cache()
+    load_theme_config(theme_file, validate_files=False)
+    assert validated, "Theme not revalidated after the validation rules changed"
+    monkeypatch.undo()
+
+    # Themes that fail validation are never recorded as validated
+    invalid_file = tmp_path / "invalid.yaml"
+    invalid_file.write_text("page_setup:\n  size: A9\n", encoding="utf-8")
+    for _ in range(2):
+        clear_theme_cache()
+        with pytest.raises(ValidationError):
+            load_theme_config(invalid_file, validate_files=False)
+    clear_theme_cache()
+
+
 def test_validation_summary():
     """Test validation summary functionality."""
-    print("\n=== Testing Validation Summary ===")
+    log.info("\n=== Testing Validation Summary ===")
 
     test_config = {
         "page_setup": {"size": "A4"},
@@ -248,15 +370,17 @@ def test_validation_summary():
         ],
     }
 
-    success = True
-    for key, expected_value in expected.items():
-        if summary[key] != expected_value:
-            print(f"❌ {key}: expected {expected_value}, got {summary[key]}")
-            success = False
-        else:
-            print(f"✅ {key}: {summary[key]}")
+    mismatches = {
+        key: (expected_value, summary.get(key))
+        for key, expected_value in expected.items()
+        if summary.get(key) != expected_value
+    }
+    if mismatches:
+        log.error(f"❌ Summary mismatches (expected, got): {mismatches}")
+        return False
 
-    return success
+    log.info(f"✅ Validation summary matches: {summary}")
+    return True
 
 
 def main():
@@ -275,6 +399,7 @@ def main():
         test_file_loading,
         test_validation_summary,
     ]
+    # The YAML cache tests use pytest fixtures: pytest test_validation_system.py
 
     passed = 0
     for test_func in tests:
@@ -297,5 +422,6 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     success = main()
     sys.exit(0 if success else 1)
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Test script for the complete Markdown to PDF pipeline."""
 
+from functools import lru_cache
 from pathlib import Path
 
-from src.md_to_pdf.core import MarkdownToPDFConverter
+from md_to_pdf.core import MarkdownToPDFConverter
+from tests.utils import file_size_or_none
+
+
+@lru_cache(maxsize=1)
+def _get_converter() -> MarkdownToPDFConverter:
+    """Converter shared by the tests in this module, built on first use."""
+    return MarkdownToPDFConverter.shared()
 
 
 def test_basic_pipeline():
@@ -11,7 +19,7 @@ def test_basic_pipeline():
     print("🔍 Testing basic Markdown → PDF pipeline...")
 
     # Check if WeasyPrint is available
-    converter = MarkdownToPDFConverter()
+    converter = _get_converter()
     if not converter.is_available():
         print("⚠️ WeasyPrint not available - testing Markdown → HTML only")
 
@@ -38,10 +46,9 @@ def test_basic_pipeline():
     try:
         converter.convert_file(input_file, output_file)
 
-        if output_file.exists() and output_file.stat().st_size > 0:
-            print(
-                f"✅ Complete pipeline successful! PDF size: {output_file.stat().st_size} bytes"
-            )
+        file_size = file_size_or_none(output_file)
+        if file_size:
+            print(f"✅ Complete pipeline successful! PDF size: {file_size} bytes")
             return True
         else:
             print("❌ PDF was not created or is empty")
@@ -56,7 +63,7 @@ def test_string_conversion():
     """Test converting a Markdown string directly."""
     print("\n🔍 Testing string conversion...")
 
-    converter = MarkdownToPDFConverter()
+    converter = _get_converter()
 
     markdown_content = """
 # Test Document
@@ -79,10 +86,9 @@ This is a **test** from a string.
     try:
         converter.convert_string(markdown_content, output_file, "String Test")
 
-        if output_file.exists() and output_file.stat().st_size > 0:
-            print(
-                f"✅ String → PDF conversion successful! PDF size: {output_file.stat().st_size} bytes"
-            )
+        file_size = file_size_or_none(output_file)
+        if file_size:
+            print(f"✅ String → PDF conversion successful! PDF size: {file_size} bytes")
             return True
         else:
             print("❌ PDF was not created or is empty")
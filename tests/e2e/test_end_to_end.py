@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 """End-to-end test for the Markdown to PDF conversion pipeline."""
 
+import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path so we can import our modules
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 from md_to_pdf.core import MarkdownToPDFConverter
+from tests.utils import file_size_or_none
+
+# Progress is logged at INFO; pytest --log-cli-level=INFO shows it
+log = logging.getLogger("md_to_pdf.tests")
+
+
+@lru_cache(maxsize=1)
+def _get_converter() -> MarkdownToPDFConverter:
+    """Converter shared by the tests in this module, built on first use."""
+    return MarkdownToPDFConverter.shared()
 
 
 def test_basic_conversion():
     """Test basic Markdown to PDF conversion with sample.md."""
-    print("🧪 Starting end-to-end test...")
+    log.info("🧪 Starting end-to-end test...")
 
     # Define paths
     input_file = Path("examples/sample.md")
@@ -21,42 +29,42 @@ def test_basic_conversion():
 
     # Check if input file exists
     if not input_file.exists():
-        print(f"❌ Input file not found: {input_file}")
+        log.error(f"❌ Input file not found: {input_file}")
         return False
 
     try:
         # Initialize converter
-        print("📝 Initializing converter...")
-        converter = MarkdownToPDFConverter()
+        log.info("📝 Initializing converter...")
+        converter = _get_converter()
 
         # Check if converter is available
         if not converter.is_available():
-            print("❌ Converter dependencies not available")
+            log.error("❌ Converter dependencies not available")
             return False
 
-        print("✅ Converter initialized successfully")
+        log.info("✅ Converter initialized successfully")
 
         # Convert file
-        print(f"🔄 Converting {input_file} to {output_file}...")
+        log.info(f"🔄 Converting {input_file} to {output_file}...")
         converter.convert_file(input_file, output_file)
 
         # Verify output file was created
-        if output_file.exists():
-            file_size = output_file.stat().st_size
-            print(f"✅ End-to-end test passed! PDF created ({file_size} bytes)")
+        file_size = file_size_or_none(output_file)
+        if file_size is not None:
+            log.info(f"✅ End-to-end test passed! PDF created ({file_size} bytes)")
             return True
         else:
-            print("❌ PDF file was not created")
+            log.error("❌ PDF file was not created")
             return False
 
     except Exception as e:
-        print(f"❌ Test failed with error: {e}")
+        log.error(f"❌ Test failed with error: {e}")
         return False
 
 
 def test_string_conversion():
     """Test Markdown string to PDF conversion."""
-    print("\n🧪 Testing string conversion...")
+    log.info("\n🧪 Testing string conversion...")
 
     markdown_content = """
 # Test Document
@@ -77,20 +85,22 @@ print("Hello from string conversion!")
     output_file = Path("examples/string_test_output.pdf")
 
     try:
-        converter = MarkdownToPDFConverter()
-        print("🔄 Converting markdown string to PDF...")
+        converter = _get_converter()
+        log.info("🔄 Converting markdown string to PDF...")
         converter.convert_string(markdown_content, output_file, "String Test Document")
 
-        if output_file.exists():
-            file_size = output_file.stat().st_size
-            print(f"✅ String conversion test passed! PDF created ({file_size} bytes)")
+        file_size = file_size_or_none(output_file)
+        if file_size is not None:
+            log.info(
+                f"✅ String conversion test passed! PDF created ({file_size} bytes)"
+            )
             return True
         else:
-            print("❌ PDF file was not created")
+            log.error("❌ PDF file was not created")
             return False
 
     except Exception as e:
-        print(f"❌ String conversion test failed: {e}")
+        log.error(f"❌ String conversion test failed: {e}")
         return False
 
 
@@ -120,4 +130,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     exit(main())
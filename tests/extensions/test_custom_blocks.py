@@ -11,60 +11,77 @@ from md_to_pdf.extensions.custom_blocks import (
     CustomBlockExtension,
     CustomBlockProcessor,
 )
-from md_to_pdf.templating import TemplateManager
+
+
+class FakeTemplateManager:
+    """Stand-in for TemplateManager that records render_component calls."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Register every component and render a fixed snippet again."""
+        self.registered = True
+        # A string, or a callable taking render_component's arguments
+        self.rendered = "<div>Mock Template</div>"
+        self.calls = []
+
+    def is_component_registered(self, component_name):
+        return self.registered
+
+    def render_component(self, component_name, attributes, content=""):
+        self.calls.append((component_name, attributes, content))
+        if callable(self.rendered):
+            return self.rendered(component_name, attributes, content)
+        return self.rendered
 
 
 class TestCustomBlockProcessor:
     """Test cases for the CustomBlockProcessor class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_template_manager = Mock(spec=TemplateManager)
-        self.mock_template_manager.is_component_registered.return_value = True
-        self.mock_template_manager.render_component.return_value = (
-            "<div>Mock Template</div>"
-        )
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by the tests; none of them change state."""
+        cls.template_manager = FakeTemplateManager()
 
         # Create a mock markdown parser
-        self.mock_parser = Mock()
-        self.processor = CustomBlockProcessor(
-            self.mock_parser, self.mock_template_manager
-        )
+        cls.mock_parser = Mock()
+        cls.processor = CustomBlockProcessor(cls.mock_parser, cls.template_manager)
 
-        # Create a mock parent element
-        self.mock_parent = Mock(spec=etree.Element)
+        # test() never touches the parent, so a plain element is enough
+        cls.parent = etree.Element("div")
 
     def test_test_method_detects_custom_blocks(self):
         """Test that the test method correctly identifies custom blocks."""
         # Test valid custom block syntax
         block = ':::tip_box color="blue"\n    Content here\n:::'
-        assert self.processor.test(self.mock_parent, block) is True
+        assert self.processor.test(self.parent, block) is True
 
         # Test with attributes
         block = ':::attention_box type="warning" important\n    Content\n:::'
-        assert self.processor.test(self.mock_parent, block) is True
+        assert self.processor.test(self.parent, block) is True
 
         # Test without attributes
         block = ":::magic_secret\n    Secret content\n:::"
-        assert self.processor.test(self.mock_parent, block) is True
+        assert self.processor.test(self.parent, block) is True
 
     def test_test_method_rejects_non_custom_blocks(self):
         """Test that the test method rejects non-custom block syntax."""
         # Regular markdown
         block = "This is just regular text"
-        assert self.processor.test(self.mock_parent, block) is False
+        assert self.processor.test(self.parent, block) is False
 
         # Code blocks
         block = "```python\ncode here\n```"
-        assert self.processor.test(self.mock_parent, block) is False
+        assert self.processor.test(self.parent, block) is False
 
         # Invalid syntax (not enough colons)
         block = "::tip_box\n    Content\n::"
-        assert self.processor.test(self.mock_parent, block) is False
+        assert self.processor.test(self.parent, block) is False
 
         # Empty block
         block = ""
-        assert self.processor.test(self.mock_parent, block) is False
+        assert self.processor.test(self.parent, block) is False
 
     def test_parse_attributes_with_quoted_values(self):
         """Test parsing attributes with quoted values."""
@@ -167,30 +184,32 @@ class TestCustomBlockExtension:
 
     def test_extension_with_template_manager(self):
         """Test extension initialization with a template manager."""
-        mock_template_manager = Mock(spec=TemplateManager)
-        extension = CustomBlockExtension(template_manager=mock_template_manager)
+        template_manager = FakeTemplateManager()
+        extension = CustomBlockExtension(template_manager=template_manager)
 
         # The template manager should be stored as instance variable
-        assert extension.template_manager == mock_template_manager
+        assert extension.template_manager is template_manager
 
 
 class TestCustomBlocksIntegration:
     """Integration tests for custom blocks with markdown processing."""
 
+    @classmethod
+    def setup_class(cls):
+        """Build one Markdown instance shared by the tests in this class."""
+        cls.template_manager = FakeTemplateManager()
+        cls.md = markdown.Markdown(
+            extensions=[CustomBlockExtension(cls.template_manager)]
+        )
+
     def setup_method(self):
-        """Set up test fixtures for integration tests."""
-        self.mock_template_manager = Mock(spec=TemplateManager)
-        self.mock_template_manager.is_component_registered.return_value = True
+        """Reset the shared Markdown instance and fake template manager."""
+        self.template_manager.reset()
+        self.md.reset()
 
     def test_basic_custom_block_conversion(self):
         """Test basic custom block conversion to HTML."""
-        self.mock_template_manager.render_component.return_value = (
-            '<div class="tip-box">Rendered content</div>'
-        )
-
-        md = markdown.Markdown(
-            extensions=[CustomBlockExtension(self.mock_template_manager)]
-        )
+        self.template_manager.rendered = '<div class="tip-box">Rendered content</div>'
 
         markdown_text = """
 # Title
@@ -202,11 +221,11 @@ class TestCustomBlocksIntegration:
 Regular paragraph.
 """
 
-        html = md.convert(markdown_text)
+        html = self.md.convert(markdown_text)
 
         # Check that template manager was called
-        self.mock_template_manager.render_component.assert_called_once()
-        call_args = self.mock_template_manager.render_component.call_args[0]
+        assert len(self.template_manager.calls) == 1
+        call_args = self.template_manager.calls[0]
 
         assert call_args[0] == "tip_box"  # component name
         assert call_args[1]["color"] == "blue"  # attributes
@@ -223,11 +242,7 @@ Regular paragraph.
         def mock_render(component_name, attributes, content):
             return f'<div class="{component_name}">Mock {component_name}</div>'
 
-        self.mock_template_manager.render_component.side_effect = mock_render
-
-        md = markdown.Markdown(
-            extensions=[CustomBlockExtension(self.mock_template_manager)]
-        )
+        self.template_manager.rendered = mock_render
 
         markdown_text = """
 :::tip_box
@@ -243,10 +258,10 @@ Regular paragraph.
 :::
 """
 
-        html = md.convert(markdown_text)
+        html = self.md.convert(markdown_text)
 
         # Check that all components were rendered
-        assert self.mock_template_manager.render_component.call_count == 3
+        assert len(self.template_manager.calls) == 3
         assert '<div class="tip_box">Mock tip_box</div>' in html
         assert '<div class="attention_box">Mock attention_box</div>' in html
         assert '<div class="magic_secret">Mock magic_secret</div>' in html
@@ -257,11 +272,7 @@ Regular paragraph.
         def mock_render(component_name, attributes, content):
             return f'<div class="{component_name}">{content}</div>'
 
-        self.mock_template_manager.render_component.side_effect = mock_render
-
-        md = markdown.Markdown(
-            extensions=[CustomBlockExtension(self.mock_template_manager)]
-        )
+        self.template_manager.rendered = mock_render
 
         markdown_text = """
 :::tip_box
@@ -271,10 +282,10 @@ Regular paragraph.
 :::
 """
 
-        html = md.convert(markdown_text)
+        html = self.md.convert(markdown_text)
 
         # Check that markdown within the block was NOT processed (raw content)
-        call_args = self.mock_template_manager.render_component.call_args[0]
+        call_args = self.template_manager.calls[-1]
         content = call_args[2]
 
         assert "**bold**" in content  # Raw markdown, not processed
@@ -283,11 +294,7 @@ Regular paragraph.
 
     def test_unregistered_component_fallback(self):
         """Test fallback behavior for unregistered components."""
-        self.mock_template_manager.is_component_registered.return_value = False
-
-        md = markdown.Markdown(
-            extensions=[CustomBlockExtension(self.mock_template_manager)]
-        )
+        self.template_manager.registered = False
 
         markdown_text = """
 :::unknown_component color="red"
@@ -295,7 +302,7 @@ Regular paragraph.
 :::
 """
 
-        html = md.convert(markdown_text)
+        html = self.md.convert(markdown_text)
 
         # Should create a fallback div
         assert 'class="custom-block unknown_component"' in html
@@ -304,13 +311,7 @@ Regular paragraph.
 
     def test_block_with_closing_fence(self):
         """Test custom blocks with explicit closing fence."""
-        self.mock_template_manager.render_component.return_value = (
-            "<div>Mock content</div>"
-        )
-
-        md = markdown.Markdown(
-            extensions=[CustomBlockExtension(self.mock_template_manager)]
-        )
+        self.template_manager.rendered = "<div>Mock content</div>"
 
         markdown_text = """
 :::tip_box
@@ -322,10 +323,10 @@ Regular paragraph.
 This is outside the block.
 """
 
-        html = md.convert(markdown_text)
+        html = self.md.convert(markdown_text)
 
         # Check content was properly separated
-        call_args = self.mock_template_manager.render_component.call_args[0]
+        call_args = self.template_manager.calls[-1]
         content = call_args[2]
 
         assert "Content inside block." in content
@@ -360,11 +361,10 @@ Regular paragraph after.
 
 
 @pytest.fixture
-def mock_template_manager():
-    """Mock template manager for testing."""
-    manager = Mock(spec=TemplateManager)
-    manager.is_component_registered.return_value = True
-    manager.render_component.return_value = "<div>Mock rendered content</div>"
+def fake_template_manager():
+    """Fake template manager for testing."""
+    manager = FakeTemplateManager()
+    manager.rendered = "<div>Mock rendered content</div>"
     return manager
 
 
@@ -376,6 +376,6 @@ def test_make_extension_function():
     assert isinstance(ext, CustomBlockExtension)
 
     # Test with template manager
-    mock_tm = Mock()
-    ext = makeExtension(template_manager=mock_tm)
-    assert ext.template_manager == mock_tm
+    template_manager = FakeTemplateManager()
+    ext = makeExtension(template_manager=template_manager)
+    assert ext.template_manager is template_manager
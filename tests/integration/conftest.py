@@ -0,0 +1,33 @@
+"""Fixtures shared by the integration tests."""
+
+import pytest
+
+from md_to_pdf.core import MarkdownToPDFConverter, PDFGenerator
+
+CUSTOM_TEMPLATE = """
+<div class="my-custom-component {{ css_classes }}">
+    <h3>{{ title | default('Custom Component') }}</h3>
+    <div class="content">{{ content }}</div>
+    <p>Style: {{ style | default('default') }}</p>
+</div>
+"""
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """Default converter, built once for the whole test session."""
+    return MarkdownToPDFConverter.shared()
+
+
+@pytest.fixture(scope="session")
+def pdf_generator_without_component_css():
+    """PDF generator with component CSS disabled, built once per session."""
+    return PDFGenerator(include_component_css=False)
+
+
+@pytest.fixture(scope="session")
+def custom_template_dir(tmp_path_factory):
+    """Template directory holding a custom my_component template."""
+    template_dir = tmp_path_factory.mktemp("templates")
+    (template_dir / "my_component.html").write_text(CUSTOM_TEMPLATE)
+    return template_dir
@@ -3,15 +3,20 @@
 Test CSS integration with the templating system.
 """
 
+import os
+import sys
 from pathlib import Path
 
-from src.md_to_pdf.core import MarkdownToPDFConverter
+import pytest
 
+from md_to_pdf.core import PDFGenerator
+
+# Set to "1" to save the generated HTML document as test_css_output.html
+DUMP_HTML_ENV_VAR = "MD_TO_PDF_DUMP_HTML"
 
-def test_css_integration():
-    """Test that CSS is properly integrated into generated HTML."""
 
-    converter = MarkdownToPDFConverter()
+def test_css_integration(converter):
+    """Test that CSS is properly integrated into generated HTML."""
 
     # Test markdown with various components
     markdown_content = """
@@ -58,20 +63,19 @@ This should have fallback dashed border styling.
     print("✅ CSS integration test passed!")
     print(f"📏 Full HTML document size: {len(full_html)} characters")
 
-    # Save for manual inspection
-    test_output = Path("test_css_output.html")
-    with open(test_output, "w", encoding="utf-8") as f:
-        f.write(full_html)
+    # Save for manual inspection when requested
+    if os.environ.get(DUMP_HTML_ENV_VAR) == "1":
+        test_output = Path("test_css_output.html")
+        with open(test_output, "w", encoding="utf-8") as f:
+            f.write(full_html)
 
-    print(f"🔗 Test output saved to: {test_output.absolute()}")
+        print(f"🔗 Test output saved to: {test_output.absolute()}")
     return True
 
 
-def test_css_loading():
+def test_css_loading(converter):
     """Test that component CSS file is loaded correctly."""
 
-    converter = MarkdownToPDFConverter()
-
     # Get component CSS
     component_css = converter.pdf_generator._get_component_css()
 
@@ -82,24 +86,26 @@ def test_css_loading():
     assert ".magic-secret" in component_css
     assert ".attention-box" in component_css
 
+    # The file is read once per process and shared by every generator
+    assert converter.pdf_generator._get_component_css() is component_css
+    assert PDFGenerator()._get_component_css() is component_css
+
     print("✅ CSS loading test passed!")
     print(f"📏 Component CSS size: {len(component_css)} characters")
     return True
 
 
-def test_pdf_generator_options():
+def test_pdf_generator_options(converter, pdf_generator_without_component_css):
     """Test PDF generator CSS options."""
 
     # Test with component CSS enabled (default)
-    converter = MarkdownToPDFConverter()
     html_with_css = converter.pdf_generator._create_html_document("<p>Test</p>", "Test")
     assert ".custom-block" in html_with_css
 
     # Test with component CSS disabled
-    from src.md_to_pdf.core import PDFGenerator
-
-    pdf_gen_no_css = PDFGenerator(include_component_css=False)
-    html_without_css = pdf_gen_no_css._create_html_document("<p>Test</p>", "Test")
+    html_without_css = pdf_generator_without_component_css._create_html_document(
+        "<p>Test</p>", "Test"
+    )
     assert ".custom-block" not in html_without_css
 
     print("✅ PDF generator options test passed!")
@@ -107,7 +113,4 @@ def test_pdf_generator_options():
 
 
 if __name__ == "__main__":
-    test_css_loading()
-    test_css_integration()
-    test_pdf_generator_options()
-    print("\n🎉 All CSS integration tests passed!")
+    sys.exit(pytest.main([__file__, "-v"]))
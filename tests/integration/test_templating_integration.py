@@ -5,18 +5,16 @@ Tests the complete pipeline from markdown with custom blocks to HTML output
 using the templating system.
 """
 
-import tempfile
-from pathlib import Path
+import sys
 
-from src.md_to_pdf.core import MarkdownToPDFConverter
-from src.md_to_pdf.templating import TemplateManager
+import pytest
 
+from md_to_pdf.core import MarkdownToPDFConverter
+from md_to_pdf.templating import TemplateManager
 
-def test_custom_block_with_template_integration():
-    """Test that custom blocks are rendered using templates when available."""
 
-    # Initialize converter with template manager
-    converter = MarkdownToPDFConverter()
+def test_custom_block_with_template_integration(converter):
+    """Test that custom blocks are rendered using templates when available."""
 
     # Test markdown with a tip_box component (should have template)
     markdown_content = """
@@ -46,12 +44,9 @@ Another regular paragraph.
     print(f"Generated HTML: {html_output}")
 
 
-def test_custom_block_fallback_for_missing_template():
+def test_custom_block_fallback_for_missing_template(converter):
     """Test that custom blocks fall back to simple div when template not available."""
 
-    # Initialize converter with template manager
-    converter = MarkdownToPDFConverter()
-
     # Test markdown with a component that doesn't have a template
     markdown_content = """
 # Test Document
@@ -76,52 +71,36 @@ This component should fall back to a simple div.
     print(f"Generated HTML: {html_output}")
 
 
-def test_end_to_end_with_custom_template_directory():
+def test_end_to_end_with_custom_template_directory(custom_template_dir):
     """Test end-to-end with custom template directory."""
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create a custom template
-        template_content = """
-<div class="my-custom-component {{ css_classes }}">
-    <h3>{{ title | default('Custom Component') }}</h3>
-    <div class="content">{{ content }}</div>
-    <p>Style: {{ style | default('default') }}</p>
-</div>
-"""
-        template_file = temp_path / "my_component.html"
-        template_file.write_text(template_content)
-
-        # Initialize converter with custom template directory
-        converter = MarkdownToPDFConverter(template_dirs=[str(temp_path)])
+    # Initialize converter with custom template directory
+    converter = MarkdownToPDFConverter(template_dirs=[str(custom_template_dir)])
 
-        # Test markdown with the custom component
-        markdown_content = """
+    # Test markdown with the custom component
+    markdown_content = """
 :::my_component title="Test Title" style="fancy"
 This is the component content.
 :::
 """
 
-        # Convert to HTML
-        html_output = converter.markdown_processor.convert(markdown_content)
+    # Convert to HTML
+    html_output = converter.markdown_processor.convert(markdown_content)
 
-        # Check that custom template was used
-        assert "my-custom-component" in html_output
-        assert "Test Title" in html_output
-        assert "This is the component content" in html_output
-        assert "Style: fancy" in html_output
-        assert "template-wrapper" in html_output
+    # Check that custom template was used
+    assert "my-custom-component" in html_output
+    assert "Test Title" in html_output
+    assert "This is the component content" in html_output
+    assert "Style: fancy" in html_output
+    assert "template-wrapper" in html_output
 
-        print("✅ End-to-end custom template test passed")
-        print(f"Generated HTML: {html_output}")
+    print("✅ End-to-end custom template test passed")
+    print(f"Generated HTML: {html_output}")
 
 
-def test_core_converter_template_manager_property():
+def test_core_converter_template_manager_property(converter):
     """Test that the converter properly exposes the template manager."""
 
-    converter = MarkdownToPDFConverter()
-
     # Should have template manager
     assert converter.template_manager is not None
     assert isinstance(converter.template_manager, TemplateManager)
@@ -138,8 +117,4 @@ def test_core_converter_template_manager_property():
 
 
 if __name__ == "__main__":
-    test_custom_block_with_template_integration()
-    test_custom_block_fallback_for_missing_template()
-    test_end_to_end_with_custom_template_directory()
-    test_core_converter_template_manager_property()
-    print("\n🎉 All integration tests passed!")
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,21 @@
+"""Pytest configuration for the dependency checks."""
+
+from pathlib import Path
+
+import pytest
+
+# Checks that render a real PDF with WeasyPrint; run them with `pytest -m slow`
+SLOW_CHECKS = frozenset(
+    ["test_weasyprint_pdf_generation", "test_weasyprint_windows_fix"]
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark the PDF rendering checks as slow.
+
+    test_dependencies.py is also run directly as a script, so it cannot
+    import pytest to decorate the checks itself.
+    """
+    for item in items:
+        if item.name in SLOW_CHECKS and item.path.parent == Path(__file__).parent:
+            item.add_marker(pytest.mark.slow)
@@ -41,36 +41,50 @@ def test_jinja2():
 
 
 def test_weasyprint():
-    """Test WeasyPrint installation and basic HTML to PDF conversion."""
+    """Test WeasyPrint installation and basic HTML parsing."""
     print("\nTesting WeasyPrint...")
     try:
         import weasyprint
 
         print("✅ WeasyPrint imported successfully")
 
-        # Test basic HTML to PDF (without actually creating a file)
+        # Test basic HTML parsing (without rendering a PDF)
         html_content = "<html><body><h1>Test</h1></body></html>"
-        doc = weasyprint.HTML(string=html_content)
+        weasyprint.HTML(string=html_content)
         print("✅ Basic HTML parsing works")
+        return True
+    except Exception as e:
+        print(f"❌ WeasyPrint test failed: {e}")
+        return False
 
-        # Try to render to bytes (memory) to test PDF generation
-        # This might fail on Windows due to missing system dependencies
-        try:
-            pdf_bytes = doc.write_pdf()
-            assert len(pdf_bytes) > 0, "PDF generation failed - no content"
-            print(f"✅ PDF generation works (generated {len(pdf_bytes)} bytes)")
-        except Exception as pdf_error:
-            print(
-                f"⚠️ PDF generation failed (likely missing system dependencies): {pdf_error}"
-            )
-            print("ℹ️ This is expected on Windows without GTK+ libraries")
-            print("ℹ️ WeasyPrint import works, so we can proceed with development")
 
-        return True
+def test_weasyprint_pdf_generation():
+    """Test WeasyPrint can render a PDF (slow, opt-in under pytest)."""
+    print("\nTesting WeasyPrint PDF generation...")
+    try:
+        import weasyprint
+
+        html_content = "<html><body><h1>Test</h1></body></html>"
+        doc = weasyprint.HTML(string=html_content)
     except Exception as e:
         print(f"❌ WeasyPrint test failed: {e}")
         return False
 
+    # Try to render to bytes (memory) to test PDF generation
+    # This might fail on Windows due to missing system dependencies
+    try:
+        pdf_bytes = doc.write_pdf()
+        assert len(pdf_bytes) > 0, "PDF generation failed - no content"
+        print(f"✅ PDF generation works (generated {len(pdf_bytes)} bytes)")
+    except Exception as pdf_error:
+        print(
+            f"⚠️ PDF generation failed (likely missing system dependencies): {pdf_error}"
+        )
+        print("ℹ️ This is expected on Windows without GTK+ libraries")
+        print("ℹ️ WeasyPrint import works, so we can proceed with development")
+
+    return True
+
 
 def test_pyyaml():
     """Test PyYAML installation and basic parsing."""
@@ -184,6 +198,7 @@ def main():
         test_markdown,
         test_jinja2,
         test_weasyprint,
+        test_weasyprint_pdf_generation,
         test_pyyaml,
         test_click,
         test_weasyprint_windows_fix,  # Add Windows-specific test
@@ -0,0 +1,11 @@
+"""Fixtures shared by the templating tests."""
+
+import pytest
+
+from md_to_pdf.templating import TemplateManager
+
+
+@pytest.fixture(scope="session")
+def tm():
+    """Default template manager, built once for the whole test session."""
+    return TemplateManager()
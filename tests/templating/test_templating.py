@@ -2,15 +2,15 @@
 Test the templating system for custom components.
 """
 
+import sys
+
 import pytest
 
-from src.md_to_pdf.templating import TemplateManager
+from md_to_pdf.templating import TemplateManager
 
 
-def test_template_manager_initialization():
+def test_template_manager_initialization(tm):
     """Test that TemplateManager initializes correctly."""
-    tm = TemplateManager()
-
     # Should have discovered the templates we created
     registered_components = tm.get_registered_components()
     assert "tip_box" in registered_components
@@ -24,10 +24,8 @@ def test_template_manager_initialization():
     assert not tm.is_component_registered("nonexistent_component")
 
 
-def test_context_building():
+def test_context_building(tm):
     """Test that template context is built correctly."""
-    tm = TemplateManager()
-
     attributes = {"color": "blue", "title": "Test Title", "important": True}
     content = "This is test content"
 
@@ -54,77 +52,73 @@ def test_context_building():
     assert "data-important" in context["data_attributes"]
 
 
-def test_tip_box_rendering():
-    """Test rendering a tip_box component."""
-    tm = TemplateManager()
-
-    attributes = {"color": "blue", "title": "Pro Tip"}
-    content = "This is a helpful tip!"
-
-    html = tm.render_component("tip_box", attributes, content)
-
-    # Check that the HTML contains expected elements
-    assert 'class="custom-block tip-box color-blue"' in html
-    assert 'data-color="blue"' in html
-    assert 'data-title="Pro Tip"' in html
-    assert "<strong>Pro Tip</strong>" in html
-    assert "This is a helpful tip!" in html
-    assert "tip-box-header" in html
-    assert "tip-box-content" in html
-
-
-def test_magic_secret_rendering():
-    """Test rendering a magic_secret component."""
-    tm = TemplateManager()
-
-    attributes = {"level": "high", "title": "Hidden Knowledge"}
-    content = "The secret is revealed!"
-
-    html = tm.render_component("magic_secret", attributes, content)
-
-    # Check that the HTML contains expected elements
-    assert 'class="custom-block magic-secret' in html
-    assert 'data-level="high"' in html
-    assert 'data-title="Hidden Knowledge"' in html
-    assert "<strong>Hidden Knowledge</strong>" in html
-    assert "The secret is revealed!" in html
-    assert "✨" in html  # Magic icons
-    assert "magic-secret-header" in html
-    assert "magic-secret-content" in html
-
-
-def test_attention_box_rendering():
-    """Test rendering an attention_box component."""
-    tm = TemplateManager()
-
-    attributes = {"type": "warning", "title": "Important Notice"}
-    content = "Please pay attention to this!"
-
-    html = tm.render_component("attention_box", attributes, content)
-
-    # Check that the HTML contains expected elements
-    assert 'class="custom-block attention-box' in html
-    assert 'data-type="warning"' in html
-    assert 'data-title="Important Notice"' in html
-    assert "<strong>Important Notice</strong>" in html
-    assert "Please pay attention to this!" in html
-    assert "⚠️" in html  # Warning icon
-    assert "attention-box-header" in html
-    assert "attention-box-content" in html
-
-
-def test_unregistered_component():
+@pytest.mark.parametrize(
+    "component,attributes,content,expected",
+    [
+        (
+            "tip_box",
+            {"color": "blue", "title": "Pro Tip"},
+            "This is a helpful tip!",
+            [
+                'class="custom-block tip-box color-blue"',
+                'data-color="blue"',
+                'data-title="Pro Tip"',
+                "<strong>Pro Tip</strong>",
+                "This is a helpful tip!",
+                "tip-box-header",
+                "tip-box-content",
+            ],
+        ),
+        (
+            "magic_secret",
+            {"level": "high", "title": "Hidden Knowledge"},
+            "The secret is revealed!",
+            [
+                'class="custom-block magic-secret',
+                'data-level="high"',
+                'data-title="Hidden Knowledge"',
+                "<strong>Hidden Knowledge</strong>",
+                "The secret is revealed!",
+                "✨",  # Magic icons
+                "magic-secret-header",
+                "magic-secret-content",
+            ],
+        ),
+        (
+            "attention_box",
+            {"type": "warning", "title": "Important Notice"},
+            "Please pay attention to this!",
+            [
+                'class="custom-block attention-box',
+                'data-type="warning"',
+                'data-title="Important Notice"',
+                "<strong>Important Notice</strong>",
+                "Please pay attention to this!",
+                "⚠️",  # Warning icon
+                "attention-box-header",
+                "attention-box-content",
+            ],
+        ),
+    ],
+    ids=["tip_box", "magic_secret", "attention_box"],
+)
+def test_component_rendering(tm, component, attributes, content, expected):
+    """Test rendering each built-in component."""
+    html = tm.render_component(component, attributes, content)
+
+    # Check that the HTML contains expected elements, reporting all missing ones
+    missing = [fragment for fragment in expected if fragment not in html]
+    assert not missing, f"Missing from rendered {component}: {missing}"
+
+
+def test_unregistered_component(tm):
     """Test that rendering an unregistered component raises an error."""
-    tm = TemplateManager()
-
     with pytest.raises(ValueError, match="Component 'nonexistent' is not registered"):
         tm.render_component("nonexistent", {}, "content")
 
 
-def test_custom_filters():
+def test_custom_filters(tm):
     """Test that custom Jinja2 filters work correctly."""
-    tm = TemplateManager()
-
     # Test css_class filter
     result = tm.render_from_string("{{ 'test_component' | css_class }}", {})
     assert result == "test-component"
@@ -138,28 +132,44 @@ def test_custom_filters():
     assert "hidden" not in result  # False values should be excluded
 
 
-def test_component_registration():
+def test_component_registration(tm):
     """Test manual component registration."""
-    tm = TemplateManager()
-
-    # Register a new component
+    # Register a new component on the shared manager, removed again afterwards
     tm.register_component("custom_test", "tip_box.html")  # Reuse existing template
+    try:
+        assert tm.is_component_registered("custom_test")
+        assert "custom_test" in tm.get_registered_components()
+
+        # Should be able to render with the new name
+        html = tm.render_component("custom_test", {"title": "Test"}, "Content")
+        assert "custom-block custom-test" in html
+    finally:
+        del tm.component_registry["custom_test"]
+
+
+def test_compiled_templates_reused(tm, tmp_path):
+    """Test templates are compiled once and not reloaded unless requested."""
+    assert not tm.env.auto_reload
+    assert tm.env.get_template("tip_box.html") is tm.env.get_template("tip_box.html")
+    assert tm._from_string("{{ x }}") is tm._from_string("{{ x }}")
+
+    assert TemplateManager([str(tmp_path)], auto_reload=True).env.auto_reload
+
+
+def test_repeated_renders_do_not_compile(tm, monkeypatch):
+    """Test warm render paths never compile a template again."""
+    template_string = "{{ title | css_class }}"
+    tm.render_component("tip_box", {"color": "blue", "title": "x"}, "c")
+    tm.render_from_string(template_string, {"title": "x"})
 
-    assert tm.is_component_registered("custom_test")
-    assert "custom_test" in tm.get_registered_components()
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("template compiled again on a warm render path")
 
-    # Should be able to render with the new name
-    html = tm.render_component("custom_test", {"title": "Test"}, "Content")
-    assert "custom-block custom-test" in html
+    monkeypatch.setattr(tm.env, "compile", fail_compile)
+    for _ in range(3):
+        tm.render_component("tip_box", {"color": "blue", "title": "x"}, "c")
+        assert tm.render_from_string(template_string, {"title": "x"}) == "x"
 
 
 if __name__ == "__main__":
-    # Run basic tests
-    test_template_manager_initialization()
-    test_context_building()
-    test_tip_box_rendering()
-    test_magic_secret_rendering()
-    test_attention_box_rendering()
-    test_custom_filters()
-    test_component_registration()
-    print("All templating tests passed!")
+    sys.exit(pytest.main([__file__, "-v"]))
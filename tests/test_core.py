@@ -1,17 +1,37 @@
 """Tests for the core MD to PDF converter functionality."""
 
+import io
+import os
+import subprocess
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from src.md_to_pdf.core import MarkdownProcessor, MarkdownToPDFConverter, PDFGenerator
+from md_to_pdf.core import (
+    STUB_PDF_ENV_VAR,
+    MarkdownProcessor,
+    MarkdownToPDFConverter,
+    PDFGenerator,
+)
 
 
-def test_markdown_processor():
-    """Test the MarkdownProcessor class."""
-    processor = MarkdownProcessor()
+@pytest.fixture(scope="module")
+def processor():
+    """MarkdownProcessor shared by the tests in this module."""
+    return MarkdownProcessor()
+
+
+@pytest.fixture(scope="module")
+def converter():
+    """Converter shared by the tests in this module."""
+    return MarkdownToPDFConverter()
+
 
+def test_markdown_processor(processor):
+    """Test the MarkdownProcessor class."""
     # Test basic conversion
     result = processor.convert("# Hello **World**")
     assert "<h1>" in result
@@ -20,57 +40,53 @@ def test_markdown_processor():
     assert "World" in result
 
 
-def test_markdown_processor_file():
+def test_markdown_processor_file(processor, tmp_path):
     """Test MarkdownProcessor with file input."""
-    processor = MarkdownProcessor()
-
-    # Create a temporary markdown file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write("# Test\n\nThis is a **test**.")
-        temp_path = Path(f.name)
+    markdown_path = tmp_path / "test.md"
+    markdown_path.write_text("# Test\n\nThis is a **test**.")
 
-    try:
-        result = processor.convert_file(temp_path)
-        assert "<h1>Test</h1>" in result
-        assert "<strong>test</strong>" in result
-    finally:
-        temp_path.unlink()  # Clean up
+    result = processor.convert_file(markdown_path)
+    assert "<h1>Test</h1>" in result
+    assert "<strong>test</strong>" in result
 
 
-def test_markdown_processor_file_not_found():
+def test_markdown_processor_file_not_found(processor):
     """Test MarkdownProcessor with non-existent file."""
-    processor = MarkdownProcessor()
-
     with pytest.raises(FileNotFoundError):
         processor.convert_file(Path("nonexistent.md"))
 
 
-def test_converter_initialization():
+def test_converter_initialization(converter):
     """Test MarkdownToPDFConverter initialization."""
-    converter = MarkdownToPDFConverter()
-
-    # Should have markdown processor
-    assert hasattr(converter, "markdown_processor")
-    assert isinstance(converter.markdown_processor, MarkdownProcessor)
+    # Should have a markdown processor and a pdf generator (a missing attribute
+    # fails with AttributeError)
+    assert type(converter.markdown_processor) is MarkdownProcessor
+    assert type(converter.pdf_generator) is PDFGenerator
 
-    # Should have pdf generator
-    assert hasattr(converter, "pdf_generator")
-    assert isinstance(converter.pdf_generator, PDFGenerator)
 
-
-def test_converter_availability():
+def test_converter_availability(converter):
     """Test converter availability check."""
-    converter = MarkdownToPDFConverter()
-
     # Should return a boolean
     available = converter.is_available()
     assert isinstance(available, bool)
 
 
-def test_converter_string_to_html():
-    """Test converting markdown string to HTML (without PDF generation)."""
-    converter = MarkdownToPDFConverter()
+def test_weasyprint_imported_lazily():
+    """Test importing the package, config and CLI never imports WeasyPrint."""
+    src_dir = Path(__file__).parent.parent / "src"
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    code = (
+        "import sys, md_to_pdf.core, md_to_pdf.config, md_to_pdf.cli; "
+        "md_to_pdf.core.MarkdownToPDFConverter(); "
+        "sys.exit('weasyprint' in sys.modules)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], env=env)
+    assert result.returncode == 0
 
+
+def test_converter_string_to_html(converter):
+    """Test converting markdown string to HTML (without PDF generation)."""
     markdown_content = """
 # Test Document
 
@@ -85,3 +101,61 @@ This is a **test** document.
     assert "<strong>test</strong>" in html_result
     assert "<ul>" in html_result
     assert "<li>Item 1</li>" in html_result
+
+
+def test_converter_shared_instances():
+    """Test converters are shared per settings while referenced."""
+    converter = MarkdownToPDFConverter.shared()
+    assert MarkdownToPDFConverter.shared() is converter
+    assert MarkdownToPDFConverter.shared(extensions=["toc"]) is not converter
+
+
+def test_stubbed_pdf_rendering(monkeypatch):
+    """Test the test-only stub skips WeasyPrint but still writes a PDF."""
+    monkeypatch.setenv(STUB_PDF_ENV_VAR, "1")
+    generator = PDFGenerator()
+
+    assert generator.generate_pdf_bytes("<p>Hello</p>").startswith(b"%PDF")
+
+
+def test_stubbed_pdf_written_atomically(monkeypatch):
+    """Test generate_pdf replaces the target and leaves no temporary file."""
+    monkeypatch.setenv(STUB_PDF_ENV_VAR, "1")
+    generator = PDFGenerator()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "out.pdf"
+        output_path.write_bytes(b"stale")
+
+        generator.generate_pdf("<p>Hello</p>", output_path)
+
+        assert output_path.read_bytes().startswith(b"%PDF")
+        assert [path.name for path in Path(temp_dir).iterdir()] == ["out.pdf"]
+
+
+def test_stubbed_pdf_written_concurrently(tmp_path, monkeypatch):
+    """Test threads rendering the same output path don't share a temp file."""
+    monkeypatch.setenv(STUB_PDF_ENV_VAR, "1")
+    generator = PDFGenerator()
+    output_path = tmp_path / "out.pdf"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(generator.generate_pdf, "<p>Hello</p>", output_path)
+            for _ in range(32)
+        ]
+        for future in futures:
+            future.result()
+
+    assert output_path.read_bytes().startswith(b"%PDF")
+    assert [path.name for path in tmp_path.iterdir()] == ["out.pdf"]
+
+
+def test_stubbed_pdf_written_to_stream(converter, monkeypatch):
+    """Test convert_string writes into a binary stream without touching disk."""
+    monkeypatch.setenv(STUB_PDF_ENV_VAR, "1")
+    buffer = io.BytesIO()
+
+    converter.convert_string("# Hello", buffer, "Stream Test")
+
+    assert buffer.getvalue().startswith(b"%PDF")
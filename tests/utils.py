@@ -0,0 +1,49 @@
+"""Helpers shared by the script-style test modules."""
+
+import io
+import os
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+
+def file_size_or_none(path: Union[str, Path]) -> Optional[int]:
+    """Size of a file in bytes, or None if it does not exist.
+
+    Uses a single stat call instead of exists() followed by stat().
+
+    Args:
+        path: File to check
+
+    Returns:
+        File size in bytes, or None if the file is missing
+    """
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def run_captured(
+    test_func: Callable[[], bool], crash_marker: str = "❌"
+) -> Tuple[bool, str]:
+    """Run one test function, capturing its output for in-order printing.
+
+    Used by scripts that run their tests in a process pool, so each test's
+    output can be printed as one block once it finishes.
+
+    Args:
+        test_func: Test returning True or None on success, or raising
+        crash_marker: Prefix for the message printed when the test raises
+
+    Returns:
+        Whether the test passed, and everything it printed
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            result = test_func() is not False
+        except Exception as e:
+            print(f"{crash_marker} {test_func.__name__} crashed: {e}")
+            result = False
+    return result, output.getvalue()